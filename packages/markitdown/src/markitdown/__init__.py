@@ -10,12 +10,14 @@ from ._markitdown import (
 )
 from ._base_converter import DocumentConverterResult, DocumentConverter
 from ._stream_info import StreamInfo
+from ._metrics import ConversionMetrics, StageTiming
 from ._exceptions import (
     MarkItDownException,
     MissingDependencyException,
     FailedConversionAttempt,
     FileConversionException,
     UnsupportedFormatException,
+    ArchiveLimitExceededException,
 )
 
 __all__ = [
@@ -28,7 +30,10 @@ __all__ = [
     "FailedConversionAttempt",
     "FileConversionException",
     "UnsupportedFormatException",
+    "ArchiveLimitExceededException",
     "StreamInfo",
+    "ConversionMetrics",
+    "StageTiming",
     "PRIORITY_SPECIFIC_FILE_FORMAT",
     "PRIORITY_GENERIC_FILE_FORMAT",
 ]
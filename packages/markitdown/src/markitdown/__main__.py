@@ -2,12 +2,17 @@
 #
 # SPDX-License-Identifier: MIT
 import argparse
+import io
+import os
 import sys
 import codecs
+import tempfile
+from contextlib import contextmanager
 from textwrap import dedent
+from typing import Iterator, TextIO
 from importlib.metadata import entry_points
 from .__about__ import __version__
-from ._markitdown import MarkItDown, StreamInfo, DocumentConverterResult
+from ._markitdown import MarkItDown, StreamInfo
 
 
 def main():
@@ -186,32 +191,70 @@ def main():
     else:
         markitdown = MarkItDown(enable_plugins=args.use_plugins)
 
-    if args.filename is None:
-        result = markitdown.convert_stream(
-            sys.stdin.buffer,
-            stream_info=stream_info,
-            keep_data_uris=args.keep_data_uris,
-        )
-    else:
-        result = markitdown.convert(
-            args.filename, stream_info=stream_info, keep_data_uris=args.keep_data_uris
-        )
+    with _open_output(args) as output_stream:
+        # The Markdown is written to the output as it is produced, where possible
+        if args.filename is None:
+            markitdown.convert_stream(
+                sys.stdin.buffer,
+                stream_info=stream_info,
+                keep_data_uris=args.keep_data_uris,
+                output_stream=output_stream,
+            )
+        else:
+            markitdown.convert(
+                args.filename,
+                stream_info=stream_info,
+                keep_data_uris=args.keep_data_uris,
+                output_stream=output_stream,
+            )
 
-    _handle_output(args, result)
+        if not args.output:
+            output_stream.write("\n")
 
 
-def _handle_output(args, result: DocumentConverterResult):
-    """Handle output to stdout or file"""
+@contextmanager
+def _open_output(args) -> Iterator[TextIO]:
+    """Open the output file, or stdout"""
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(result.markdown)
+        # Write to a temporary file alongside the output, and only replace the
+        # output once the conversion succeeds, so a failure leaves it untouched
+        output_dir = os.path.dirname(os.path.abspath(args.output))
+        fd, temp_path = tempfile.mkstemp(
+            dir=output_dir, prefix=".markitdown-", suffix=".tmp"
+        )
+        try:
+            with open(fd, "w", encoding="utf-8") as f:
+                yield f
+            _copy_output_mode(args.output, temp_path)
+            os.replace(temp_path, args.output)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
     else:
         # Handle stdout encoding errors more gracefully
-        print(
-            result.markdown.encode(sys.stdout.encoding, errors="replace").decode(
-                sys.stdout.encoding
-            )
+        sys.stdout.flush()
+        stdout = io.TextIOWrapper(
+            sys.stdout.buffer, encoding=sys.stdout.encoding, errors="replace"
         )
+        try:
+            yield stdout
+        finally:
+            stdout.flush()
+            stdout.detach()  # Leave sys.stdout open
+
+
+def _copy_output_mode(output_path: str, temp_path: str) -> None:
+    """
+    Give the temporary file the permissions of the output it replaces, or those
+    open() would have created it with (mkstemp's are owner-only).
+    """
+    try:
+        mode = os.stat(output_path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    os.chmod(temp_path, mode)
 
 
 def _exit_with_error(message: str):
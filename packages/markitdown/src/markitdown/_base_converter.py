@@ -1,5 +1,6 @@
 from typing import Any, BinaryIO, Optional
 from ._stream_info import StreamInfo
+from ._metrics import ConversionMetrics
 
 
 class DocumentConverterResult:
@@ -24,6 +25,9 @@ class DocumentConverterResult:
         self.markdown = markdown
         self.title = title
 
+        # Set by MarkItDown, if metrics are requested (see collect_metrics)
+        self.metrics: Optional[ConversionMetrics] = None
+
     @property
     def text_content(self) -> str:
         """Soft-deprecated alias for `markdown`. New code should migrate to using `markdown` or __str__."""
@@ -39,6 +39,27 @@ class UnsupportedFormatException(MarkItDownException):
     pass
 
 
+class ArchiveLimitExceededException(MarkItDownException):
+    """
+    Thrown when an archive (e.g., a ZIP file) exceeds one of the configured
+    resource limits, such as its total expanded size, number of members,
+    nesting depth, or compression ratio. Limits are checked before the
+    offending content is decompressed, so that conversion aborts early.
+
+    The `limit` attribute names the limit that was hit (matching the
+    ZipConverter argument, e.g., "max_expanded_bytes"), while `value` and
+    `maximum` hold the offending value and the configured maximum.
+    """
+
+    def __init__(self, limit: str, value: Any, maximum: Any):
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+        super().__init__(
+            f"Archive exceeds the {limit} limit ({value} > {maximum}). Conversion was aborted."
+        )
+
+
 class FailedConversionAttempt(object):
     """
     Represents an a single attempt to convert a file.
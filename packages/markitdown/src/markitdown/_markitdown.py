@@ -3,11 +3,25 @@ import os
 import re
 import sys
 import shutil
+import tempfile
 import traceback
 import io
+import time
+import asyncio
+import contextlib
 from dataclasses import dataclass
 from importlib.metadata import entry_points
-from typing import Any, List, Dict, Optional, Union, BinaryIO
+from typing import (
+    Any,
+    List,
+    Dict,
+    Iterator,
+    Optional,
+    Sequence,
+    Union,
+    BinaryIO,
+    TextIO,
+)
 from pathlib import Path
 from urllib.parse import urlparse
 from warnings import warn
@@ -15,9 +29,22 @@ import requests
 import magika
 import charset_normalizer
 import codecs
+from magika.types import MagikaResult
 
 from ._stream_info import StreamInfo
 from ._uri_utils import parse_data_uri, file_uri_to_path
+from ._metrics import (
+    STAGE_ACCEPTS,
+    STAGE_BUFFER,
+    STAGE_CONVERT,
+    STAGE_IDENTIFY,
+    STAGE_NORMALIZE,
+    StageTiming,
+    _MetricsRecorder,
+    _TimedLlmClient,
+    start_metrics,
+    timed,
+)
 
 from .converters import (
     PlainTextConverter,
@@ -44,6 +71,7 @@ from .converters import (
 from ._base_converter import DocumentConverter, DocumentConverterResult
 
 from ._exceptions import (
+    MarkItDownException,
     FileConversionException,
     UnsupportedFormatException,
     FailedConversionAttempt,
@@ -58,6 +86,29 @@ PRIORITY_GENERIC_FILE_FORMAT = (
     10.0  # Near catch-all converters for mimetypes like text/*, etc.
 )
 
+# Mimetypes for extensions handled by built-in converters, but which are
+# missing from the mimetypes module's tables on many platforms.
+_EXTRA_EXTENSION_MIMETYPES = {
+    ".ipynb": "application/x-ipynb+json",
+    ".jsonl": "application/jsonl",
+    ".msg": "application/vnd.ms-outlook",
+}
+
+# Mimetypes that are textual, despite not starting with "text/"
+_TEXT_MIMETYPES = [
+    "application/json",
+    "application/jsonl",
+    "application/xml",
+    "application/javascript",
+    "application/x-ipynb+json",
+]
+
+# Maximum number of sources identified together by convert_many
+MAGIKA_BATCH_SIZE = 32
+
+# Streams larger than this are not copied to identify them in a batch
+MAGIKA_BATCH_MAX_STREAM_SIZE = 4 * 1024 * 1024
+
 
 _plugins: Union[None, List[Any]] = None  # If None, plugins have not been loaded yet.
 
@@ -90,6 +141,51 @@ class ConverterRegistration:
     priority: float
 
 
+class _MarkdownWriter:
+    """
+    Writes Markdown through to an output stream as it is produced, applying the
+    same normalization as MarkItDown._convert (trailing whitespace is stripped
+    from each line, and runs of blank lines are collapsed) incrementally.
+    """
+
+    def __init__(self, output_stream: TextIO):
+        self._output_stream = output_stream
+        self._line = ""  # The incomplete last line
+        self._newlines = 0  # Newlines not yet written
+        self.written = False
+        self.bytes_written = 0  # Of the Markdown, encoded as UTF-8
+
+    def write(self, markdown: str) -> None:
+        if not markdown:
+            return
+        self.written = True
+        lines = (self._line + markdown).split("\n")
+        self._line = lines.pop()
+        for line in lines:
+            self._write_line(line)
+            self._newlines += 1
+
+    def close(self) -> None:
+        """Flush the last line. The output stream itself is not closed."""
+        self._write_line(self._line)
+        self._line = ""
+        self._write_newlines()
+
+    def _write_line(self, line: str) -> None:
+        line = line.rstrip()
+        if line:
+            self._write_newlines()
+            self._output_stream.write(line)
+            self.bytes_written += len(line.encode("utf-8"))
+
+    def _write_newlines(self) -> None:
+        if self._newlines > 0:
+            newlines = "\n\n" if self._newlines >= 3 else "\n" * self._newlines
+            self._output_stream.write(newlines)
+            self.bytes_written += len(newlines)
+            self._newlines = 0
+
+
 class MarkItDown:
     """(In preview) An extremely simple text-based document reader, suitable for LLM use.
     This reader will convert common file-types or webpages to Markdown."""
@@ -172,8 +268,21 @@ class MarkItDown:
             self.register_converter(
                 PlainTextConverter(), priority=PRIORITY_GENERIC_FILE_FORMAT
             )
+
+            # Resource limits for archives (e.g., zip_max_expanded_bytes=...)
+            zip_args: Dict[str, Any] = {}
+            for limit in [
+                "max_expanded_bytes",
+                "max_members",
+                "max_depth",
+                "max_compression_ratio",
+            ]:
+                if f"zip_{limit}" in kwargs:
+                    zip_args[limit] = kwargs[f"zip_{limit}"]
+
             self.register_converter(
-                ZipConverter(markitdown=self), priority=PRIORITY_GENERIC_FILE_FORMAT
+                ZipConverter(markitdown=self, **zip_args),
+                priority=PRIORITY_GENERIC_FILE_FORMAT,
             )
             self.register_converter(
                 HtmlConverter(), priority=PRIORITY_GENERIC_FILE_FORMAT
@@ -186,11 +295,13 @@ class MarkItDown:
             self.register_converter(XlsxConverter())
             self.register_converter(XlsConverter())
             self.register_converter(PptxConverter())
-            self.register_converter(AudioConverter())
+            self.register_converter(
+                AudioConverter(speech_recognizer=kwargs.get("speech_recognizer"))
+            )
             self.register_converter(ImageConverter())
             self.register_converter(IpynbConverter())
             self.register_converter(PdfConverter())
-            self.register_converter(OutlookMsgConverter())
+            self.register_converter(OutlookMsgConverter(markitdown=self))
             self.register_converter(EpubConverter())
             self.register_converter(CsvConverter())
 
@@ -212,6 +323,14 @@ class MarkItDown:
                 if docintel_version is not None:
                     docintel_args["api_version"] = docintel_version
 
+                docintel_pages = kwargs.get("docintel_pages_per_request")
+                if docintel_pages is not None:
+                    docintel_args["pages_per_request"] = docintel_pages
+
+                docintel_cache_dir = kwargs.get("docintel_cache_dir")
+                if docintel_cache_dir is not None:
+                    docintel_args["cache_dir"] = docintel_cache_dir
+
                 self.register_converter(
                     DocumentIntelligenceConverter(**docintel_args),
                 )
@@ -252,6 +371,10 @@ class MarkItDown:
             - source: can be a path (str or Path), url, or a requests.response object
             - stream_info: optional stream info to use for the conversion. If None, infer from source
             - kwargs: additional arguments to pass to the converter
+
+        Per-stage timings (see ConversionMetrics) are set on the result's metrics if
+        collect_metrics=True is given, or passed, as each stage ends, to a callback
+        given as on_stage (which receives a StageTiming).
         """
 
         # Local path or url
@@ -290,6 +413,22 @@ class MarkItDown:
                 f"Invalid source type: {type(source)}. Expected str, requests.Response, BinaryIO."
             )
 
+    async def convert_async(
+        self,
+        source: Union[str, requests.Response, Path, BinaryIO],
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        **kwargs: Any,
+    ) -> DocumentConverterResult:
+        """
+        Like convert(), but runs the conversion in a worker thread, so that
+        waiting on the network (e.g., fetching YouTube transcripts, and backing
+        off between retries) does not block the event loop.
+        """
+        return await asyncio.to_thread(
+            self.convert, source, stream_info=stream_info, **kwargs
+        )
+
     def convert_local(
         self,
         path: Union[str, Path],
@@ -321,11 +460,15 @@ class MarkItDown:
             # Deprecated -- use stream_info
             base_guess = base_guess.copy_and_update(url=url)
 
+        metrics = start_metrics(kwargs)
         with open(path, "rb") as fh:
-            guesses = self._get_stream_info_guesses(
-                file_stream=fh, base_guess=base_guess
+            with timed(metrics, STAGE_IDENTIFY):
+                guesses = self._get_stream_info_guesses(
+                    file_stream=fh, base_guess=base_guess
+                )
+            return self._convert(
+                file_stream=fh, stream_info_guesses=guesses, _metrics=metrics, **kwargs
             )
-            return self._convert(file_stream=fh, stream_info_guesses=guesses, **kwargs)
 
     def convert_stream(
         self,
@@ -334,8 +477,18 @@ class MarkItDown:
         stream_info: Optional[StreamInfo] = None,
         file_extension: Optional[str] = None,  # Deprecated -- use stream_info
         url: Optional[str] = None,  # Deprecated -- use stream_info
+        trust_extension: bool = False,
         **kwargs: Any,
     ) -> DocumentConverterResult:
+        """
+        Convert a binary stream to Markdown.
+
+        If trust_extension is True, and the stream_info extension maps
+        unambiguously to a mimetype, content sniffing (via magika) is skipped
+        and the extension is taken at face value. This is intended for nested
+        conversions (e.g., archive members), where the extension comes from a
+        trusted container and sniffing every member dominates the runtime.
+        """
         guesses: List[StreamInfo] = []
 
         # Do we have anything on which to base a guess?
@@ -358,21 +511,87 @@ class MarkItDown:
                 base_guess = base_guess.copy_and_update(url=url)
 
         # Check if we have a seekable stream. If not, load the entire stream into memory.
-        if not stream.seekable():
-            buffer = io.BytesIO()
-            while True:
-                chunk = stream.read(4096)
-                if not chunk:
-                    break
-                buffer.write(chunk)
-            buffer.seek(0)
-            stream = buffer
+        metrics = start_metrics(kwargs)
+        with timed(metrics, STAGE_BUFFER):
+            stream = self._make_seekable(stream)
 
         # Add guesses based on stream content
-        guesses = self._get_stream_info_guesses(
-            file_stream=stream, base_guess=base_guess or StreamInfo()
+        with timed(metrics, STAGE_IDENTIFY):
+            guesses = self._get_stream_info_guesses(
+                file_stream=stream,
+                base_guess=base_guess or StreamInfo(),
+                trust_extension=trust_extension,
+            )
+        return self._convert(
+            file_stream=stream, stream_info_guesses=guesses, _metrics=metrics, **kwargs
         )
-        return self._convert(file_stream=stream, stream_info_guesses=guesses, **kwargs)
+
+    def convert_many(
+        self,
+        sources: Sequence[Union[str, Path, BinaryIO]],
+        *,
+        stream_infos: Optional[Sequence[Optional[StreamInfo]]] = None,
+        trust_extension: bool = False,
+        **kwargs: Any,
+    ) -> List[DocumentConverterResult]:
+        """
+        Convert several local files or binary streams, returning the results in the same order.
+
+        The content of the sources is identified in batches, which is much
+        cheaper per source than identifying each one separately. At most
+        MAGIKA_BATCH_SIZE files are open at once. The first conversion error
+        is raised, as in convert().
+
+        Args:
+            - sources: local paths (str or Path) or binary streams
+            - stream_infos: optional stream info for each source, or None to infer it from the source
+            - trust_extension: see convert_stream
+            - kwargs: additional arguments to pass to the converters
+        """
+        if stream_infos is not None and len(stream_infos) != len(sources):
+            raise ValueError("stream_infos must have one entry per source.")
+
+        results: List[DocumentConverterResult] = []
+        for start in range(0, len(sources), MAGIKA_BATCH_SIZE):
+            with contextlib.ExitStack() as stack:
+                streams: List[BinaryIO] = []
+                base_guesses: List[StreamInfo] = []
+                for i in range(start, min(start + MAGIKA_BATCH_SIZE, len(sources))):
+                    source = sources[i]
+                    if isinstance(source, (str, Path)):
+                        path = str(source)
+                        base_guess = StreamInfo(
+                            local_path=path,
+                            extension=os.path.splitext(path)[1],
+                            filename=os.path.basename(path),
+                        )
+                        stream = stack.enter_context(open(path, "rb"))
+                    elif (
+                        hasattr(source, "read")
+                        and callable(source.read)
+                        and not isinstance(source, io.TextIOBase)
+                    ):
+                        base_guess = StreamInfo()
+                        stream = self._make_seekable(source)
+                    else:
+                        raise TypeError(
+                            f"Invalid source type: {type(source)}. Expected str, Path, BinaryIO."
+                        )
+
+                    if stream_infos is not None and stream_infos[i] is not None:
+                        base_guess = base_guess.copy_and_update(stream_infos[i])
+
+                    streams.append(stream)
+                    base_guesses.append(base_guess)
+
+                for result in self._convert_many(
+                    streams, base_guesses, trust_extension=trust_extension, **kwargs
+                ):
+                    if isinstance(result, Exception):
+                        raise result
+                    results.append(result)
+
+        return results
 
     def convert_url(
         self,
@@ -515,20 +734,87 @@ class MarkItDown:
             base_guess = base_guess.copy_and_update(url=url)
 
         # Read into BytesIO
-        buffer = io.BytesIO()
-        for chunk in response.iter_content(chunk_size=512):
-            buffer.write(chunk)
-        buffer.seek(0)
+        metrics = start_metrics(kwargs)
+        with timed(metrics, STAGE_BUFFER):
+            buffer = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=512):
+                buffer.write(chunk)
+            buffer.seek(0)
 
         # Convert
-        guesses = self._get_stream_info_guesses(
-            file_stream=buffer, base_guess=base_guess
+        with timed(metrics, STAGE_IDENTIFY):
+            guesses = self._get_stream_info_guesses(
+                file_stream=buffer, base_guess=base_guess
+            )
+        return self._convert(
+            file_stream=buffer, stream_info_guesses=guesses, _metrics=metrics, **kwargs
+        )
+
+    def _convert_many(
+        self,
+        file_streams: List[BinaryIO],
+        base_guesses: List[StreamInfo],
+        trust_extension: bool = False,
+        **kwargs: Any,
+    ) -> Iterator[Union[DocumentConverterResult, MarkItDownException]]:
+        """
+        Identify a batch of seekable streams together, then convert each in turn.
+
+        Yields, in order, either the result or the conversion error of each
+        stream, so that callers can decide which errors to tolerate. Streams
+        are only converted as the iterator is consumed.
+
+        If metrics are requested, the time spent identifying the batch is
+        shared equally between the streams.
+        """
+        recorders = [start_metrics(kwargs) for _ in file_streams]
+        identify_start = time.perf_counter()
+        guesses = self._get_stream_info_guesses_many(
+            file_streams, base_guesses, trust_extension=trust_extension
         )
-        return self._convert(file_stream=buffer, stream_info_guesses=guesses, **kwargs)
+        identify_seconds = time.perf_counter() - identify_start
+        for recorder in recorders:
+            if recorder is not None:
+                recorder.record(
+                    StageTiming(
+                        stage=STAGE_IDENTIFY,
+                        seconds=identify_seconds / len(file_streams),
+                    )
+                )
+
+        for file_stream, stream_info_guesses, recorder in zip(
+            file_streams, guesses, recorders
+        ):
+            try:
+                yield self._convert(
+                    file_stream=file_stream,
+                    stream_info_guesses=stream_info_guesses,
+                    _metrics=recorder,
+                    **kwargs,
+                )
+            except MarkItDownException as e:
+                yield e
 
     def _convert(
-        self, *, file_stream: BinaryIO, stream_info_guesses: List[StreamInfo], **kwargs
+        self,
+        *,
+        file_stream: BinaryIO,
+        stream_info_guesses: List[StreamInfo],
+        output_stream: Optional[TextIO] = None,
+        _metrics: Optional[_MetricsRecorder] = None,
+        **kwargs,
     ) -> DocumentConverterResult:
+        """
+        Try each converter in turn, for each of the guesses, returning the first result.
+
+        If output_stream is given, the Markdown is also written to it. Converters that
+        support it (see _markdown_sink) write the Markdown as they produce it, rather
+        than building it in memory, in which case the returned result's markdown is
+        empty. Otherwise, the complete Markdown is written once the conversion succeeds.
+
+        If _metrics is given, the probes, conversion attempts, LLM calls, and
+        normalization are timed, and the metrics are set on the result.
+        """
         res: Union[None, DocumentConverterResult] = None
 
         # Keep track of which converters throw exceptions
@@ -542,6 +828,10 @@ class MarkItDown:
         # Remember the initial stream position so that we can return to it
         cur_pos = file_stream.tell()
 
+        if _metrics is not None:
+            _metrics.metrics.bytes_in = file_stream.seek(0, io.SEEK_END) - cur_pos
+            file_stream.seek(cur_pos)
+
         for stream_info in stream_info_guesses + [StreamInfo()]:
             for converter_registration in sorted_registrations:
                 converter = converter_registration.converter
@@ -556,6 +846,12 @@ class MarkItDown:
                 if "llm_client" not in _kwargs and self._llm_client is not None:
                     _kwargs["llm_client"] = self._llm_client
 
+                # Time the LLM calls made by the converter
+                if _metrics is not None and _kwargs.get("llm_client") is not None:
+                    _kwargs["llm_client"] = _TimedLlmClient(
+                        _kwargs["llm_client"], _metrics
+                    )
+
                 if "llm_model" not in _kwargs and self._llm_model is not None:
                     _kwargs["llm_model"] = self._llm_model
 
@@ -568,6 +864,11 @@ class MarkItDown:
                 # Add the list of converters for nested processing
                 _kwargs["_parent_converters"] = self._converters
 
+                # Converters may stream their output to this sink. This replaces any
+                # sink inherited from an enclosing conversion (e.g., of an archive).
+                sink = None if output_stream is None else _MarkdownWriter(output_stream)
+                _kwargs["_markdown_sink"] = sink
+
                 # Add legaxy kwargs
                 if stream_info is not None:
                     if stream_info.extension is not None:
@@ -578,8 +879,12 @@ class MarkItDown:
 
                 # Check if the converter will accept the file, and if so, try to convert it
                 _accepts = False
+                converter_name = type(converter).__name__
                 try:
-                    _accepts = converter.accepts(file_stream, stream_info, **_kwargs)
+                    with timed(_metrics, STAGE_ACCEPTS, converter_name):
+                        _accepts = converter.accepts(
+                            file_stream, stream_info, **_kwargs
+                        )
                 except NotImplementedError:
                     pass
 
@@ -591,22 +896,50 @@ class MarkItDown:
                 # Attempt the conversion
                 if _accepts:
                     try:
-                        res = converter.convert(file_stream, stream_info, **_kwargs)
+                        with timed(_metrics, STAGE_CONVERT, converter_name):
+                            res = converter.convert(file_stream, stream_info, **_kwargs)
                     except Exception:
                         failed_attempts.append(
                             FailedConversionAttempt(
                                 converter=converter, exc_info=sys.exc_info()
                             )
                         )
+                        # Output already written cannot be taken back, so there is
+                        # no falling back to other converters
+                        if sink is not None and sink.written:
+                            raise FileConversionException(attempts=failed_attempts)
                     finally:
                         file_stream.seek(cur_pos)
 
                 if res is not None:
-                    # Normalize the content
-                    res.text_content = "\n".join(
-                        [line.rstrip() for line in re.split(r"\r?\n", res.text_content)]
-                    )
-                    res.text_content = re.sub(r"\n{3,}", "\n\n", res.text_content)
+                    if sink is not None and sink.written:
+                        # Already normalized, and written, by the sink
+                        with timed(_metrics, STAGE_NORMALIZE):
+                            sink.close()
+                        if _metrics is not None:
+                            _metrics.metrics.bytes_out = sink.bytes_written
+                    else:
+                        # Normalize the content
+                        with timed(_metrics, STAGE_NORMALIZE):
+                            res.text_content = "\n".join(
+                                [
+                                    line.rstrip()
+                                    for line in re.split(r"\r?\n", res.text_content)
+                                ]
+                            )
+                            res.text_content = re.sub(
+                                r"\n{3,}", "\n\n", res.text_content
+                            )
+                        if output_stream is not None:
+                            output_stream.write(res.markdown)
+                        if _metrics is not None:
+                            _metrics.metrics.bytes_out = len(
+                                res.markdown.encode("utf-8")
+                            )
+
+                    if _metrics is not None:
+                        _metrics.metrics.converter = converter_name
+                        res.metrics = _metrics.metrics
                     return res
 
         # If we got this far without success, report any exceptions
@@ -659,45 +992,45 @@ class MarkItDown:
         )
 
     def _get_stream_info_guesses(
-        self, file_stream: BinaryIO, base_guess: StreamInfo
+        self,
+        file_stream: BinaryIO,
+        base_guess: StreamInfo,
+        trust_extension: bool = False,
+        magika_result: Optional[MagikaResult] = None,
     ) -> List[StreamInfo]:
         """
         Given a base guess, attempt to guess or expand on the stream info using the stream content (via magika).
+
+        If trust_extension is True, and the extension maps to a specific
+        mimetype, magika is skipped and only the charset of textual streams is
+        guessed. If magika_result is provided (e.g., from a batched call to
+        _identify_streams), it is used instead of identifying the stream again.
         """
         guesses: List[StreamInfo] = []
 
         # Enhance the base guess with information based on the extension or mimetype
-        enhanced_guess = base_guess.copy_and_update()
+        enhanced_guess = self._enhance_guess(base_guess)
 
-        # If there's an extension and no mimetype, try to guess the mimetype
-        if base_guess.mimetype is None and base_guess.extension is not None:
-            _m, _ = mimetypes.guess_type(
-                "placeholder" + base_guess.extension, strict=False
-            )
-            if _m is not None:
-                enhanced_guess = enhanced_guess.copy_and_update(mimetype=_m)
-
-        # If there's a mimetype and no extension, try to guess the extension
-        if base_guess.mimetype is not None and base_guess.extension is None:
-            _e = mimetypes.guess_all_extensions(base_guess.mimetype, strict=False)
-            if len(_e) > 0:
-                enhanced_guess = enhanced_guess.copy_and_update(extension=_e[0])
+        # Take a known extension at face value, if asked to
+        if trust_extension and self._is_trusted_guess(base_guess, enhanced_guess):
+            if enhanced_guess.charset is None and self._is_text_mimetype(
+                enhanced_guess.mimetype or ""
+            ):
+                enhanced_guess = enhanced_guess.copy_and_update(
+                    charset=self._guess_charset(file_stream)
+                )
+            return [enhanced_guess]
 
         # Call magika to guess from the stream
         cur_pos = file_stream.tell()
         try:
-            result = self._magika.identify_stream(file_stream)
+            result = magika_result or self._magika.identify_stream(file_stream)
             if result.status == "ok" and result.prediction.output.label != "unknown":
                 # If it's text, also guess the charset
                 charset = None
                 if result.prediction.output.is_text:
-                    # Read the first 4k to guess the charset
                     file_stream.seek(cur_pos)
-                    stream_page = file_stream.read(4096)
-                    charset_result = charset_normalizer.from_bytes(stream_page).best()
-
-                    if charset_result is not None:
-                        charset = self._normalize_charset(charset_result.encoding)
+                    charset = self._guess_charset(file_stream)
 
                 # Normalize the first extension listed
                 guessed_extension = None
@@ -759,6 +1092,156 @@ class MarkItDown:
 
         return guesses
 
+    def _get_stream_info_guesses_many(
+        self,
+        file_streams: List[BinaryIO],
+        base_guesses: List[StreamInfo],
+        trust_extension: bool = False,
+    ) -> List[List[StreamInfo]]:
+        """
+        Like _get_stream_info_guesses, but for several streams at once. Streams
+        that need to be identified by magika are identified in a single batch.
+        """
+        pending = [
+            i
+            for i, base_guess in enumerate(base_guesses)
+            if not trust_extension
+            or not self._is_trusted_guess(base_guess, self._enhance_guess(base_guess))
+        ]
+        magika_results = dict(
+            zip(pending, self._identify_streams([file_streams[i] for i in pending]))
+        )
+
+        return [
+            self._get_stream_info_guesses(
+                file_stream=file_stream,
+                base_guess=base_guess,
+                trust_extension=trust_extension,
+                magika_result=magika_results.get(i),
+            )
+            for i, (file_stream, base_guess) in enumerate(
+                zip(file_streams, base_guesses)
+            )
+        ]
+
+    def _identify_streams(
+        self, file_streams: List[BinaryIO]
+    ) -> List[Optional[MagikaResult]]:
+        """
+        Identify the content of several streams (via magika), running inference
+        on all of them in one batch. Stream positions are left unchanged.
+
+        Magika only batches files, so each stream is copied to a temporary
+        file. Streams larger than MAGIKA_BATCH_MAX_STREAM_SIZE are not worth
+        copying, so None is returned for them, and they are identified one at
+        a time (see _get_stream_info_guesses).
+        """
+        results: List[Optional[MagikaResult]] = [None] * len(file_streams)
+        if len(file_streams) < 2:
+            return results
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # As with identify_stream, the whole stream is identified
+            paths: Dict[int, str] = {}
+            for i, file_stream in enumerate(file_streams):
+                cur_pos = file_stream.tell()
+                try:
+                    if file_stream.seek(0, io.SEEK_END) > MAGIKA_BATCH_MAX_STREAM_SIZE:
+                        continue
+                    file_stream.seek(0)
+                    paths[i] = os.path.join(temp_dir, str(i))
+                    with open(paths[i], "wb") as fh:
+                        shutil.copyfileobj(file_stream, fh)
+                finally:
+                    file_stream.seek(cur_pos)
+
+            if len(paths) > 1:
+                identified = self._magika.identify_paths(list(paths.values()))
+                for i, result in zip(paths, identified):
+                    results[i] = result
+
+        return results
+
+    def _enhance_guess(self, base_guess: StreamInfo) -> StreamInfo:
+        """
+        Fill in the mimetype from the extension, or the extension from the mimetype, whichever is missing.
+        """
+        enhanced_guess = base_guess.copy_and_update()
+
+        # If there's an extension and no mimetype, try to guess the mimetype
+        if base_guess.mimetype is None and base_guess.extension is not None:
+            _m, _ = mimetypes.guess_type(
+                "placeholder" + base_guess.extension, strict=False
+            )
+            if _m is None:
+                _m = _EXTRA_EXTENSION_MIMETYPES.get(base_guess.extension.lower())
+            if _m is not None:
+                enhanced_guess = enhanced_guess.copy_and_update(mimetype=_m)
+
+        # If there's a mimetype and no extension, try to guess the extension
+        if base_guess.mimetype is not None and base_guess.extension is None:
+            _e = mimetypes.guess_all_extensions(base_guess.mimetype, strict=False)
+            if len(_e) > 0:
+                enhanced_guess = enhanced_guess.copy_and_update(extension=_e[0])
+
+        return enhanced_guess
+
+    def _is_trusted_guess(
+        self, base_guess: StreamInfo, enhanced_guess: StreamInfo
+    ) -> bool:
+        """
+        Check if an extension can be taken at face value. Extensions that are
+        missing, unknown, or generic (octet-stream) are not trusted.
+        """
+        return (
+            base_guess.extension is not None
+            and enhanced_guess.mimetype is not None
+            and enhanced_guess.mimetype != "application/octet-stream"
+        )
+
+    def _guess_charset(self, file_stream: BinaryIO) -> str | None:
+        """
+        Guess the charset of a text stream from its first 4k, leaving the stream position unchanged.
+        """
+        cur_pos = file_stream.tell()
+        try:
+            stream_page = file_stream.read(4096)
+        finally:
+            file_stream.seek(cur_pos)
+
+        charset_result = charset_normalizer.from_bytes(stream_page).best()
+        if charset_result is None:
+            return None
+        return self._normalize_charset(charset_result.encoding)
+
+    def _is_text_mimetype(self, mimetype: str) -> bool:
+        """
+        Check if a mimetype describes textual content.
+        """
+        mimetype = mimetype.lower()
+        return (
+            mimetype.startswith("text/")
+            or mimetype.endswith("+json")
+            or mimetype.endswith("+xml")
+            or mimetype in _TEXT_MIMETYPES
+        )
+
+    def _make_seekable(self, stream: BinaryIO) -> BinaryIO:
+        """
+        Return the stream itself if it is seekable. Otherwise, load the entire stream into memory.
+        """
+        if stream.seekable():
+            return stream
+
+        buffer = io.BytesIO()
+        while True:
+            chunk = stream.read(4096)
+            if not chunk:
+                break
+            buffer.write(chunk)
+        buffer.seek(0)
+        return buffer
+
     def _normalize_charset(self, charset: str | None) -> str | None:
         """
         Normalize a charset string to a canonical form.
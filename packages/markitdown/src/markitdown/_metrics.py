@@ -0,0 +1,128 @@
+import contextlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Iterator, List, Optional, Tuple
+
+# The stages of a conversion that are timed
+STAGE_BUFFER = "buffer"  # Reading a non-seekable stream, or HTTP response, into memory
+STAGE_IDENTIFY = "identify"  # Guessing the stream info (e.g., with magika)
+STAGE_ACCEPTS = "accepts"  # One converter's accepts() probe
+STAGE_CONVERT = "convert"  # One converter's convert() attempt
+STAGE_LLM = "llm"  # One LLM call, made by a converter
+STAGE_NORMALIZE = "normalize"  # Normalizing the converted Markdown
+
+
+@dataclass(kw_only=True, frozen=True)
+class StageTiming:
+    """The time spent in one stage of a conversion."""
+
+    stage: str  # One of the STAGE_* names
+    seconds: float
+    converter: Optional[str] = None  # The converter's class name (accepts, convert)
+    succeeded: bool = True  # False if the stage raised an exception
+
+
+@dataclass(kw_only=True)
+class ConversionMetrics:
+    """
+    Timings, and sizes, of a conversion. Stages are listed in the order they
+    ended. The stages of conversions nested in this one (of archive members, and
+    email attachments) are not included, but are reported to the on_stage callback.
+    """
+
+    stages: List[StageTiming] = field(default_factory=list)
+    bytes_in: Optional[int] = None  # The size of the converted stream
+    bytes_out: Optional[int] = None  # The size of the Markdown, encoded as UTF-8
+    converter: Optional[str] = None  # The class name of the converter that succeeded
+
+    def seconds(self, stage: str) -> float:
+        """The total time spent in the given stage."""
+        return sum(timing.seconds for timing in self.stages if timing.stage == stage)
+
+
+class _MetricsRecorder:
+    """
+    Collects the metrics of one conversion, passing each stage to the on_stage
+    callback (if any) as it ends. Stages may end on other threads (e.g., LLM calls
+    made by converters in parallel), so callbacks must be thread-safe.
+    """
+
+    def __init__(self, on_stage: Optional[Callable[[StageTiming], None]] = None):
+        self.metrics = ConversionMetrics()
+        self._on_stage = on_stage
+
+    @contextlib.contextmanager
+    def stage(self, stage: str, converter: Optional[str] = None) -> Iterator[None]:
+        start = time.perf_counter()
+        succeeded = False
+        try:
+            yield
+            succeeded = True
+        finally:
+            self.record(
+                StageTiming(
+                    stage=stage,
+                    seconds=time.perf_counter() - start,
+                    converter=converter,
+                    succeeded=succeeded,
+                )
+            )
+
+    def record(self, timing: StageTiming) -> None:
+        self.metrics.stages.append(timing)
+        if self._on_stage is not None:
+            self._on_stage(timing)
+
+
+def start_metrics(kwargs: dict) -> Optional[_MetricsRecorder]:
+    """
+    A recorder for a conversion, if metrics were requested (with the
+    collect_metrics or on_stage options), otherwise None.
+    """
+    on_stage = kwargs.get("on_stage")
+    if not kwargs.get("collect_metrics") and on_stage is None:
+        return None
+    return _MetricsRecorder(on_stage)
+
+
+def timed(
+    recorder: Optional[_MetricsRecorder], stage: str, converter: Optional[str] = None
+) -> ContextManager[None]:
+    """Time a stage, if recording metrics."""
+    if recorder is None:
+        return contextlib.nullcontext()
+    return recorder.stage(stage, converter)
+
+
+class _TimedLlmClient:
+    """
+    Wraps an OpenAI-style client, so that each call to chat.completions.create()
+    is timed as an LLM stage. Everything else is passed through.
+    """
+
+    _TIMED_PATH = ("chat", "completions", "create")
+
+    def __init__(
+        self, target: Any, recorder: _MetricsRecorder, path: Tuple[str, ...] = ()
+    ):
+        # Rewrap, rather than nest, clients already timed by an enclosing conversion
+        if isinstance(target, _TimedLlmClient):
+            target = target._target
+        self._target = target
+        self._recorder = recorder
+        self._path = path
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        path = self._path + (name,)
+        if path == self._TIMED_PATH:
+            recorder = self._recorder
+
+            def create(*args: Any, **kwargs: Any) -> Any:
+                with recorder.stage(STAGE_LLM):
+                    return value(*args, **kwargs)
+
+            return create
+        if path == self._TIMED_PATH[: len(path)]:
+            return _TimedLlmClient(value, self._recorder, path)
+        return value
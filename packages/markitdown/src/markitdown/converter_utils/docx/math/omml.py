@@ -6,6 +6,9 @@ Adapted from https://github.com/xiilei/dwml/blob/master/dwml/omml.py
 On 25/03/2025
 """
 
+import re
+from typing import Any, Callable, Dict, Optional
+
 from defusedxml import ElementTree as ET
 
 from .latex_dict import (
@@ -39,6 +42,32 @@ from .latex_dict import (
 
 OMML_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/math}"
 
+# Special LaTeX characters, unless they are already escaped
+_ESCAPE_TABLE = str.maketrans({c: BACKSLASH + c for c in CHARS})
+_ESCAPE_RE = re.compile(
+    "(?<!{0}{0})([{1}])".format(BACKSLASH, "".join(re.escape(c) for c in CHARS))
+)
+
+_T_TAG = OMML_NS + "t"
+
+# Fully qualified tag -> local name of OMML elements (None for anything else)
+_LOCAL_NAMES: Dict[Any, Optional[str]] = {}
+
+
+def _local_name(tag: Any) -> Optional[str]:
+    """
+    Return the local name of an OMML tag, or None for comments, processing
+    instructions and elements from other namespaces.
+    """
+    try:
+        return _LOCAL_NAMES[tag]
+    except KeyError:
+        stag = None
+        if isinstance(tag, str) and tag.startswith(OMML_NS):
+            stag = tag[len(OMML_NS) :]
+        _LOCAL_NAMES[tag] = stag
+        return stag
+
 
 def load(stream):
     tree = ET.parse(stream)
@@ -53,16 +82,11 @@ def load_string(string):
 
 
 def escape_latex(strs):
-    last = None
-    new_chr = []
     strs = strs.replace(r"\\", "\\")
-    for c in strs:
-        if (c in CHARS) and (last != BACKSLASH):
-            new_chr.append(BACKSLASH + c)
-        else:
-            new_chr.append(c)
-        last = c
-    return BLANK.join(new_chr)
+    if BACKSLASH not in strs:
+        # Nothing is escaped yet, so every special character needs escaping
+        return strs.translate(_ESCAPE_TABLE)
+    return _ESCAPE_RE.sub(BACKSLASH + BACKSLASH + r"\1", strs)
 
 
 def get_val(key, default=None, store=CHR):
@@ -73,11 +97,19 @@ def get_val(key, default=None, store=CHR):
 
 
 class Tag2Method(object):
-    def call_method(self, elm, stag=None):
-        getmethod = self.tag2meth.get
-        if stag is None:
-            stag = elm.tag.replace(OMML_NS, "")
-        method = getmethod(stag)
+    __slots__ = ()
+
+    # Handlers keyed by local tag name. Subclasses declare these, and they are
+    # compiled into `_dispatch`, keyed by fully qualified tag, once per class.
+    tag2meth: Dict[str, Callable] = {}
+    _dispatch: Dict[str, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {OMML_NS + stag: meth for stag, meth in cls.tag2meth.items()}
+
+    def call_method(self, elm):
+        method = self._dispatch.get(elm.tag)
         if method:
             return method(self, elm)
         else:
@@ -87,13 +119,13 @@ class Tag2Method(object):
         """
         process children of the elm,return iterable
         """
-        for _e in list(elm):
-            if OMML_NS not in _e.tag:
+        for _e in elm:
+            stag = _local_name(_e.tag)
+            if stag is None:
                 continue
-            stag = _e.tag.replace(OMML_NS, "")
             if include and (stag not in include):
                 continue
-            t = self.call_method(_e, stag=stag)
+            t = self.call_method(_e)
             if t is None:
                 t = self.process_unknow(_e, stag)
                 if t is None:
@@ -125,16 +157,14 @@ class Tag2Method(object):
 
 
 class Pr(Tag2Method):
-    text = ""
+    """common properties of element"""
 
-    __val_tags = ("chr", "pos", "begChr", "endChr", "type")
-
-    __innerdict = None  # can't use the __dict__
+    __slots__ = ("text", "__innerdict")
 
-    """ common properties of element"""
+    __val_tags = ("chr", "pos", "begChr", "endChr", "type")
 
     def __init__(self, elm):
-        self.__innerdict = {}
+        self.__innerdict = {}  # can't use the __dict__
         self.text = self.process_children(elm)
 
     def __str__(self):
@@ -151,7 +181,7 @@ class Pr(Tag2Method):
         return BRK
 
     def do_common(self, elm):
-        stag = elm.tag.replace(OMML_NS, "")
+        stag = _local_name(elm.tag)
         if stag in self.__val_tags:
             t = elm.get("{0}val".format(OMML_NS))
             self.__innerdict[stag] = t
@@ -172,9 +202,14 @@ class oMath2Latex(Tag2Method):
     Convert oMath element of omml to latex
     """
 
+    __slots__ = ("_latex",)
+
     _t_dict = T
+    _t_table = str.maketrans(_t_dict)
 
-    __direct_tags = ("box", "sSub", "sSup", "sSubSup", "num", "den", "deg", "e")
+    __direct_tags = frozenset(
+        ("box", "sSub", "sSup", "sSubSup", "num", "den", "deg", "e")
+    )
 
     def __init__(self, element):
         self._latex = self.process_children(element)
@@ -372,11 +407,8 @@ class oMath2Latex(Tag2Method):
         @todo text style support , (sty)
         @todo \text (latex pure text support)
         """
-        _str = []
-        for s in elm.findtext("./{0}t".format(OMML_NS)):
-            # s = s if isinstance(s,unicode) else unicode(s,'utf-8')
-            _str.append(self._t_dict.get(s, s))
-        return escape_latex(BLANK.join(_str))
+        text = elm.findtext(_T_TAG)
+        return escape_latex(text.translate(self._t_table))
 
     tag2meth = {
         "acc": do_acc,
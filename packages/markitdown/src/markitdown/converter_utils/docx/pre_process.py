@@ -1,127 +1,177 @@
+import shutil
 import zipfile
 from io import BytesIO
-from typing import BinaryIO
-from xml.etree import ElementTree as ET
+from typing import BinaryIO, Dict, Optional
 
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
 
 from .math.omml import OMML_NS, oMath2Latex
 
-MATH_ROOT_TEMPLATE = "".join(
-    (
-        "<w:document ",
-        'xmlns:wpc="http://schemas.microsoft.com/office/word/2010/wordprocessingCanvas" ',
-        'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" ',
-        'xmlns:o="urn:schemas-microsoft-com:office:office" ',
-        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" ',
-        'xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math" ',
-        'xmlns:v="urn:schemas-microsoft-com:vml" ',
-        'xmlns:wp14="http://schemas.microsoft.com/office/word/2010/wordprocessingDrawing" ',
-        'xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing" ',
-        'xmlns:w10="urn:schemas-microsoft-com:office:word" ',
-        'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" ',
-        'xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml" ',
-        'xmlns:wpg="http://schemas.microsoft.com/office/word/2010/wordprocessingGroup" ',
-        'xmlns:wpi="http://schemas.microsoft.com/office/word/2010/wordprocessingInk" ',
-        'xmlns:wne="http://schemas.microsoft.com/office/word/2006/wordml" ',
-        'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape" mc:Ignorable="w14 wp14">',
-        "{0}</w:document>",
-    )
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# The files that need to be pre-processed from .docx
+PRE_PROCESS_ENABLE_FILES = (
+    "word/document.xml",
+    "word/footnotes.xml",
+    "word/endnotes.xml",
 )
 
+# Every OMML element, whatever its namespace prefix, contains this marker
+_MATH_MARKER = b"oMath"
+
+_CHUNK_SIZE = 64 * 1024
+
+# Never resolve entities or fetch external resources from untrusted documents
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+
 
-def _convert_omath_to_latex(tag: Tag) -> str:
+def _convert_omath_to_latex(
+    element: etree._Element, cache: Optional[Dict[bytes, str]] = None
+) -> str:
     """
-    Converts an OMML (Office Math Markup Language) tag to LaTeX format.
+    Converts an OMML (Office Math Markup Language) element to LaTeX format.
+
+    The element is walked directly, as part of the document tree. If a cache is
+    provided, conversions are memoized by the canonical form of the element, so
+    that repeated equations are only converted once.
 
     Args:
-        tag (Tag): A BeautifulSoup Tag object representing the OMML element.
+        element (etree._Element): An lxml element representing the "oMath" element.
+        cache (Dict[bytes, str], optional): Conversions made so far, keyed by canonical OMML.
 
     Returns:
         str: The LaTeX representation of the OMML element.
     """
-    # Format the tag into a complete XML document string
-    math_root = ET.fromstring(MATH_ROOT_TEMPLATE.format(str(tag)))
-    # Find the 'oMath' element within the XML document
-    math_element = math_root.find(OMML_NS + "oMath")
-    # Convert the 'oMath' element to LaTeX using the oMath2Latex function
-    latex = oMath2Latex(math_element).latex
+    if cache is None:
+        return oMath2Latex(element).latex
+
+    # Exclusive C14N only keeps the namespaces actually used by the fragment
+    key = etree.tostring(element, method="c14n", exclusive=True, with_comments=False)
+    latex = cache.get(key)
+    if latex is None:
+        latex = oMath2Latex(element).latex
+        cache[key] = latex
     return latex
 
 
-def _get_omath_tag_replacement(tag: Tag, block: bool = False) -> Tag:
+def _get_omath_replacement(
+    element: etree._Element,
+    block: bool = False,
+    cache: Optional[Dict[bytes, str]] = None,
+) -> etree._Element:
     """
-    Creates a replacement tag for an OMML (Office Math Markup Language) element.
+    Creates a replacement run for an OMML (Office Math Markup Language) element.
 
     Args:
-        tag (Tag): A BeautifulSoup Tag object representing the "oMath" element.
+        element (etree._Element): An lxml element representing the "oMath" element.
         block (bool, optional): If True, the LaTeX will be wrapped in double dollar signs for block mode. Defaults to False.
+        cache (Dict[bytes, str], optional): Conversions made so far, keyed by canonical OMML.
 
     Returns:
-        Tag: A BeautifulSoup Tag object representing the replacement element.
+        etree._Element: A "w:r" element holding the LaTeX text.
     """
-    t_tag = Tag(name="w:t")
-    t_tag.string = (
-        f"$${_convert_omath_to_latex(tag)}$$"
-        if block
-        else f"${_convert_omath_to_latex(tag)}$"
-    )
-    r_tag = Tag(name="w:r")
-    r_tag.append(t_tag)
-    return r_tag
-
-
-def _replace_equations(tag: Tag):
+    latex = _convert_omath_to_latex(element, cache)
+    r_element = element.makeelement(WORD_NS + "r", nsmap=element.nsmap)
+    t_element = etree.SubElement(r_element, WORD_NS + "t")
+    t_element.text = f"$${latex}$$" if block else f"${latex}$"
+    return r_element
+
+
+def _replace_equations(
+    element: etree._Element, cache: Optional[Dict[bytes, str]] = None
+):
     """
     Replaces OMML (Office Math Markup Language) elements with their LaTeX equivalents.
 
     Args:
-        tag (Tag): A BeautifulSoup Tag object representing the OMML element. Could be either "oMathPara" or "oMath".
+        element (etree._Element): An lxml element representing the OMML element. Could be either "oMathPara" or "oMath".
+        cache (Dict[bytes, str], optional): Conversions made so far, keyed by canonical OMML.
 
     Raises:
-        ValueError: If the tag is not supported.
+        ValueError: If the element is not supported.
     """
-    if tag.name == "oMathPara":
-        # Create a new paragraph tag
-        p_tag = Tag(name="w:p")
-        # Replace each 'oMath' child tag with its LaTeX equivalent as block equations
-        for child_tag in tag.find_all("oMath"):
-            p_tag.append(_get_omath_tag_replacement(child_tag, block=True))
-        # Replace the original 'oMathPara' tag with the new paragraph tag
-        tag.replace_with(p_tag)
-    elif tag.name == "oMath":
-        # Replace the 'oMath' tag with its LaTeX equivalent as inline equation
-        tag.replace_with(_get_omath_tag_replacement(tag, block=False))
+    parent = element.getparent()
+    if parent is None:
+        return
+
+    if element.tag == OMML_NS + "oMathPara":
+        # Create a new paragraph, holding each 'oMath' child as a block equation
+        replacement = element.makeelement(WORD_NS + "p", nsmap=element.nsmap)
+        for child in element.iter(OMML_NS + "oMath"):
+            replacement.append(_get_omath_replacement(child, block=True, cache=cache))
+    elif element.tag == OMML_NS + "oMath":
+        # Replace the 'oMath' element with its LaTeX equivalent as inline equation
+        replacement = _get_omath_replacement(element, block=False, cache=cache)
     else:
-        raise ValueError(f"Not supported tag: {tag.name}")
+        raise ValueError(f"Not supported tag: {element.tag}")
+
+    replacement.tail = element.tail
+    parent.replace(element, replacement)
 
 
-def _pre_process_math(content: bytes) -> bytes:
+def _pre_process_math(
+    content: BinaryIO, cache: Optional[Dict[bytes, str]] = None
+) -> bytes:
     """
     Pre-processes the math content in a DOCX -> XML file by converting OMML (Office Math Markup Language) elements to LaTeX.
     This preprocessed content can be directly replaced in the DOCX file -> XMLs.
 
     Args:
-        content (bytes): The XML content of the DOCX file as bytes.
+        content (BinaryIO): A stream with the XML content of the DOCX file.
+        cache (Dict[bytes, str], optional): Conversions made so far, keyed by canonical OMML.
 
     Returns:
         bytes: The processed content with OMML elements replaced by their LaTeX equivalents, encoded as bytes.
     """
-    soup = BeautifulSoup(content.decode(), features="xml")
-    for tag in soup.find_all("oMathPara"):
-        _replace_equations(tag)
-    for tag in soup.find_all("oMath"):
-        _replace_equations(tag)
-    return str(soup).encode()
+    tree = etree.parse(content, _XML_PARSER)
+    root = tree.getroot()
+    # Materialize the lists first, since the tree is modified while replacing
+    for element in list(root.iter(OMML_NS + "oMathPara")):
+        _replace_equations(element, cache)
+    for element in list(root.iter(OMML_NS + "oMath")):
+        _replace_equations(element, cache)
+    return etree.tostring(tree, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _contains_math(zip_input: zipfile.ZipFile, name: str) -> bool:
+    """
+    Scans a member of the archive for OMML elements, without holding it in memory.
+    """
+    overlap = len(_MATH_MARKER) - 1
+    tail = b""
+    with zip_input.open(name) as member:
+        while True:
+            chunk = member.read(_CHUNK_SIZE)
+            if not chunk:
+                return False
+            if _MATH_MARKER in tail + chunk:
+                return True
+            tail = chunk[-overlap:]
+
+
+def _copy_member(
+    zip_input: zipfile.ZipFile, zip_output: zipfile.ZipFile, info: zipfile.ZipInfo
+):
+    """
+    Streams a member from one archive to the other, storing it without recompression.
+    """
+    out_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    out_info.external_attr = info.external_attr
+    out_info.comment = info.comment
+    out_info.file_size = info.file_size  # So that zip64 is used when needed
+    with zip_input.open(info) as src, zip_output.open(out_info, mode="w") as dst:
+        shutil.copyfileobj(src, dst, _CHUNK_SIZE)
 
 
 def pre_process_docx(input_docx: BinaryIO) -> BinaryIO:
     """
     Pre-processes a DOCX file with provided steps.
 
-    The process works by unzipping the DOCX file in memory, transforming specific XML files
-    (such as converting OMML elements to LaTeX), and then zipping everything back into a
-    DOCX file without writing to disk.
+    The XML parts that may hold math are first scanned for OMML elements. If there
+    are none, the input stream is returned unchanged. Otherwise, the DOCX file is
+    rewritten in memory: the parts holding math are transformed (converting OMML
+    elements to LaTeX), and every other member is streamed across as-is, one at
+    a time, without writing to disk.
 
     Args:
         input_docx (BinaryIO): A binary input stream representing the DOCX file.
@@ -129,28 +179,40 @@ def pre_process_docx(input_docx: BinaryIO) -> BinaryIO:
     Returns:
         BinaryIO: A binary output stream representing the processed DOCX file.
     """
-    output_docx = BytesIO()
-    # The files that need to be pre-processed from .docx
-    pre_process_enable_files = [
-        "word/document.xml",
-        "word/footnotes.xml",
-        "word/endnotes.xml",
-    ]
+    start_pos = input_docx.tell()
     with zipfile.ZipFile(input_docx, mode="r") as zip_input:
-        files = {name: zip_input.read(name) for name in zip_input.namelist()}
+        names = set(zip_input.namelist())
+        math_files = [
+            name
+            for name in PRE_PROCESS_ENABLE_FILES
+            if name in names and _contains_math(zip_input, name)
+        ]
+
+        # Fast path: nothing to pre-process
+        if not math_files:
+            input_docx.seek(start_pos)
+            return input_docx
+
+        # Repeated equations are converted once per document
+        latex_cache: Dict[bytes, str] = {}
+
+        output_docx = BytesIO()
         with zipfile.ZipFile(output_docx, mode="w") as zip_output:
             zip_output.comment = zip_input.comment
-            for name, content in files.items():
-                if name in pre_process_enable_files:
+            for info in zip_input.infolist():
+                if info.filename in math_files:
                     try:
                         # Pre-process the content
-                        updated_content = _pre_process_math(content)
+                        with zip_input.open(info) as content:
+                            updated_content = _pre_process_math(content, latex_cache)
                         # In the future, if there are more pre-processing steps, they can be added here
-                        zip_output.writestr(name, updated_content)
+                        zip_output.writestr(info.filename, updated_content)
+                        continue
                     except Exception:
                         # If there is an error in processing the content, write the original content
-                        zip_output.writestr(name, content)
-                else:
-                    zip_output.writestr(name, content)
+                        pass
+                _copy_member(zip_input, zip_output, info)
+
+    input_docx.seek(start_pos)
     output_docx.seek(0)
     return output_docx
@@ -0,0 +1,209 @@
+import codecs
+import json
+from typing import Any, BinaryIO, Iterator, List, Optional
+
+# Bytes read from the underlying stream at a time
+CHUNK_SIZE = 1024 * 1024
+
+_WHITESPACE = " \t\n\r"
+_SCALAR_END = ",]}" + _WHITESPACE
+
+
+class JsonStreamReader:
+    """
+    A minimal pull parser for large JSON documents.
+
+    Objects and arrays are iterated one member at a time, and each member can
+    either be read (decoded with the json module), iterated further, or skipped.
+    Skipped values are scanned without being decoded or kept in memory, so large
+    payloads (e.g., base64 images) that are not needed cost little.
+
+    Usage:
+
+        reader = JsonStreamReader(stream)
+        for key in reader.iter_object():
+            if key == "wanted":
+                value = reader.read_value()
+            else:
+                reader.skip_value()
+
+    Each key (or array element) yielded must be consumed exactly once, with
+    read_value, skip_value, iter_object, or iter_array, before iterating further.
+    Malformed documents raise a ValueError (json.JSONDecodeError, for values that
+    are read).
+    """
+
+    def __init__(self, stream: BinaryIO, encoding: str = "utf-8"):
+        self._stream = stream
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+        # Skip a byte order mark, if present
+        if self._peek() == "\ufeff":
+            self._pos += 1
+
+    def iter_object(self) -> Iterator[str]:
+        """Iterate over the keys of the object at the current position."""
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self._read_string()
+            self._expect(":")
+            yield key
+
+            char = self._next()
+            if char == "}":
+                return
+            elif char != ",":
+                raise ValueError(f"Expected ',' or '}}' but found {char!r}")
+
+    def iter_array(self) -> Iterator[None]:
+        """Iterate over the elements of the array at the current position."""
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield None
+
+            char = self._next()
+            if char == "]":
+                return
+            elif char != ",":
+                raise ValueError(f"Expected ',' or ']' but found {char!r}")
+
+    def read_value(self) -> Any:
+        """Read and decode the value at the current position."""
+        parts: List[str] = []
+        self._scan_value(parts)
+        return json.loads("".join(parts))
+
+    def skip_value(self) -> None:
+        """Skip over the value at the current position, without decoding it."""
+        self._scan_value(None)
+
+    def _scan_value(self, parts: Optional[List[str]]) -> None:
+        char = self._peek()
+        if char == "":
+            raise ValueError("Unexpected end of JSON document")
+        elif char == '"':
+            self._scan_string(parts)
+        elif char in "{[":
+            # Strings are scanned separately, so brackets in them are not counted
+            depth = 0
+            while True:
+                char = self._peek()
+                if char == '"':
+                    self._scan_string(parts)
+                    continue
+                elif char == "":
+                    raise ValueError("Unexpected end of JSON document")
+                self._pos += 1
+                if parts is not None:
+                    parts.append(char)
+                if char in "{[":
+                    depth += 1
+                elif char in "}]":
+                    depth -= 1
+                    if depth == 0:
+                        return
+        else:
+            # A number, true, false, or null
+            start = self._pos
+            while True:
+                if self._pos == len(self._buffer):
+                    if parts is not None:
+                        parts.append(self._buffer[start:])
+                    if not self._fill():
+                        return
+                    start = self._pos
+                if self._buffer[self._pos] in _SCALAR_END:
+                    if parts is not None:
+                        parts.append(self._buffer[start : self._pos])
+                    return
+                self._pos += 1
+
+    def _read_string(self) -> str:
+        if self._peek() != '"':
+            raise ValueError("Expected a string")
+        parts: List[str] = []
+        self._scan_string(parts)
+        return json.loads("".join(parts))
+
+    def _scan_string(self, parts: Optional[List[str]]) -> None:
+        """Scan the string at the current position (which must be a '"')."""
+        start = self._pos
+        search_from = self._pos + 1
+        while True:
+            end = self._buffer.find('"', search_from)
+            if end < 0:
+                # Keep any trailing backslashes (which may escape a quote at the
+                # start of the next chunk), and the character before them.
+                keep_from = len(self._buffer) - 1
+                while keep_from > start and self._buffer[keep_from] == "\\":
+                    keep_from -= 1
+                if parts is not None:
+                    parts.append(self._buffer[start:keep_from])
+                self._pos = keep_from
+                kept = len(self._buffer) - keep_from
+                if not self._fill():
+                    raise ValueError("Unterminated string in JSON document")
+                start = self._pos
+                search_from = start + kept
+                continue
+
+            # The quote is escaped if preceded by an odd number of backslashes
+            backslashes = 0
+            while end - 1 - backslashes > start and (
+                self._buffer[end - 1 - backslashes] == "\\"
+            ):
+                backslashes += 1
+            if backslashes % 2 == 1:
+                search_from = end + 1
+                continue
+
+            self._pos = end + 1
+            if parts is not None:
+                parts.append(self._buffer[start : self._pos])
+            return
+
+    def _expect(self, expected: str) -> None:
+        char = self._next()
+        if char != expected:
+            raise ValueError(f"Expected {expected!r} but found {char!r}")
+
+    def _next(self) -> str:
+        char = self._peek()
+        self._pos += 1
+        return char
+
+    def _peek(self) -> str:
+        """Return the next non-whitespace character, or "" at the end of the document."""
+        while True:
+            while self._pos < len(self._buffer):
+                if self._buffer[self._pos] not in _WHITESPACE:
+                    return self._buffer[self._pos]
+                self._pos += 1
+            if not self._fill():
+                return ""
+
+    def _fill(self) -> bool:
+        """
+        Discard consumed text, and decode more from the stream. Text from the current
+        position onwards is kept. Returns False if the stream is exhausted.
+        """
+        while not self._eof:
+            data = self._stream.read(CHUNK_SIZE)
+            self._eof = len(data) == 0
+            text = self._decoder.decode(data, final=self._eof)
+            if text:
+                self._buffer = self._buffer[self._pos :] + text
+                self._pos = 0
+                return True
+        return False
@@ -15,6 +15,11 @@ from ._xlsx_converter import XlsxConverter, XlsConverter
 from ._pptx_converter import PptxConverter
 from ._image_converter import ImageConverter
 from ._audio_converter import AudioConverter
+from ._transcribe_audio import (
+    SpeechBackend,
+    RecognizerBackend,
+    FasterWhisperBackend,
+)
 from ._outlook_msg_converter import OutlookMsgConverter
 from ._zip_converter import ZipConverter
 from ._doc_intel_converter import (
@@ -39,6 +44,9 @@ __all__ = [
     "PptxConverter",
     "ImageConverter",
     "AudioConverter",
+    "SpeechBackend",
+    "RecognizerBackend",
+    "FasterWhisperBackend",
     "OutlookMsgConverter",
     "ZipConverter",
     "DocumentIntelligenceConverter",
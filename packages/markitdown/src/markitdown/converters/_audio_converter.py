@@ -1,7 +1,7 @@
-from typing import Any, BinaryIO
+from typing import Any, BinaryIO, Optional
 
 from ._exiftool import exiftool_metadata
-from ._transcribe_audio import transcribe_audio
+from ._transcribe_audio import SpeechRecognizer, iter_transcript
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
 from .._exceptions import MissingDependencyException
@@ -23,8 +23,19 @@ ACCEPTED_FILE_EXTENSIONS = [
 class AudioConverter(DocumentConverter):
     """
     Converts audio files to markdown via extraction of metadata (if `exiftool` is installed), and speech transcription (if `speech_recognition` is installed).
+
+    Audio is transcribed in chunks, by Google's speech recognition service, unless
+    another speech_recognizer is given, either here, or per conversion: the name
+    of a speech_recognition engine, a function, or a SpeechBackend (e.g., the
+    offline FasterWhisperBackend). Chunks can be transcribed concurrently (pass
+    `max_workers` > 1), and the transcript is written out as it is produced, if
+    streaming output.
     """
 
+    def __init__(self, *, speech_recognizer: Optional[SpeechRecognizer] = None):
+        super().__init__()
+        self._speech_recognizer = speech_recognizer
+
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -90,12 +101,27 @@ class AudioConverter(DocumentConverter):
 
         # Transcribe
         if audio_format:
+            transcript = iter_transcript(
+                file_stream,
+                audio_format=audio_format,
+                recognizer=kwargs.get("speech_recognizer", self._speech_recognizer),
+                max_workers=kwargs.get("max_workers"),
+            )
             try:
-                transcript = transcribe_audio(file_stream, audio_format=audio_format)
-                if transcript:
-                    md_content += "\n\n### Audio Transcript:\n" + transcript
+                first = next(transcript)
             except MissingDependencyException:
-                pass
+                first = None
+
+            if first is not None:
+                md_content += "\n\n### Audio Transcript:\n" + first
+                markdown_sink = kwargs.get("_markdown_sink")
+                if markdown_sink is not None:
+                    markdown_sink.write(md_content.strip())
+                    md_content = ""
+                    for text in transcript:
+                        markdown_sink.write(" " + text)
+                else:
+                    md_content += "".join(" " + text for text in transcript)
 
         # Return the result
         return DocumentConverterResult(markdown=md_content.strip())
@@ -3,11 +3,11 @@ import base64
 import binascii
 from urllib.parse import parse_qs, urlparse
 from typing import Any, BinaryIO
-from bs4 import BeautifulSoup
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
 from ._markdownify import _CustomMarkdownify
+from ._targeted_soup import parse_targets
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "text/html",
@@ -19,6 +19,14 @@ ACCEPTED_FILE_EXTENSIONS = [
     ".htm",
 ]
 
+# The parts of the page that are converted. The results list is kept whole, since
+# the numbering of each result depends on its position in the list.
+BING_SERP_TARGETS = [
+    ("title", None, None),
+    ("ol", "id", "b_results"),
+    (None, "class", "b_algo"),
+]
+
 
 class BingSerpConverter(DocumentConverter):
     """
@@ -66,9 +74,9 @@ class BingSerpConverter(DocumentConverter):
         parsed_params = parse_qs(urlparse(stream_info.url).query)
         query = parsed_params.get("q", [""])[0]
 
-        # Parse the stream
+        # Parse only the title and the results
         encoding = "utf-8" if stream_info.charset is None else stream_info.charset
-        soup = BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
+        soup = parse_targets(file_stream, encoding, BING_SERP_TARGETS)
 
         # Clean up some formatting
         for tptt in soup.find_all(class_="tptt"):
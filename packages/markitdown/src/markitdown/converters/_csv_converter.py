@@ -4,6 +4,7 @@ from typing import BinaryIO, Any
 from charset_normalizer import from_bytes
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
+from ._markdown_table import markdown_table
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "text/csv",
@@ -47,31 +48,6 @@ class CsvConverter(DocumentConverter):
         else:
             content = str(from_bytes(file_stream.read()).best())
 
-        # Parse CSV content
+        # Parse CSV content, and render it directly as a Markdown table
         reader = csv.reader(io.StringIO(content))
-        rows = list(reader)
-
-        if not rows:
-            return DocumentConverterResult(markdown="")
-
-        # Create markdown table
-        markdown_table = []
-
-        # Add header row
-        markdown_table.append("| " + " | ".join(rows[0]) + " |")
-
-        # Add separator row
-        markdown_table.append("| " + " | ".join(["---"] * len(rows[0])) + " |")
-
-        # Add data rows
-        for row in rows[1:]:
-            # Make sure row has the same number of columns as header
-            while len(row) < len(rows[0]):
-                row.append("")
-            # Truncate if row has more columns than header
-            row = row[: len(rows[0])]
-            markdown_table.append("| " + " | ".join(row) + " |")
-
-        result = "\n".join(markdown_table)
-
-        return DocumentConverterResult(markdown=result)
+        return DocumentConverterResult(markdown=markdown_table(reader))
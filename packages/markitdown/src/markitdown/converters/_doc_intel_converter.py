@@ -1,12 +1,22 @@
 import sys
 import re
 import os
-from typing import BinaryIO, Any, List
+import hashlib
+import tempfile
+import io
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import BinaryIO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from enum import Enum
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
-from .._exceptions import MissingDependencyException
+from .._exceptions import (
+    MissingDependencyException,
+    FileConversionException,
+    FailedConversionAttempt,
+)
 
 # Try loading optional (but in this case, required) dependencies
 # Save reporting of any exceptions for later
@@ -19,6 +29,7 @@ try:
         DocumentAnalysisFeature,
     )
     from azure.core.credentials import AzureKeyCredential, TokenCredential
+    from azure.core.polling.base_polling import LROBasePolling
     from azure.identity import DefaultAzureCredential
 except ImportError:
     # Preserve the error and stack trace for later
@@ -46,11 +57,35 @@ except ImportError:
     class DefaultAzureCredential:
         pass
 
+    class LROBasePolling:  # type: ignore[no-redef]
+        pass
+
+
+# Try loading pdfminer, to count the pages of PDFs that are split into page ranges (optional)
+_pdfminer_dependency_exc_info = None
+try:
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfparser import PDFParser
+    from pdfminer.pdftypes import resolve1
+except ImportError:
+    # Preserve the error and stack trace for later
+    _pdfminer_dependency_exc_info = sys.exc_info()
+
 
 # TODO: currently, there is a bug in the document intelligence SDK with importing the "ContentFormat" enum.
 # This constant is a temporary fix until the bug is resolved.
 CONTENT_FORMAT = "markdown"
 
+# Default number of documents that convert_many keeps submitted to the service at once,
+# which is also the number of page ranges of a document that are analyzed at once
+DEFAULT_MAX_IN_FLIGHT = 8
+
+MODEL_ID = "prebuilt-layout"
+
+# Separates the content of the page ranges of a split document, as it separates pages
+# in the content of a whole one
+PAGE_BREAK = "\n<!-- PageBreak -->\n"
+
 
 class DocumentIntelligenceFileType(str, Enum):
     """Enum of file types supported by the Document Intelligence Converter."""
@@ -122,6 +157,23 @@ def _get_file_extensions(types: List[DocumentIntelligenceFileType]) -> List[str]
     return extensions
 
 
+class _DeadlinePolling(LROBasePolling):
+    """
+    Polls an analysis until it completes, or until the deadline passes. The
+    poller polls on a background thread, which cannot otherwise be stopped, so
+    would keep polling an analysis that has timed out until it completed.
+    """
+
+    def __init__(self, deadline: float, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._deadline = deadline
+
+    def update_status(self) -> None:
+        if time.monotonic() >= self._deadline:
+            raise TimeoutError("Document analysis did not complete within the timeout.")
+        super().update_status()
+
+
 class DocumentIntelligenceConverter(DocumentConverter):
     """Specialized DocumentConverter that uses Document Intelligence to extract text from documents."""
 
@@ -141,6 +193,8 @@ class DocumentIntelligenceConverter(DocumentConverter):
             DocumentIntelligenceFileType.BMP,
             DocumentIntelligenceFileType.TIFF,
         ],
+        pages_per_request: Optional[int] = None,
+        cache_dir: Optional[str] = None,
     ):
         """
         Initialize the DocumentIntelligenceConverter.
@@ -150,11 +204,30 @@ class DocumentIntelligenceConverter(DocumentConverter):
             api_version (str): The API version to use. Defaults to "2024-07-31-preview".
             credential (AzureKeyCredential | TokenCredential | None): The credential to use for authentication.
             file_types (List[DocumentIntelligenceFileType]): The file types to accept. Defaults to all supported file types.
+            pages_per_request (int | None): If set, PDFs with more pages than this are analyzed in page ranges of this size, in parallel, and the results merged in order. Requires pdfminer.six. Defaults to analyzing each document whole.
+            cache_dir (str | None): If set, a directory in which analysis results are cached, keyed by a hash of the document content and analysis options, so that unchanged documents are not analyzed (and paid for) again. Defaults to no caching.
         """
 
         super().__init__()
         self._file_types = file_types
 
+        if pages_per_request is not None:
+            if pages_per_request < 1:
+                raise ValueError("pages_per_request must be at least 1.")
+            if _pdfminer_dependency_exc_info is not None:
+                raise MissingDependencyException(
+                    "Splitting PDFs into page ranges requires the optional dependency [pdf] (or [all]) to be installed. E.g., `pip install markitdown[pdf]`"
+                ) from _pdfminer_dependency_exc_info[
+                    1
+                ].with_traceback(  # type: ignore[union-attr]
+                    _pdfminer_dependency_exc_info[2]
+                )
+        self._pages_per_request = pages_per_request
+
+        self._cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
         # Raise an error if the dependencies are not available.
         # This is different than other converters since this one isn't even instantiated
         # unless explicitly requested.
@@ -236,14 +309,234 @@ class DocumentIntelligenceConverter(DocumentConverter):
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
         # Extract the text using Azure Document Intelligence
-        poller = self.doc_intel_client.begin_analyze_document(
-            model_id="prebuilt-layout",
-            body=AnalyzeDocumentRequest(bytes_source=file_stream.read()),
-            features=self._analysis_features(stream_info),
-            output_content_format=CONTENT_FORMAT,  # TODO: replace with "ContentFormat.MARKDOWN" when the bug is fixed
+        return self._analyze(
+            file_stream,
+            stream_info,
+            None,
+            threading.BoundedSemaphore(DEFAULT_MAX_IN_FLIGHT),
         )
-        result: AnalyzeResult = poller.result()
+
+    def convert_many(
+        self,
+        file_streams: Iterable[BinaryIO],
+        stream_infos: Iterable[StreamInfo],
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Tuple[int, Union[DocumentConverterResult, FileConversionException]]]:
+        """
+        Analyze many documents concurrently, yielding their results as they complete.
+
+        Rather than waiting for each analysis before submitting the next, up to
+        max_in_flight requests are submitted to the service, and polled, at once.
+        As each completes, the next is submitted. The limit is shared by documents
+        and the page ranges they are split into (see pages_per_request), and
+        streams are read no further ahead than max_in_flight documents.
+
+        Args:
+            file_streams: the documents to analyze, which this converter must accept
+            stream_infos: the stream info for each document
+            max_in_flight: the maximum number of requests submitted at once
+            timeout: the maximum number of seconds to wait for each document, from
+                its submission, or None to wait indefinitely
+
+        Yields:
+            (index, result) pairs, in order of completion, where index is the
+            position of the document in file_streams. Failed or timed out analyses
+            yield a FileConversionException, so that one document cannot fail the
+            batch.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+
+        documents = enumerate(zip(file_streams, stream_infos))
+        slots = threading.BoundedSemaphore(max_in_flight)
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            in_flight: Dict["Future[DocumentConverterResult]", int] = {}
+            try:
+                while True:
+                    while len(in_flight) < max_in_flight:
+                        document = next(documents, None)
+                        if document is None:
+                            break
+                        index, (file_stream, stream_info) = document
+                        future = executor.submit(
+                            self._analyze, file_stream, stream_info, timeout, slots
+                        )
+                        in_flight[future] = index
+
+                    if len(in_flight) == 0:
+                        return
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = in_flight.pop(future)
+                        try:
+                            yield index, future.result()
+                        except Exception:
+                            yield index, FileConversionException(
+                                attempts=[
+                                    FailedConversionAttempt(
+                                        converter=self, exc_info=sys.exc_info()
+                                    )
+                                ]
+                            )
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    def _analyze(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        timeout: Optional[float],
+        slots: threading.BoundedSemaphore,
+    ) -> DocumentConverterResult:
+        """
+        Analyze a document, waiting at most timeout seconds in all (if not None),
+        and making no more concurrent requests than the semaphore allows.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        data = file_stream.read()
+        features = self._analysis_features(stream_info)
+
+        # The document is hashed once, for the cache keys of all its page ranges
+        digest = None if self._cache_dir is None else hashlib.sha256(data).digest()
+
+        def analyze_content(pages: Optional[str]) -> str:
+            return self._analyze_content(data, digest, features, pages, deadline, slots)
+
+        page_ranges = self._page_ranges(data, stream_info)
+        if len(page_ranges) <= 1:
+            content = analyze_content(None)
+        else:
+            # Page ranges wait on the shared semaphore, so the number of workers
+            # only bounds how many of them are ready to submit at once
+            with ThreadPoolExecutor(
+                max_workers=min(len(page_ranges), DEFAULT_MAX_IN_FLIGHT)
+            ) as executor:
+                content = PAGE_BREAK.join(executor.map(analyze_content, page_ranges))
 
         # remove comments from the markdown content generated by Doc Intelligence and append to markdown string
-        markdown_text = re.sub(r"<!--.*?-->", "", result.content, flags=re.DOTALL)
+        markdown_text = re.sub(r"<!--.*?-->", "", content, flags=re.DOTALL)
         return DocumentConverterResult(markdown=markdown_text)
+
+    def _page_ranges(self, data: bytes, stream_info: StreamInfo) -> List[str]:
+        """
+        The page ranges (e.g., "1-10") in which to analyze a document, or an empty
+        list to analyze it whole.
+        """
+        if self._pages_per_request is None:
+            return []
+
+        mimetype = (stream_info.mimetype or "").lower()
+        extension = (stream_info.extension or "").lower()
+        pdf_types = [DocumentIntelligenceFileType.PDF]
+        if extension not in _get_file_extensions(pdf_types) and not any(
+            mimetype.startswith(prefix) for prefix in _get_mime_type_prefixes(pdf_types)
+        ):
+            return []
+
+        # Documents whose pages cannot be counted are left for the service to read
+        try:
+            document = PDFDocument(PDFParser(io.BytesIO(data)))
+            page_count = int(resolve1(document.catalog["Pages"])["Count"])
+        except Exception:
+            return []
+
+        return [
+            f"{first}-{min(first + self._pages_per_request - 1, page_count)}"
+            for first in range(1, page_count + 1, self._pages_per_request)
+        ]
+
+    def _analyze_content(
+        self,
+        data: bytes,
+        digest: Optional[bytes],
+        features: List[str],
+        pages: Optional[str],
+        deadline: Optional[float],
+        slots: threading.BoundedSemaphore,
+    ) -> str:
+        """
+        Analyze a document (or some of its pages), returning the content, in Markdown,
+        from the cache if possible. digest is the document's SHA-256 hash, if caching.
+        """
+        cache_path = None
+        if self._cache_dir is not None and digest is not None:
+            key = hashlib.sha256()
+            for part in [self.api_version, MODEL_ID, CONTENT_FORMAT, pages or ""]:
+                key.update(part.encode("utf-8") + b"\0")
+            for feature in features:
+                key.update(
+                    str(getattr(feature, "value", feature)).encode("utf-8") + b"\0"
+                )
+            key.update(digest)
+            cache_path = os.path.join(self._cache_dir, key.hexdigest() + ".md")
+            try:
+                with open(cache_path, "rt", encoding="utf-8", newline="") as fh:
+                    return fh.read()
+            except FileNotFoundError:
+                pass
+
+        # The deadline covers waiting for a free slot, submitting, and polling
+        if not slots.acquire(timeout=self._remaining(deadline)):
+            raise TimeoutError("Document analysis did not start within the timeout.")
+        try:
+            options: Dict[str, Any] = {}
+            remaining = self._remaining(deadline)
+            if deadline is not None and remaining is not None:
+                if remaining <= 0:
+                    raise TimeoutError(
+                        "Document analysis did not start within the timeout."
+                    )
+                # Bound the submission, and stop polling at the deadline
+                options = {
+                    "connection_timeout": remaining,
+                    "read_timeout": remaining,
+                    "polling": _DeadlinePolling(
+                        deadline, connection_timeout=remaining, read_timeout=remaining
+                    ),
+                }
+
+            poller = self.doc_intel_client.begin_analyze_document(
+                model_id=MODEL_ID,
+                body=AnalyzeDocumentRequest(bytes_source=data),
+                features=features,
+                pages=pages,
+                output_content_format=CONTENT_FORMAT,  # TODO: replace with "ContentFormat.MARKDOWN" when the bug is fixed
+                **options,
+            )
+            remaining = self._remaining(deadline)
+            if remaining is not None:
+                poller.wait(remaining)
+                if not poller.done():
+                    raise TimeoutError(
+                        "Document analysis did not complete within the timeout."
+                    )
+            result: AnalyzeResult = poller.result()
+        finally:
+            slots.release()
+        content = result.content
+
+        # Write to a temporary file first, so that concurrent readers never see a
+        # partial entry. Failing to cache a result is not worth failing the conversion.
+        if cache_path is not None:
+            temp_path = None
+            try:
+                fd, temp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+                with os.fdopen(fd, "wt", encoding="utf-8", newline="") as fh:
+                    fh.write(content)
+                os.replace(temp_path, cache_path)
+            except OSError:
+                if temp_path is not None and os.path.exists(temp_path):
+                    os.unlink(temp_path)
+
+        return content
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        """The seconds left before the deadline (at least 0), or None if there is none."""
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
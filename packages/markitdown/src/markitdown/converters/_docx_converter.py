@@ -3,7 +3,6 @@ import sys
 from typing import BinaryIO, Any
 
 from ._html_converter import HtmlConverter
-from ..converter_utils.docx.pre_process import pre_process_docx
 from .._base_converter import DocumentConverterResult
 from .._stream_info import StreamInfo
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
@@ -13,6 +12,7 @@ from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
 _dependency_exc_info = None
 try:
     import mammoth
+    from ..converter_utils.docx.pre_process import pre_process_docx
 except ImportError:
     # Preserve the error and stack trace for later
     _dependency_exc_info = sys.exc_info()
@@ -3,7 +3,11 @@ import zipfile
 from defusedxml import minidom
 from xml.dom.minidom import Document
 
-from typing import BinaryIO, Any, Dict, List
+from typing import BinaryIO, Any, Deque, Dict, Iterator, List, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import chain
 
 from ._html_converter import HtmlConverter
 from .._base_converter import DocumentConverterResult
@@ -57,77 +61,125 @@ class EpubConverter(HtmlConverter):
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
         with zipfile.ZipFile(file_stream, "r") as z:
-            # Extracts metadata (title, authors, language, publisher, date, description, cover) from an EPUB file."""
-
-            # Locate content.opf
-            container_dom = minidom.parse(z.open("META-INF/container.xml"))
-            opf_path = container_dom.getElementsByTagName("rootfile")[0].getAttribute(
-                "full-path"
+            metadata, spine = self._read_package(z)
+            markdown = "\n\n".join(
+                chain(
+                    [self._format_metadata(metadata)],
+                    self._iter_chapters(z, spine, **kwargs),
+                )
             )
+            return DocumentConverterResult(markdown=markdown, title=metadata["title"])
 
-            # Parse content.opf
-            opf_dom = minidom.parse(z.open(opf_path))
-            metadata: Dict[str, Any] = {
-                "title": self._get_text_from_node(opf_dom, "dc:title"),
-                "authors": self._get_all_texts_from_nodes(opf_dom, "dc:creator"),
-                "language": self._get_text_from_node(opf_dom, "dc:language"),
-                "publisher": self._get_text_from_node(opf_dom, "dc:publisher"),
-                "date": self._get_text_from_node(opf_dom, "dc:date"),
-                "description": self._get_text_from_node(opf_dom, "dc:description"),
-                "identifier": self._get_text_from_node(opf_dom, "dc:identifier"),
-            }
-
-            # Extract manifest items (ID → href mapping)
-            manifest = {
-                item.getAttribute("id"): item.getAttribute("href")
-                for item in opf_dom.getElementsByTagName("item")
-            }
-
-            # Extract spine order (ID refs)
-            spine_items = opf_dom.getElementsByTagName("itemref")
-            spine_order = [item.getAttribute("idref") for item in spine_items]
-
-            # Convert spine order to actual file paths
-            base_path = "/".join(
-                opf_path.split("/")[:-1]
-            )  # Get base directory of content.opf
-            spine = [
-                f"{base_path}/{manifest[item_id]}" if base_path else manifest[item_id]
-                for item_id in spine_order
-                if item_id in manifest
-            ]
-
-            # Extract and convert the content
-            markdown_content: List[str] = []
+    def iter_chapters(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Iterator[str]:
+        """
+        Convert an EPUB file to Markdown one chapter at a time, so that large books
+        need not be held in memory. The first item is the formatted metadata, followed
+        by each chapter in spine order. Joining the items with blank lines gives the
+        same Markdown as convert(). The file_stream must remain open until the
+        iterator is exhausted.
+        """
+        with zipfile.ZipFile(file_stream, "r") as z:
+            metadata, spine = self._read_package(z)
+            yield self._format_metadata(metadata)
+            yield from self._iter_chapters(z, spine, **kwargs)
+
+    def _read_package(self, z: zipfile.ZipFile) -> Tuple[Dict[str, Any], List[str]]:
+        """Extract the metadata, and the paths of the chapters in spine order, from the package document."""
+        # Locate content.opf
+        container_dom = minidom.parse(z.open("META-INF/container.xml"))
+        opf_path = container_dom.getElementsByTagName("rootfile")[0].getAttribute(
+            "full-path"
+        )
+
+        # Parse content.opf
+        opf_dom = minidom.parse(z.open(opf_path))
+        metadata: Dict[str, Any] = {
+            "title": self._get_text_from_node(opf_dom, "dc:title"),
+            "authors": self._get_all_texts_from_nodes(opf_dom, "dc:creator"),
+            "language": self._get_text_from_node(opf_dom, "dc:language"),
+            "publisher": self._get_text_from_node(opf_dom, "dc:publisher"),
+            "date": self._get_text_from_node(opf_dom, "dc:date"),
+            "description": self._get_text_from_node(opf_dom, "dc:description"),
+            "identifier": self._get_text_from_node(opf_dom, "dc:identifier"),
+        }
+
+        # Extract manifest items (ID → href mapping)
+        manifest = {
+            item.getAttribute("id"): item.getAttribute("href")
+            for item in opf_dom.getElementsByTagName("item")
+        }
+
+        # Extract spine order (ID refs)
+        spine_items = opf_dom.getElementsByTagName("itemref")
+        spine_order = [item.getAttribute("idref") for item in spine_items]
+
+        # Convert spine order to actual file paths, skipping any missing from the archive
+        base_path = "/".join(
+            opf_path.split("/")[:-1]
+        )  # Get base directory of content.opf
+        members = set(z.namelist())
+        spine = [
+            f"{base_path}/{manifest[item_id]}" if base_path else manifest[item_id]
+            for item_id in spine_order
+            if item_id in manifest
+        ]
+        return metadata, [file for file in spine if file in members]
+
+    def _format_metadata(self, metadata: Dict[str, Any]) -> str:
+        metadata_markdown = []
+        for key, value in metadata.items():
+            if isinstance(value, list):
+                value = ", ".join(value)
+            if value:
+                metadata_markdown.append(f"**{key.capitalize()}:** {value}")
+        return "\n".join(metadata_markdown)
+
+    def _iter_chapters(
+        self, z: zipfile.ZipFile, spine: List[str], **kwargs: Any
+    ) -> Iterator[str]:
+        """Convert the chapters in spine order, concurrently if max_workers is set."""
+        convert_chapter = partial(self._convert_chapter, z)
+
+        max_workers = kwargs.get("max_workers")
+        if max_workers is None or max_workers <= 1 or len(spine) <= 1:
             for file in spine:
-                if file in z.namelist():
-                    with z.open(file) as f:
-                        filename = os.path.basename(file)
-                        extension = os.path.splitext(filename)[1].lower()
-                        mimetype = MIME_TYPE_MAPPING.get(extension)
-                        converted_content = self._html_converter.convert(
-                            f,
-                            StreamInfo(
-                                mimetype=mimetype,
-                                extension=extension,
-                                filename=filename,
-                            ),
-                        )
-                        markdown_content.append(converted_content.markdown.strip())
-
-            # Format and add the metadata
-            metadata_markdown = []
-            for key, value in metadata.items():
-                if isinstance(value, list):
-                    value = ", ".join(value)
-                if value:
-                    metadata_markdown.append(f"**{key.capitalize()}:** {value}")
-
-            markdown_content.insert(0, "\n".join(metadata_markdown))
-
-            return DocumentConverterResult(
-                markdown="\n\n".join(markdown_content), title=metadata["title"]
+                yield convert_chapter(file)
+            return
+
+        # Keep a bounded window of chapters in flight, so that memory use stays
+        # proportional to max_workers rather than to the size of the book.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: Deque[Future] = deque()
+            try:
+                for file in spine:
+                    pending.append(executor.submit(convert_chapter, file))
+                    if len(pending) >= 2 * max_workers:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _convert_chapter(self, z: zipfile.ZipFile, file: str) -> str:
+        with z.open(file) as f:
+            filename = os.path.basename(file)
+            extension = os.path.splitext(filename)[1].lower()
+            mimetype = MIME_TYPE_MAPPING.get(extension)
+            converted_content = self._html_converter.convert(
+                f,
+                StreamInfo(
+                    mimetype=mimetype,
+                    extension=extension,
+                    filename=filename,
+                ),
             )
+            return converted_content.markdown.strip()
 
     def _get_text_from_node(self, dom: Document, tag_name: str) -> str | None:
         """Convenience function to extract a single occurrence of a tag (e.g., title)."""
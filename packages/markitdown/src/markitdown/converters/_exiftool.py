@@ -1,7 +1,152 @@
+import atexit
+import contextlib
 import json
+import os
+import shutil
 import subprocess
 import locale
-from typing import BinaryIO, Any, Union
+import tempfile
+import threading
+from typing import BinaryIO, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# Maximum number of exiftool processes kept running for each exiftool_path, which
+# bounds how many files can have their metadata read concurrently
+POOL_SIZE = 4
+
+
+class _ExiftoolProcess:
+    """
+    A long-lived exiftool process, running in -stay_open mode, so that the cost of
+    starting Perl is paid once, rather than for every file.
+    """
+
+    def __init__(self, exiftool_path: str):
+        self._process = subprocess.Popen(
+            [exiftool_path, "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._requests = 0
+
+    def execute(self, *args: str) -> bytes:
+        """Run exiftool with the given arguments (one per line), returning its output."""
+        assert self._process.stdin is not None
+        assert self._process.stdout is not None
+
+        self._requests += 1
+        ready = f"{{ready{self._requests}}}".encode("ascii")
+        request = "".join(f"{arg}\n" for arg in args) + f"-execute{self._requests}\n"
+        self._process.stdin.write(request.encode("utf-8"))
+        self._process.stdin.flush()
+
+        # The output ends with a line echoing the request number
+        lines: List[bytes] = []
+        while True:
+            line = self._process.stdout.readline()
+            if not line:
+                raise subprocess.SubprocessError("exiftool exited unexpectedly")
+            if line.rstrip(b"\r\n") == ready:
+                return b"".join(lines)
+            lines.append(line)
+
+    def close(self) -> None:
+        try:
+            assert self._process.stdin is not None
+            self._process.stdin.write(b"-stay_open\nFalse\n")
+            self._process.stdin.close()
+            self._process.wait(timeout=5)
+        except Exception:
+            self._process.kill()
+            self._process.wait()
+        finally:
+            if self._process.stdout is not None:
+                self._process.stdout.close()
+
+
+class _ExiftoolPool:
+    """Up to max_size exiftool processes, started on demand, and reused."""
+
+    def __init__(self, exiftool_path: str, max_size: int):
+        self._exiftool_path = exiftool_path
+        self._max_size = max_size
+        self._idle: List[_ExiftoolProcess] = []
+        self._size = 0
+        self._condition = threading.Condition()
+
+    @contextlib.contextmanager
+    def process(self) -> Iterator[_ExiftoolProcess]:
+        """Borrow a process, waiting for one to become free if the pool is full."""
+        with self._condition:
+            while len(self._idle) == 0 and self._size >= self._max_size:
+                self._condition.wait()
+            if len(self._idle) > 0:
+                process: Optional[_ExiftoolProcess] = self._idle.pop()
+            else:
+                process = None
+                self._size += 1
+
+        try:
+            if process is None:
+                process = _ExiftoolProcess(self._exiftool_path)
+            yield process
+        except BaseException:
+            # The process may be part way through a request, so it is not reused
+            if process is not None:
+                process.close()
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        else:
+            with self._condition:
+                self._idle.append(process)
+                self._condition.notify()
+
+    def close(self) -> None:
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+        for process in idle:
+            process.close()
+
+
+# Pools are keyed by process id as well as path, so that forked children never
+# share the pipes of their parent's exiftool processes
+_pools: Dict[Tuple[int, str], _ExiftoolPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(exiftool_path: str) -> _ExiftoolPool:
+    key = (os.getpid(), exiftool_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _ExiftoolPool(exiftool_path, POOL_SIZE)
+            _pools[key] = pool
+        return pool
+
+
+@atexit.register
+def _close_pools() -> None:
+    with _pools_lock:
+        pools = [pool for (pid, _), pool in _pools.items() if pid == os.getpid()]
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def _local_path(file_stream: BinaryIO) -> Optional[str]:
+    """
+    The path of the file underlying the stream, if exiftool can read it directly
+    (i.e., the stream is a file opened from the start, at the start).
+    """
+    name = getattr(file_stream, "name", None)
+    if not isinstance(name, str) or "\n" in name or "\r" in name:
+        return None
+    if file_stream.tell() != 0 or not os.path.isfile(name):
+        return None
+    return os.path.abspath(name)
 
 
 def exiftool_metadata(
@@ -13,18 +158,26 @@ def exiftool_metadata(
     if not exiftool_path:
         return {}
 
-    # Run exiftool
+    # exiftool reads files by path, seeking to just the parts holding metadata.
+    # Streams that are not backed by a file are copied to a temporary one.
     cur_pos = file_stream.tell()
+    temp_path = None
     try:
-        output = subprocess.run(
-            [exiftool_path, "-json", "-"],
-            input=file_stream.read(),
-            capture_output=True,
-            text=False,
-        ).stdout
+        path = _local_path(file_stream)
+        if path is None:
+            fd, temp_path = tempfile.mkstemp()
+            with os.fdopen(fd, "wb") as fh:
+                shutil.copyfileobj(file_stream, fh)
+            path = temp_path
+
+        # Run exiftool
+        with _get_pool(exiftool_path).process() as process:
+            output = process.execute("-json", "-charset", "filename=utf8", path)
 
         return json.loads(
             output.decode(locale.getpreferredencoding(False)),
         )[0]
     finally:
         file_stream.seek(cur_pos)
+        if temp_path is not None:
+            os.unlink(temp_path)
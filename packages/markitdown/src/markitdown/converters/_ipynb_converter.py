@@ -1,9 +1,10 @@
-from typing import BinaryIO, Any
-import json
+from typing import BinaryIO, Any, Dict, List
+import io
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._exceptions import FileConversionException
 from .._stream_info import StreamInfo
+from ..converter_utils.json_stream import JsonStreamReader
 
 CANDIDATE_MIME_TYPE_PREFIXES = [
     "application/json",
@@ -11,6 +12,9 @@ CANDIDATE_MIME_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_EXTENSIONS = [".ipynb"]
 
+# Bytes read from each end of a candidate stream, when checking for a notebook
+SNIFF_SIZE = 64 * 1024
+
 
 class IpynbConverter(DocumentConverter):
     """Converts Jupyter Notebook (.ipynb) files to Markdown."""
@@ -30,63 +34,109 @@ class IpynbConverter(DocumentConverter):
         for prefix in CANDIDATE_MIME_TYPE_PREFIXES:
             if mimetype.startswith(prefix):
                 # Read further to see if it's a notebook
-                cur_pos = file_stream.tell()
-                try:
-                    encoding = stream_info.charset or "utf-8"
-                    notebook_content = file_stream.read().decode(encoding)
-                    return (
-                        "nbformat" in notebook_content
-                        and "nbformat_minor" in notebook_content
-                    )
-                finally:
-                    file_stream.seek(cur_pos)
+                return self._sniff_notebook(file_stream, stream_info)
 
         return False
 
+    def _sniff_notebook(self, file_stream: BinaryIO, stream_info: StreamInfo) -> bool:
+        """
+        Check for the top-level nbformat keys of a notebook. Writers put them either
+        first or (more often, since keys are sorted) last, so only the beginning and
+        the end of the stream are read, however large it is.
+        """
+        cur_pos = file_stream.tell()
+        try:
+            encoding = stream_info.charset or "utf-8"
+            head = file_stream.read(SNIFF_SIZE)
+            end_pos = file_stream.seek(0, io.SEEK_END)
+            if end_pos - cur_pos > 2 * SNIFF_SIZE:
+                file_stream.seek(end_pos - SNIFF_SIZE)
+                head += b"\n" + file_stream.read()
+            elif end_pos - cur_pos > SNIFF_SIZE:
+                file_stream.seek(cur_pos + SNIFF_SIZE)
+                head += file_stream.read()
+            notebook_content = head.decode(encoding, errors="ignore")
+            return (
+                "nbformat" in notebook_content and "nbformat_minor" in notebook_content
+            )
+        finally:
+            file_stream.seek(cur_pos)
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        # Parse and convert the notebook
+        """
+        Convert the notebook, streaming through its JSON. Cell outputs (often large,
+        embedded images) are skipped without being decoded, unless the
+        notebook_outputs option is set, in which case their text is rendered after
+        each code cell (images and other rich outputs are still skipped).
+        """
         encoding = stream_info.charset or "utf-8"
-        notebook_content = file_stream.read().decode(encoding=encoding)
-        return self._convert(json.loads(notebook_content))
-
-    def _convert(self, notebook_content: dict) -> DocumentConverterResult:
-        """Helper function that converts notebook JSON content to Markdown."""
-        try:
-            md_output = []
-            title = None
-
-            for cell in notebook_content.get("cells", []):
-                cell_type = cell.get("cell_type", "")
-                source_lines = cell.get("source", [])
-
-                if cell_type == "markdown":
-                    md_output.append("".join(source_lines))
+        render_outputs = bool(kwargs.get("notebook_outputs", False))
 
-                    # Extract the first # heading as title if not already found
-                    if title is None:
-                        for line in source_lines:
-                            if line.startswith("# "):
-                                title = line.lstrip("# ").strip()
-                                break
+        # Write cells through to the sink, if there is one (see PlainTextConverter)
+        sink = kwargs.get("_markdown_sink")
+        md_output: List[str] = []
+        first = True
 
-                elif cell_type == "code":
-                    # Code cells are wrapped in Markdown code blocks
-                    md_output.append(f"```python\n{''.join(source_lines)}\n```")
-                elif cell_type == "raw":
-                    md_output.append(f"```\n{''.join(source_lines)}\n```")
+        def emit(markdown: str) -> None:
+            nonlocal first
+            if sink is None:
+                md_output.append(markdown)
+            else:
+                sink.write(markdown if first else "\n\n" + markdown)
+            first = False
 
-            md_text = "\n\n".join(md_output)
+        try:
+            title = None
+            metadata_title = None
+            has_metadata_title = False
+
+            reader = JsonStreamReader(file_stream, encoding=encoding)
+            for key in reader.iter_object():
+                if key == "cells":
+                    for _ in reader.iter_array():
+                        cell = self._read_cell(reader, render_outputs)
+                        cell_type = cell.get("cell_type", "")
+                        source_lines = cell.get("source", [])
+
+                        if cell_type == "markdown":
+                            emit("".join(source_lines))
+
+                            # Extract the first # heading as title if not already found
+                            if title is None:
+                                for line in source_lines:
+                                    if line.startswith("# "):
+                                        title = line.lstrip("# ").strip()
+                                        break
+
+                        elif cell_type == "code":
+                            # Code cells are wrapped in Markdown code blocks
+                            emit(f"```python\n{''.join(source_lines)}\n```")
+                            if cell.get("outputs"):
+                                emit(f"```text\n{cell['outputs']}\n```")
+                        elif cell_type == "raw":
+                            emit(f"```\n{''.join(source_lines)}\n```")
+
+                elif key == "metadata":
+                    for metadata_key in reader.iter_object():
+                        if metadata_key == "title":
+                            metadata_title = reader.read_value()
+                            has_metadata_title = True
+                        else:
+                            reader.skip_value()
+                else:
+                    reader.skip_value()
 
             # Check for title in notebook metadata
-            title = notebook_content.get("metadata", {}).get("title", title)
+            if has_metadata_title:
+                title = metadata_title
 
             return DocumentConverterResult(
-                markdown=md_text,
+                markdown="\n\n".join(md_output),
                 title=title,
             )
 
@@ -94,3 +144,52 @@ class IpynbConverter(DocumentConverter):
             raise FileConversionException(
                 f"Error converting .ipynb file: {str(e)}"
             ) from e
+
+    def _read_cell(
+        self, reader: JsonStreamReader, render_outputs: bool
+    ) -> Dict[str, Any]:
+        """Read the parts of a cell that are rendered, skipping everything else (e.g., attachments)."""
+        cell: Dict[str, Any] = {}
+        for key in reader.iter_object():
+            if key in ("cell_type", "source"):
+                cell[key] = reader.read_value()
+            elif key == "outputs" and render_outputs:
+                cell[key] = self._read_outputs(reader)
+            else:
+                reader.skip_value()
+        return cell
+
+    def _read_outputs(self, reader: JsonStreamReader) -> str:
+        """Read the text of a cell's outputs, skipping images and other rich data."""
+        texts: List[str] = []
+        for _ in reader.iter_array():
+            output: Dict[str, Any] = {}
+            for key in reader.iter_object():
+                if key in ("output_type", "text", "ename", "evalue"):
+                    output[key] = reader.read_value()
+                elif key == "data":
+                    for mimetype in reader.iter_object():
+                        if mimetype == "text/plain":
+                            output[mimetype] = reader.read_value()
+                        else:
+                            reader.skip_value()
+                else:
+                    reader.skip_value()
+
+            output_type = output.get("output_type")
+            if output_type == "stream":
+                text = output.get("text", "")
+            elif output_type in ("execute_result", "display_data"):
+                text = output.get("text/plain", "")
+            elif output_type == "error":
+                text = f"{output.get('ename', '')}: {output.get('evalue', '')}"
+            else:
+                continue
+
+            # Multiline strings are stored either as a string, or as a list of lines
+            if isinstance(text, list):
+                text = "".join(text)
+            if text.strip():
+                texts.append(text.rstrip("\n"))
+
+        return "\n".join(texts)
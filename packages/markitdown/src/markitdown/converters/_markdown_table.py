@@ -0,0 +1,57 @@
+import re
+from typing import Any, Iterable, Sequence
+
+_NEWLINE_RE = re.compile(r"\s*[\r\n]+\s*")
+
+
+def _escape_cell(value: Any, escape_emphasis: bool = False) -> str:
+    """Render a single cell value so that it cannot break the table structure."""
+    if value is None:
+        return ""
+    text = value if isinstance(value, str) else str(value)
+    if escape_emphasis:
+        text = text.replace("*", "\\*").replace("_", "\\_")
+    if "|" in text:
+        text = text.replace("|", "\\|")
+    if "\n" in text or "\r" in text:
+        text = _NEWLINE_RE.sub(" ", text)
+    return text.strip()
+
+
+def markdown_table(
+    rows: Iterable[Sequence[Any]],
+    *,
+    escape_emphasis: bool = False,
+    pad_separator: bool = True,
+) -> str:
+    """
+    Render rows of cell values as a GitHub-flavored Markdown pipe table.
+
+    The first row is treated as the header, and determines the width of the
+    table: shorter rows are padded with empty cells, and longer rows are
+    truncated. Pipes in cell values are escaped, and line breaks are folded
+    into single spaces. Returns an empty string if there are no rows.
+
+    If escape_emphasis is set, asterisks and underscores are escaped too (as
+    markdownify does for HTML tables). If pad_separator is not set, the header
+    separator is written without spaces (|---|---|).
+    """
+    lines = []
+    width = 0
+    for row in rows:
+        cells = [_escape_cell(cell, escape_emphasis) for cell in row]
+        if not lines:
+            width = len(cells)
+            lines.append("| " + " | ".join(cells) + " |")
+            if pad_separator:
+                lines.append("| " + " | ".join(["---"] * width) + " |")
+            else:
+                lines.append("|" + "|".join(["---"] * width) + "|")
+            continue
+        if len(cells) < width:
+            cells.extend([""] * (width - len(cells)))
+        elif len(cells) > width:
+            del cells[width:]
+        lines.append("| " + " | ".join(cells) + " |")
+
+    return "\n".join(lines)
@@ -1,8 +1,21 @@
+import inspect
 import re
 import markdownify
 
 from typing import Any, Optional
 from urllib.parse import quote, unquote, urlparse, urlunparse
+from bs4 import BeautifulSoup
+
+# Whitespace normalization applied by markdownify to text outside of <pre> blocks
+_NEWLINE_WHITESPACE_RE = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+_WHITESPACE_RE = re.compile(r"[\t ]+")
+
+# The plain-text fast path mirrors markdownify 1.x, where escape() takes the
+# parent tags. Older versions normalize whitespace differently, so they always
+# go through the parser.
+_PLAIN_TEXT_FAST_PATH = (
+    "parent_tags" in inspect.signature(markdownify.MarkdownConverter.escape).parameters
+)
 
 
 class _CustomMarkdownify(markdownify.MarkdownConverter):
@@ -12,6 +25,7 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
     - Altering the default heading style to use '#', '##', etc.
     - Removing javascript hyperlinks.
     - Truncating images with large data:uri sources.
+    - Keeping image alt text on a single line.
     - Ensuring URIs are properly escaped, and do not conflict with Markdown syntax
     """
 
@@ -92,6 +106,8 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
         """Same as usual converter, but removes data URIs"""
 
         alt = el.attrs.get("alt", None) or ""
+        # Line breaks would otherwise break the image syntax
+        alt = re.sub(r"[\r\n]", " ", alt)
         src = el.attrs.get("src", None) or ""
         title = el.attrs.get("title", None) or ""
         title_part = ' "%s"' % title.replace('"', r"\"") if title else ""
@@ -109,3 +125,21 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
 
     def convert_soup(self, soup: Any) -> str:
         return super().convert_soup(soup)  # type: ignore
+
+    def convert_html(self, html: str) -> str:
+        """
+        Convert an HTML fragment. Plain text (without tags or character references)
+        does not need the HTML parser, so it is converted directly, with the same result.
+        """
+        if (
+            not _PLAIN_TEXT_FAST_PATH
+            or "<" in html
+            or "&" in html
+            or not html.strip()
+            or self.options.get("wrap")
+        ):
+            return self.convert_soup(BeautifulSoup(html, "html.parser"))
+
+        text = _NEWLINE_WHITESPACE_RE.sub("\n", html)
+        text = _WHITESPACE_RE.sub(" ", text)
+        return self.escape(text, set()).strip("\n")  # type: ignore
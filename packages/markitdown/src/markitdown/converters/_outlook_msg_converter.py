@@ -1,8 +1,31 @@
+import contextlib
+import os
+import shutil
 import sys
-from typing import Any, Union, BinaryIO
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Union, BinaryIO, List, Optional, Tuple, TYPE_CHECKING
 from .._stream_info import StreamInfo
 from .._base_converter import DocumentConverter, DocumentConverterResult
-from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
+from .._exceptions import (
+    FileConversionException,
+    MissingDependencyException,
+    MISSING_DEPENDENCY_MESSAGE,
+)
+from ._zip_converter import (
+    BATCH_MAX_MEMBERS,
+    BATCH_MAX_SIZE,
+    SPOOL_MAX_SIZE,
+    _ArchiveBudget,
+    raise_archive_limit,
+)
+
+# Break otherwise circular import for type hinting
+if TYPE_CHECKING:
+    from .._markitdown import MarkItDown
 
 # Try loading optional (but in this case, required) dependencies
 # Save reporting of any exceptions for later
@@ -20,6 +43,19 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_EXTENSIONS = [".msg"]
 
+# Storages holding each attachment, and the property streams within them
+ATTACHMENT_STORAGE_PREFIX = "__attach_version1.0_#"
+ATTACH_DATA_BINARY = "__substg1.0_37010102"
+ATTACH_DATA_OBJECT = "__substg1.0_3701000D"  # An embedded message
+ATTACH_LONG_FILENAME = "__substg1.0_3707001F"
+ATTACH_FILENAME = "__substg1.0_3704001F"
+ATTACH_EXTENSION = "__substg1.0_3703001F"
+ATTACH_MIME_TAG = "__substg1.0_370E001F"
+
+# An attachment's payload: its index, the path of its data stream, the size of
+# that stream, and what is known about it
+_Payload = Tuple[int, str, int, StreamInfo]
+
 
 class OutlookMsgConverter(DocumentConverter):
     """Converts Outlook .msg files to markdown by extracting email metadata and content.
@@ -27,8 +63,28 @@ class OutlookMsgConverter(DocumentConverter):
     Uses the olefile package to parse the .msg file structure and extract:
     - Email headers (From, To, Subject)
     - Email body content
+    - Attachments, each converted to markdown with the appropriate converter
+      (if a MarkItDown instance is given), and embedded messages, recursively
+
+    Attachments are read and converted in batches, bounded by count and total
+    size (as for ZIP members), with large ones spilled to temporary files. Batches
+    can be converted concurrently (pass `max_workers` > 1). Archives attached to a
+    message share the resource limits of any archive the message is in.
     """
 
+    def __init__(self, *, markitdown: Optional["MarkItDown"] = None):
+        super().__init__()
+        self._markitdown = markitdown
+
+        # Messages opened while checking candidate streams in accepts(), so that
+        # convert() need not parse the OLE directory again. Keyed by stream, and
+        # position. The cached messages are detached from their streams, so as
+        # not to keep the (weakly referenced) streams alive.
+        self._opened_msgs: "weakref.WeakKeyDictionary[Any, Tuple[int, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._opened_msgs_lock = threading.Lock()
+
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -59,10 +115,12 @@ class OutlookMsgConverter(DocumentConverter):
             if olefile is not None:
                 msg = olefile.OleFileIO(file_stream)
                 toc = "\n".join([str(stream) for stream in msg.listdir()])
-                return (
+                if (
                     "__properties_version1.0" in toc
                     and "__recip_version1.0_#00000000" in toc
-                )
+                ):
+                    self._cache_msg(file_stream, cur_pos, msg)
+                    return True
         except Exception as e:
             pass
         finally:
@@ -70,6 +128,25 @@ class OutlookMsgConverter(DocumentConverter):
 
         return False
 
+    def _cache_msg(self, file_stream: BinaryIO, cur_pos: int, msg: Any) -> None:
+        msg.fp = None
+        try:
+            with self._opened_msgs_lock:
+                self._opened_msgs[file_stream] = (cur_pos, msg)
+        except TypeError:
+            pass  # The stream does not support weak references, so is not cached
+
+    def _open_msg(self, file_stream: BinaryIO) -> Any:
+        """Open the message, reusing the directory parsed by accepts(), if any."""
+        assert olefile is not None
+        with self._opened_msgs_lock:
+            opened = self._opened_msgs.pop(file_stream, None)
+        if opened is not None and opened[0] == file_stream.tell():
+            msg = opened[1]
+            msg.fp = file_stream
+            return msg
+        return olefile.OleFileIO(file_stream)
+
     def convert(
         self,
         file_stream: BinaryIO,
@@ -93,16 +170,36 @@ class OutlookMsgConverter(DocumentConverter):
         assert (
             olefile is not None
         )  # If we made it this far, olefile should be available
-        msg = olefile.OleFileIO(file_stream)
+        # Archives attached to the message, or to its embedded messages, share a
+        # budget (that of the archive holding this message, if any)
+        kwargs["_zip_budget"] = kwargs.get("_zip_budget") or _ArchiveBudget()
+
+        msg = self._open_msg(file_stream)
+        try:
+            md_content, subject = self._convert_message(msg, "", **kwargs)
+        finally:
+            msg.close()
+
+        return DocumentConverterResult(
+            markdown=md_content.strip(),
+            title=subject,
+        )
 
+    def _convert_message(
+        self, msg: Any, prefix: str, **kwargs: Any
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Convert the message stored at prefix (the root, or the storage of an
+        embedded message), returning its markdown and subject.
+        """
         # Extract email metadata
         md_content = "# Email Message\n\n"
 
         # Get headers
         headers = {
-            "From": self._get_stream_data(msg, "__substg1.0_0C1F001F"),
-            "To": self._get_stream_data(msg, "__substg1.0_0E04001F"),
-            "Subject": self._get_stream_data(msg, "__substg1.0_0037001F"),
+            "From": self._get_stream_data(msg, prefix + "__substg1.0_0C1F001F"),
+            "To": self._get_stream_data(msg, prefix + "__substg1.0_0E04001F"),
+            "Subject": self._get_stream_data(msg, prefix + "__substg1.0_0037001F"),
         }
 
         # Add headers to markdown
@@ -113,16 +210,185 @@ class OutlookMsgConverter(DocumentConverter):
         md_content += "\n## Content\n\n"
 
         # Get email body
-        body = self._get_stream_data(msg, "__substg1.0_1000001F")
+        body = self._get_stream_data(msg, prefix + "__substg1.0_1000001F")
         if body:
             md_content += body
 
-        msg.close()
+        attachments = self._convert_attachments(msg, prefix, **kwargs)
+        if attachments:
+            md_content = md_content.rstrip() + "\n\n"
+            for filename, markdown in attachments:
+                md_content += f"## Attachment: {filename}\n\n"
+                if markdown:
+                    md_content += markdown.strip() + "\n\n"
 
-        return DocumentConverterResult(
-            markdown=md_content.strip(),
-            title=headers.get("Subject"),
+        return md_content, headers.get("Subject")
+
+    def _convert_attachments(
+        self, msg: Any, prefix: str, **kwargs: Any
+    ) -> List[Tuple[str, Optional[str]]]:
+        """
+        Convert the attachments of the message stored at prefix, in order, returning
+        each one's filename, and its markdown (or None if it could not be converted).
+        """
+        parent = [part for part in prefix.split("/") if part]
+        storages = sorted(
+            {
+                entry[len(parent)]
+                for entry in msg.listdir(streams=True, storages=True)
+                if len(entry) > len(parent)
+                and entry[: len(parent)] == parent
+                and entry[len(parent)].startswith(ATTACHMENT_STORAGE_PREFIX)
+            }
+        )
+
+        attachments: List[Tuple[str, Optional[str]]] = []
+        payloads: List[_Payload] = []
+        for storage in storages:
+            storage = prefix + storage + "/"
+            filename = (
+                self._get_stream_data(msg, storage + ATTACH_LONG_FILENAME)
+                or self._get_stream_data(msg, storage + ATTACH_FILENAME)
+                or storage.rstrip("/")[len(prefix) :]
+            )
+
+            if msg.exists(storage + ATTACH_DATA_OBJECT):
+                # Embedded messages are stored inline, so are converted in place
+                if msg.get_type(storage + ATTACH_DATA_OBJECT) == olefile.STGTY_STORAGE:
+                    markdown, _ = self._convert_message(
+                        msg, storage + ATTACH_DATA_OBJECT + "/", **kwargs
+                    )
+                    attachments.append((filename, markdown))
+                    continue
+
+            attachments.append((filename, None))
+            if self._markitdown is None or not msg.exists(storage + ATTACH_DATA_BINARY):
+                continue
+
+            # Payloads are only read when their batch is converted
+            extension = self._get_stream_data(msg, storage + ATTACH_EXTENSION)
+            payloads.append(
+                (
+                    len(attachments) - 1,
+                    storage + ATTACH_DATA_BINARY,
+                    msg.get_size(storage + ATTACH_DATA_BINARY),
+                    StreamInfo(
+                        mimetype=self._get_stream_data(msg, storage + ATTACH_MIME_TAG)
+                        or None,
+                        extension=extension or os.path.splitext(filename)[1] or None,
+                        filename=filename,
+                    ),
+                )
+            )
+
+        if len(payloads) == 0:
+            return attachments
+
+        # The OLE file cannot be read concurrently, so payloads are read under a
+        # lock. Attachments' stages are reported to the same on_stage callback.
+        convert_batch = partial(
+            self._convert_payloads,
+            msg,
+            threading.Lock(),
+            _zip_depth=kwargs.get("_zip_depth", 0),
+            _zip_budget=kwargs.get("_zip_budget"),
+            on_stage=kwargs.get("on_stage"),
         )
+        batches = self._batch_payloads(payloads)
+
+        # Batches are independent, so they can be converted concurrently
+        max_workers = kwargs.get("max_workers")
+        if max_workers is not None and max_workers > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(convert_batch, b) for b in batches]
+                try:
+                    results = [r for future in futures for r in future.result()]
+                except BaseException:
+                    # Abort early, e.g., if an attached archive hit a limit
+                    for future in futures:
+                        future.cancel()
+                    raise
+        else:
+            results = [r for batch in batches for r in convert_batch(batch)]
+
+        for (index, _, _, _), markdown in zip(payloads, results):
+            attachments[index] = (attachments[index][0], markdown)
+        return attachments
+
+    def _batch_payloads(self, payloads: List[_Payload]) -> List[List[_Payload]]:
+        """
+        Split payloads into consecutive batches of at most BATCH_MAX_MEMBERS, and
+        BATCH_MAX_SIZE bytes in total. Larger payloads get a batch to themselves.
+        """
+        batches: List[List[_Payload]] = []
+        batch_size = 0
+        for payload in payloads:
+            size = payload[2]
+            if (
+                len(batches) == 0
+                or len(batches[-1]) >= BATCH_MAX_MEMBERS
+                or batch_size + size > BATCH_MAX_SIZE
+            ):
+                batches.append([])
+                batch_size = 0
+            batches[-1].append(payload)
+            batch_size += size
+        return batches
+
+    def _convert_payloads(
+        self,
+        msg: Any,
+        read_lock: threading.Lock,
+        payloads: List[_Payload],
+        **kwargs: Any,
+    ) -> List[Optional[str]]:
+        """
+        Read, and convert, a batch of attachment payloads, whose content is
+        identified together. Failures are reported as None.
+        """
+        assert self._markitdown is not None
+        results: List[Optional[str]] = []
+        with contextlib.ExitStack() as stack:
+            with read_lock:
+                streams = [
+                    stack.enter_context(self._open_payload(msg, stream_path, size))
+                    for _, stream_path, size, _ in payloads
+                ]
+            for result in self._markitdown._convert_many(
+                streams,
+                [stream_info for _, _, _, stream_info in payloads],
+                trust_extension=True,
+                **kwargs,
+            ):
+                if isinstance(result, FileConversionException):
+                    # Limits hit by attached archives abort the whole conversion
+                    raise_archive_limit(result)
+                    results.append(None)
+                elif isinstance(result, DocumentConverterResult):
+                    results.append(result.markdown)
+                else:
+                    results.append(None)
+        return results
+
+    def _open_payload(self, msg: Any, stream_path: str, size: int) -> BinaryIO:
+        """
+        Open a seekable copy of a payload. olefile reads a stream into memory
+        when it is opened, so larger payloads are then moved to a temporary file
+        (deleted once it is closed), rather than held for the whole batch.
+        """
+        stream = msg.openstream(stream_path)
+        if size <= SPOOL_MAX_SIZE:
+            return stream
+
+        buffer = tempfile.TemporaryFile()
+        try:
+            with stream:
+                shutil.copyfileobj(stream, buffer)
+        except BaseException:
+            buffer.close()
+            raise
+        buffer.seek(0)
+        return buffer  # type: ignore[return-value]
 
     def _get_stream_data(self, msg: Any, stream_path: str) -> Union[str, None]:
         """Helper to safely extract and decode stream data from the MSG file."""
@@ -1,6 +1,7 @@
 import sys
+import codecs
 
-from typing import BinaryIO, Any
+from typing import BinaryIO, Any, List
 from charset_normalizer import from_bytes
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
@@ -20,6 +21,9 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
     "application/markdown",
 ]
 
+# Size of the chunks in which text is decoded
+CHUNK_SIZE = 1024 * 1024
+
 ACCEPTED_FILE_EXTENSIONS = [
     ".txt",
     ".text",
@@ -63,9 +67,23 @@ class PlainTextConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        if stream_info.charset:
-            text_content = file_stream.read().decode(stream_info.charset)
-        else:
+        if not stream_info.charset:
             text_content = str(from_bytes(file_stream.read()).best())
+            return DocumentConverterResult(markdown=text_content)
+
+        # Decode in chunks, so that the raw bytes are never held in memory all at
+        # once. If the caller provided a sink, the text is passed straight through
+        # to it, so even very large files (e.g., JSONL logs) use little memory.
+        sink = kwargs.get("_markdown_sink")
+        text_parts: List[str] = []
+        write = text_parts.append if sink is None else sink.write
+
+        decoder = codecs.getincrementaldecoder(stream_info.charset)()
+        while True:
+            chunk = file_stream.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            write(decoder.decode(chunk))
+        write(decoder.decode(b"", final=True))
 
-        return DocumentConverterResult(markdown=text_content)
+        return DocumentConverterResult(markdown="".join(text_parts))
@@ -3,13 +3,14 @@ import base64
 import os
 import io
 import re
-import html
 
 from typing import BinaryIO, Any
 from operator import attrgetter
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
-from ._html_converter import HtmlConverter
 from ._llm_caption import llm_caption
+from ._markdown_table import markdown_table
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
@@ -38,7 +39,6 @@ class PptxConverter(DocumentConverter):
 
     def __init__(self):
         super().__init__()
-        self._html_converter = HtmlConverter()
 
     def accepts(
         self,
@@ -78,114 +78,131 @@ class PptxConverter(DocumentConverter):
                 _dependency_exc_info[2]
             )
 
-        # Perform the conversion
+        # Perform the conversion. Each slide is rendered independently, and
+        # the results are joined once at the end.
         presentation = pptx.Presentation(file_stream)
-        md_content = ""
-        slide_num = 0
-        for slide in presentation.slides:
-            slide_num += 1
-
-            md_content += f"\n\n<!-- Slide number: {slide_num} -->\n"
-
-            title = slide.shapes.title
-
-            def get_shape_content(shape, **kwargs):
-                nonlocal md_content
-                # Pictures
-                if self._is_picture(shape):
-                    # https://github.com/scanny/python-pptx/pull/512#issuecomment-1713100069
-
-                    llm_description = ""
-                    alt_text = ""
-
-                    # Potentially generate a description using an LLM
-                    llm_client = kwargs.get("llm_client")
-                    llm_model = kwargs.get("llm_model")
-                    if llm_client is not None and llm_model is not None:
-                        # Prepare a file_stream and stream_info for the image data
-                        image_filename = shape.image.filename
-                        image_extension = None
-                        if image_filename:
-                            image_extension = os.path.splitext(image_filename)[1]
-                        image_stream_info = StreamInfo(
-                            mimetype=shape.image.content_type,
-                            extension=image_extension,
-                            filename=image_filename,
-                        )
-
-                        image_stream = io.BytesIO(shape.image.blob)
-
-                        # Caption the image
-                        try:
-                            llm_description = llm_caption(
-                                image_stream,
-                                image_stream_info,
-                                client=llm_client,
-                                model=llm_model,
-                                prompt=kwargs.get("llm_prompt"),
-                            )
-                        except Exception:
-                            # Unable to generate a description
-                            pass
-
-                    # Also grab any description embedded in the deck
+        slides = list(presentation.slides)
+
+        max_workers = kwargs.get("max_workers")
+        if max_workers is not None and max_workers > 1 and len(slides) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                slide_content = list(
+                    executor.map(
+                        partial(self._convert_slide, **kwargs),
+                        slides,
+                        range(1, len(slides) + 1),
+                    )
+                )
+        else:
+            slide_content = [
+                self._convert_slide(slide, slide_num, **kwargs)
+                for slide_num, slide in enumerate(slides, start=1)
+            ]
+
+        return DocumentConverterResult(markdown="\n\n".join(slide_content).strip())
+
+    def _convert_slide(self, slide, slide_num: int, **kwargs: Any) -> str:
+        """Render a single slide (including its notes) to Markdown."""
+        md_parts = [f"<!-- Slide number: {slide_num} -->\n"]
+
+        title = slide.shapes.title
+
+        def get_shape_content(shape, **kwargs):
+            # Pictures
+            if self._is_picture(shape):
+                # https://github.com/scanny/python-pptx/pull/512#issuecomment-1713100069
+
+                llm_description = ""
+                alt_text = ""
+
+                # Potentially generate a description using an LLM
+                llm_client = kwargs.get("llm_client")
+                llm_model = kwargs.get("llm_model")
+                if llm_client is not None and llm_model is not None:
+                    # Prepare a file_stream and stream_info for the image data
+                    image_filename = shape.image.filename
+                    image_extension = None
+                    if image_filename:
+                        image_extension = os.path.splitext(image_filename)[1]
+                    image_stream_info = StreamInfo(
+                        mimetype=shape.image.content_type,
+                        extension=image_extension,
+                        filename=image_filename,
+                    )
+
+                    image_stream = io.BytesIO(shape.image.blob)
+
+                    # Caption the image
                     try:
-                        alt_text = shape._element._nvXxPr.cNvPr.attrib.get("descr", "")
+                        llm_description = llm_caption(
+                            image_stream,
+                            image_stream_info,
+                            client=llm_client,
+                            model=llm_model,
+                            prompt=kwargs.get("llm_prompt"),
+                        )
                     except Exception:
-                        # Unable to get alt text
+                        # Unable to generate a description
                         pass
 
-                    # Prepare the alt, escaping any special characters
-                    alt_text = "\n".join([llm_description, alt_text]) or shape.name
-                    alt_text = re.sub(r"[\r\n\[\]]", " ", alt_text)
-                    alt_text = re.sub(r"\s+", " ", alt_text).strip()
-
-                    # If keep_data_uris is True, use base64 encoding for images
-                    if kwargs.get("keep_data_uris", False):
-                        blob = shape.image.blob
-                        content_type = shape.image.content_type or "image/png"
-                        b64_string = base64.b64encode(blob).decode("utf-8")
-                        md_content += f"\n![{alt_text}](data:{content_type};base64,{b64_string})\n"
-                    else:
-                        # A placeholder name
-                        filename = re.sub(r"\W", "", shape.name) + ".jpg"
-                        md_content += "\n![" + alt_text + "](" + filename + ")\n"
-
-                # Tables
-                if self._is_table(shape):
-                    md_content += self._convert_table_to_markdown(shape.table, **kwargs)
-
-                # Charts
-                if shape.has_chart:
-                    md_content += self._convert_chart_to_markdown(shape.chart)
-
-                # Text areas
-                elif shape.has_text_frame:
-                    if shape == title:
-                        md_content += "# " + shape.text.lstrip() + "\n"
-                    else:
-                        md_content += shape.text + "\n"
-
-                # Group Shapes
-                if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP:
-                    sorted_shapes = sorted(shape.shapes, key=attrgetter("top", "left"))
-                    for subshape in sorted_shapes:
-                        get_shape_content(subshape, **kwargs)
-
-            sorted_shapes = sorted(slide.shapes, key=attrgetter("top", "left"))
-            for shape in sorted_shapes:
-                get_shape_content(shape, **kwargs)
-
-            md_content = md_content.strip()
-
-            if slide.has_notes_slide:
-                md_content += "\n\n### Notes:\n"
-                notes_frame = slide.notes_slide.notes_text_frame
-                if notes_frame is not None:
-                    md_content += notes_frame.text
-                md_content = md_content.strip()
-
-        return DocumentConverterResult(markdown=md_content.strip())
+                # Also grab any description embedded in the deck
+                try:
+                    alt_text = shape._element._nvXxPr.cNvPr.attrib.get("descr", "")
+                except Exception:
+                    # Unable to get alt text
+                    pass
+
+                # Prepare the alt, escaping any special characters
+                alt_text = "\n".join([llm_description, alt_text]) or shape.name
+                alt_text = re.sub(r"[\r\n\[\]]", " ", alt_text)
+                alt_text = re.sub(r"\s+", " ", alt_text).strip()
+
+                # If keep_data_uris is True, use base64 encoding for images
+                if kwargs.get("keep_data_uris", False):
+                    blob = shape.image.blob
+                    content_type = shape.image.content_type or "image/png"
+                    b64_string = base64.b64encode(blob).decode("utf-8")
+                    md_parts.append(
+                        f"\n![{alt_text}](data:{content_type};base64,{b64_string})\n"
+                    )
+                else:
+                    # A placeholder name
+                    filename = re.sub(r"\W", "", shape.name) + ".jpg"
+                    md_parts.append("\n![" + alt_text + "](" + filename + ")\n")
+
+            # Tables
+            if self._is_table(shape):
+                md_parts.append(self._convert_table_to_markdown(shape.table, **kwargs))
+
+            # Charts
+            if shape.has_chart:
+                md_parts.append(self._convert_chart_to_markdown(shape.chart))
+
+            # Text areas
+            elif shape.has_text_frame:
+                if shape == title:
+                    md_parts.append("# " + shape.text.lstrip() + "\n")
+                else:
+                    md_parts.append(shape.text + "\n")
+
+            # Group Shapes
+            if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP:
+                sorted_shapes = sorted(shape.shapes, key=attrgetter("top", "left"))
+                for subshape in sorted_shapes:
+                    get_shape_content(subshape, **kwargs)
+
+        sorted_shapes = sorted(slide.shapes, key=attrgetter("top", "left"))
+        for shape in sorted_shapes:
+            get_shape_content(shape, **kwargs)
+
+        md_content = "".join(md_parts).strip()
+
+        if slide.has_notes_slide:
+            notes_frame = slide.notes_slide.notes_text_frame
+            notes = notes_frame.text if notes_frame is not None else ""
+            md_content = (md_content + "\n\n### Notes:\n" + notes).strip()
+
+        return md_content
 
     def _is_picture(self, shape):
         if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
@@ -201,24 +218,8 @@ class PptxConverter(DocumentConverter):
         return False
 
     def _convert_table_to_markdown(self, table, **kwargs):
-        # Write the table as HTML, then convert it to Markdown
-        html_table = "<html><body><table>"
-        first_row = True
-        for row in table.rows:
-            html_table += "<tr>"
-            for cell in row.cells:
-                if first_row:
-                    html_table += "<th>" + html.escape(cell.text) + "</th>"
-                else:
-                    html_table += "<td>" + html.escape(cell.text) + "</td>"
-            html_table += "</tr>"
-            first_row = False
-        html_table += "</table></body></html>"
-
-        return (
-            self._html_converter.convert_string(html_table, **kwargs).markdown.strip()
-            + "\n"
-        )
+        rows = ([cell.text for cell in row.cells] for row in table.rows)
+        return markdown_table(rows, escape_emphasis=True) + "\n"
 
     def _convert_chart_to_markdown(self, chart):
         try:
@@ -237,12 +238,7 @@ class PptxConverter(DocumentConverter):
                     row.append(series.values[idx])
                 data.append(row)
 
-            markdown_table = []
-            for row in data:
-                markdown_table.append("| " + " | ".join(map(str, row)) + " |")
-            header = markdown_table[0]
-            separator = "|" + "|".join(["---"] * len(data[0])) + "|"
-            return md + "\n".join([header, separator] + markdown_table[1:])
+            return md + markdown_table(data, pad_separator=False)
         except ValueError as e:
             # Handle the specific error for unsupported chart types
             if "unsupported plot type" in str(e):
@@ -1,7 +1,8 @@
-from defusedxml import minidom
-from xml.dom.minidom import Document, Element
-from typing import BinaryIO, Any, Union
-from bs4 import BeautifulSoup
+import threading
+import weakref
+from dataclasses import dataclass
+from defusedxml.ElementTree import iterparse
+from typing import BinaryIO, Any, Dict, List, Optional, Tuple
 
 from ._markdownify import _CustomMarkdownify
 from .._stream_info import StreamInfo
@@ -26,12 +27,105 @@ CANDIDATE_FILE_EXTENSIONS = [
 ]
 
 
+@dataclass
+class _Feed:
+    """The parts of an RSS or Atom feed that are rendered to Markdown."""
+
+    feed_type: str
+    fields: Dict[str, Optional[str]]
+    entries: List[Dict[str, Optional[str]]]
+
+
+class _FeedBuilder:
+    """
+    Collects a feed container (an RSS channel, or an Atom feed), and the entries
+    within it, from a stream of parse events. Like getElementsByTagName, the text
+    of each field is taken from the first descendant with that (qualified) name.
+    """
+
+    def __init__(
+        self,
+        parent_tag: Optional[str],
+        container_tag: str,
+        container_fields: List[str],
+        entry_tag: str,
+        entry_fields: List[str],
+    ):
+        self.parent_tag = parent_tag
+        self.container_tag = container_tag
+        self.container_fields = container_fields
+        self.entry_tag = entry_tag
+        self.entry_fields = entry_fields
+
+        self.found_parent = parent_tag is None
+        self.found_container = False
+        self.fields: Dict[str, Optional[str]] = {}
+        self.entries: List[Dict[str, Optional[str]]] = []
+
+        self._parent: Any = None
+        self._container: Any = None
+        self._entry: Any = None
+        self._pending: Dict[Any, List[Tuple[Dict[str, Optional[str]], str]]] = {}
+
+    def start(self, elem: Any, tag: str) -> None:
+        if not self.found_parent:
+            if tag == self.parent_tag:
+                self.found_parent = True
+                self._parent = elem
+            return
+
+        if not self.found_container:
+            if tag == self.container_tag and (
+                self.parent_tag is None or self._parent is not None
+            ):
+                self.found_container = True
+                self._container = elem
+            return
+
+        if self._container is None:
+            return
+
+        if tag in self.container_fields and tag not in self.fields:
+            self._await_text(elem, self.fields, tag)
+
+        if self._entry is None:
+            if tag == self.entry_tag:
+                self._entry = elem
+                self.entries.append({})
+        elif tag in self.entry_fields and tag not in self.entries[-1]:
+            self._await_text(elem, self.entries[-1], tag)
+
+    def end(self, elem: Any) -> None:
+        for fields, tag in self._pending.pop(elem, []):
+            fields[tag] = elem.text
+
+        if elem is self._entry:
+            self._entry = None
+        elif elem is self._container:
+            self._container = None
+        elif elem is self._parent:
+            self._parent = None
+
+    def _await_text(
+        self, elem: Any, fields: Dict[str, Optional[str]], tag: str
+    ) -> None:
+        # The text of an element is only complete at its end event
+        fields[tag] = None
+        self._pending.setdefault(elem, []).append((fields, tag))
+
+
 class RssConverter(DocumentConverter):
     """Convert RSS / Atom type to markdown"""
 
     def __init__(self):
         super().__init__()
-        self._kwargs = {}
+
+        # Feeds parsed while checking candidate streams in accepts(), so that
+        # convert() need not parse them again. Keyed by stream, and position.
+        self._parsed_feeds: "weakref.WeakKeyDictionary[Any, Tuple[int, _Feed]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._parsed_feeds_lock = threading.Lock()
 
     def accepts(
         self,
@@ -63,130 +157,178 @@ class RssConverter(DocumentConverter):
     def _check_xml(self, file_stream: BinaryIO) -> bool:
         cur_pos = file_stream.tell()
         try:
-            doc = minidom.parse(file_stream)
-            return self._feed_type(doc) is not None
+            feed = self._parse_feed(file_stream)
         except BaseException as _:
-            pass
+            return False
         finally:
             file_stream.seek(cur_pos)
-        return False
 
-    def _feed_type(self, doc: Any) -> str | None:
-        if doc.getElementsByTagName("rss"):
-            return "rss"
-        elif doc.getElementsByTagName("feed"):
-            root = doc.getElementsByTagName("feed")[0]
-            if root.getElementsByTagName("entry"):
-                # An Atom feed must have a root element of <feed> and at least one <entry>
-                return "atom"
+        if feed is None:
+            return False
+
+        try:
+            with self._parsed_feeds_lock:
+                self._parsed_feeds[file_stream] = (cur_pos, feed)
+        except TypeError:
+            pass  # The stream does not support weak references, so is not cached
+        return True
+
+    def _parse_feed(self, file_stream: BinaryIO) -> Optional[_Feed]:
+        """
+        Parse an RSS or Atom feed in a single streaming pass, returning None if the
+        document is well-formed XML, but not a feed. Elements are discarded as soon
+        as they have been read, so memory use does not grow with the number of entries.
+        """
+        rss = _FeedBuilder(
+            "rss",
+            "channel",
+            ["title", "description"],
+            "item",
+            ["title", "description", "pubDate", "content:encoded"],
+        )
+        atom = _FeedBuilder(
+            None,
+            "feed",
+            ["title", "subtitle"],
+            "entry",
+            ["title", "summary", "updated", "content"],
+        )
+
+        # Element names are matched by their qualified name (i.e., with the prefix
+        # used in the document), so keep track of the prefix bound to each namespace.
+        prefixes: List[Dict[str, str]] = [{}]
+        declared: Dict[str, str] = {}
+        elements: List[Any] = []
+
+        for event, item in iterparse(file_stream, events=("start-ns", "start", "end")):
+            if event == "start-ns":
+                prefix, uri = item
+                declared[uri] = prefix
+            elif event == "start":
+                if declared:
+                    prefixes.append({**prefixes[-1], **declared})
+                    declared = {}
+                else:
+                    prefixes.append(prefixes[-1])
+                elements.append(item)
+
+                tag = self._qualified_name(item.tag, prefixes[-1])
+                rss.start(item, tag)
+                atom.start(item, tag)
+            else:
+                rss.end(item)
+                atom.end(item)
+                prefixes.pop()
+                elements.pop()
+
+                # Everything needed from the element has been read, so detach it
+                if elements and len(elements[-1]) and elements[-1][-1] is item:
+                    del elements[-1][-1]
+
+        if rss.found_parent:
+            if not rss.found_container:
+                raise ValueError("No channel found in RSS feed")
+            return _Feed(feed_type="rss", fields=rss.fields, entries=rss.entries)
+        elif atom.found_container and atom.entries:
+            # An Atom feed must have a root element of <feed> and at least one <entry>
+            return _Feed(feed_type="atom", fields=atom.fields, entries=atom.entries)
         return None
 
+    def _qualified_name(self, tag: str, prefixes: Dict[str, str]) -> str:
+        if tag[:1] != "{":
+            return tag
+        uri, _, local_name = tag[1:].partition("}")
+        prefix = prefixes.get(uri)
+        return f"{prefix}:{local_name}" if prefix else local_name
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        self._kwargs = kwargs
-        doc = minidom.parse(file_stream)
-        feed_type = self._feed_type(doc)
-
-        if feed_type == "rss":
-            return self._parse_rss_type(doc)
-        elif feed_type == "atom":
-            return self._parse_atom_type(doc)
+        feed = None
+        with self._parsed_feeds_lock:
+            parsed = self._parsed_feeds.pop(file_stream, None)
+        if parsed is not None and parsed[0] == file_stream.tell():
+            feed = parsed[1]
         else:
+            feed = self._parse_feed(file_stream)
+
+        if feed is None:
             raise ValueError("Unknown feed type")
 
-    def _parse_atom_type(self, doc: Document) -> DocumentConverterResult:
-        """Parse the type of an Atom feed.
+        # One converter is shared by all items, rather than created per item
+        markdownify = _CustomMarkdownify(**kwargs)
+        if feed.feed_type == "rss":
+            return self._parse_rss_type(feed, markdownify)
+        else:
+            return self._parse_atom_type(feed, markdownify)
 
-        Returns None if the feed type is not recognized or something goes wrong.
-        """
-        root = doc.getElementsByTagName("feed")[0]
-        title = self._get_data_by_tag_name(root, "title")
-        subtitle = self._get_data_by_tag_name(root, "subtitle")
-        entries = root.getElementsByTagName("entry")
-        md_text = f"# {title}\n"
+    def _parse_atom_type(
+        self, feed: _Feed, markdownify: _CustomMarkdownify
+    ) -> DocumentConverterResult:
+        """Render an Atom feed."""
+        title = feed.fields.get("title")
+        subtitle = feed.fields.get("subtitle")
+        md_parts = [f"# {title}\n"]
         if subtitle:
-            md_text += f"{subtitle}\n"
-        for entry in entries:
-            entry_title = self._get_data_by_tag_name(entry, "title")
-            entry_summary = self._get_data_by_tag_name(entry, "summary")
-            entry_updated = self._get_data_by_tag_name(entry, "updated")
-            entry_content = self._get_data_by_tag_name(entry, "content")
+            md_parts.append(f"{subtitle}\n")
+        for entry in feed.entries:
+            entry_title = entry.get("title")
+            entry_summary = entry.get("summary")
+            entry_updated = entry.get("updated")
+            entry_content = entry.get("content")
 
             if entry_title:
-                md_text += f"\n## {entry_title}\n"
+                md_parts.append(f"\n## {entry_title}\n")
             if entry_updated:
-                md_text += f"Updated on: {entry_updated}\n"
+                md_parts.append(f"Updated on: {entry_updated}\n")
             if entry_summary:
-                md_text += self._parse_content(entry_summary)
+                md_parts.append(self._parse_content(entry_summary, markdownify))
             if entry_content:
-                md_text += self._parse_content(entry_content)
+                md_parts.append(self._parse_content(entry_content, markdownify))
 
         return DocumentConverterResult(
-            markdown=md_text,
+            markdown="".join(md_parts),
             title=title,
         )
 
-    def _parse_rss_type(self, doc: Document) -> DocumentConverterResult:
-        """Parse the type of an RSS feed.
-
-        Returns None if the feed type is not recognized or something goes wrong.
-        """
-        root = doc.getElementsByTagName("rss")[0]
-        channel_list = root.getElementsByTagName("channel")
-        if not channel_list:
-            raise ValueError("No channel found in RSS feed")
-        channel = channel_list[0]
-        channel_title = self._get_data_by_tag_name(channel, "title")
-        channel_description = self._get_data_by_tag_name(channel, "description")
-        items = channel.getElementsByTagName("item")
+    def _parse_rss_type(
+        self, feed: _Feed, markdownify: _CustomMarkdownify
+    ) -> DocumentConverterResult:
+        """Render an RSS feed."""
+        channel_title = feed.fields.get("title")
+        channel_description = feed.fields.get("description")
+        md_parts = []
         if channel_title:
-            md_text = f"# {channel_title}\n"
+            md_parts.append(f"# {channel_title}\n")
         if channel_description:
-            md_text += f"{channel_description}\n"
-        for item in items:
-            title = self._get_data_by_tag_name(item, "title")
-            description = self._get_data_by_tag_name(item, "description")
-            pubDate = self._get_data_by_tag_name(item, "pubDate")
-            content = self._get_data_by_tag_name(item, "content:encoded")
+            md_parts.append(f"{channel_description}\n")
+        for item in feed.entries:
+            title = item.get("title")
+            description = item.get("description")
+            pubDate = item.get("pubDate")
+            content = item.get("content:encoded")
 
             if title:
-                md_text += f"\n## {title}\n"
+                md_parts.append(f"\n## {title}\n")
             if pubDate:
-                md_text += f"Published on: {pubDate}\n"
+                md_parts.append(f"Published on: {pubDate}\n")
             if description:
-                md_text += self._parse_content(description)
+                md_parts.append(self._parse_content(description, markdownify))
             if content:
-                md_text += self._parse_content(content)
+                md_parts.append(self._parse_content(content, markdownify))
 
         return DocumentConverterResult(
-            markdown=md_text,
+            markdown="".join(md_parts),
             title=channel_title,
         )
 
-    def _parse_content(self, content: str) -> str:
+    def _parse_content(self, content: str, markdownify: _CustomMarkdownify) -> str:
         """Parse the content of an RSS feed item"""
         try:
-            # using bs4 because many RSS feeds have HTML-styled content
-            soup = BeautifulSoup(content, "html.parser")
-            return _CustomMarkdownify(**self._kwargs).convert_soup(soup)
+            # many RSS feeds have HTML-styled content
+            return markdownify.convert_html(content)
         except BaseException as _:
             return content
-
-    def _get_data_by_tag_name(
-        self, element: Element, tag_name: str
-    ) -> Union[str, None]:
-        """Get data from first child element with the given tag name.
-        Returns None when no such element is found.
-        """
-        nodes = element.getElementsByTagName(tag_name)
-        if not nodes:
-            return None
-        fc = nodes[0].firstChild
-        if fc:
-            if hasattr(fc, "data"):
-                return fc.data
-        return None
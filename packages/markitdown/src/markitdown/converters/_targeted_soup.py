@@ -0,0 +1,78 @@
+from typing import Any, BinaryIO, Dict, Optional, Sequence, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml builds trees considerably faster than html.parser, but is an optional dependency
+try:
+    import lxml  # noqa: F401
+
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+# A tag to keep, as (tag name or None for any, attribute name or None, attribute value).
+# Class attributes match if any of their space-separated values match.
+TagTarget = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+class _TargetStrainer(SoupStrainer):
+    """
+    A SoupStrainer that keeps any tag matching one of several targets (and
+    everything inside it), so that BeautifulSoup builds only those subtrees.
+    Tags that match are kept wherever they occur, so find() and find_all() on
+    the resulting soup return the same elements as on the full document.
+    """
+
+    def __init__(self, targets: Sequence[TagTarget]):
+        super().__init__()
+        self._targets = targets
+
+    def _wanted(self, name: str, attrs: Optional[Dict[str, Any]]) -> bool:
+        for target_name, attr, value in self._targets:
+            if target_name is not None and target_name != name:
+                continue
+            if attr is None:
+                return True
+            attr_value = (attrs or {}).get(attr)
+            if attr_value is None:
+                continue
+            if not isinstance(attr_value, str):
+                attr_value = " ".join(attr_value)
+            if attr == "class":
+                if value in attr_value.split():
+                    return True
+            elif attr_value == value:
+                return True
+        return False
+
+    # beautifulsoup4 >= 4.13
+    def allow_tag_creation(
+        self, nsprefix: Optional[str], name: str, attrs: Optional[Dict[str, Any]]
+    ) -> bool:
+        return self._wanted(name, attrs)
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+    # beautifulsoup4 < 4.13, which calls search_tag with the name and attributes
+    # of each tag as it is parsed
+    def search_tag(self, markup_name: Any = None, markup_attrs: Any = {}) -> Any:
+        if isinstance(markup_name, str):
+            return markup_name if self._wanted(markup_name, markup_attrs) else None
+        return super().search_tag(markup_name, markup_attrs)  # type: ignore[misc]
+
+
+def parse_targets(
+    file_stream: BinaryIO,
+    encoding: str,
+    targets: Sequence[TagTarget],
+) -> BeautifulSoup:
+    """
+    Parse only the parts of an HTML document matching the targets. Navigation,
+    sidebars, and other page chrome are tokenized but never built into the tree.
+    """
+    return BeautifulSoup(
+        file_stream,
+        PARSER,
+        from_encoding=encoding,
+        parse_only=_TargetStrainer(targets),
+    )
@@ -1,6 +1,14 @@
-import io
+import array
+import contextlib
+import os
+import shutil
+import subprocess
 import sys
-from typing import BinaryIO
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, BinaryIO, Callable, Deque, Dict, Iterator, List, Optional, Union
 from .._exceptions import MissingDependencyException
 
 # Try loading optional (but in this case, required) dependencies
@@ -19,8 +27,210 @@ except ImportError:
     # Preserve the error and stack trace for later
     _dependency_exc_info = sys.exc_info()
 
+# Audio is transcribed in chunks of at most this many seconds, each of which ends
+# at the quietest moment within its last SILENCE_SEARCH_SECONDS, so that words
+# are rarely cut in two
+CHUNK_SECONDS = 30
+SILENCE_SEARCH_SECONDS = 5
+SILENCE_FRAME_SECONDS = 0.05
 
-def transcribe_audio(file_stream: BinaryIO, *, audio_format: str = "wav") -> str:
+
+class SpeechBackend:
+    """
+    A speech recognition engine, which transcribes chunks of audio (instances of
+    speech_recognition.AudioData).
+
+    Subclasses implement transcribe() (returning "" for chunks without speech), and
+    may implement transcribe_batch(), to transcribe several chunks in one call, and
+    load() and unload(), for engines with a costly setup, such as loading a model.
+
+    A backend is loaded when first used, and stays loaded until it is closed, so
+    passing one backend to several conversions (e.g., with
+    `MarkItDown(speech_recognizer=backend)`) pays for the setup once. Backends
+    can be used as context managers, which close them on exit.
+
+    At most max_concurrency calls to the engine run at once, across all conversions
+    sharing the backend, however many workers the conversions use. Chunks are
+    passed to the engine batch_size at a time.
+    """
+
+    def __init__(self, *, max_concurrency: Optional[int] = None, batch_size: int = 1):
+        self.batch_size = max(1, batch_size)
+        self._semaphore = (
+            threading.BoundedSemaphore(max_concurrency)
+            if max_concurrency is not None
+            else None
+        )
+        self._load_lock = threading.Lock()
+        self._loaded = False
+
+    def load(self) -> None:
+        """Set up the engine. Called once, before the first chunk is transcribed."""
+        pass
+
+    def unload(self) -> None:
+        """Release the engine's resources. Called when the backend is closed."""
+        pass
+
+    def transcribe(self, audio: Any) -> str:
+        """Transcribe a single chunk of audio."""
+        raise NotImplementedError()
+
+    def transcribe_batch(self, chunks: List[Any]) -> List[str]:
+        """Transcribe several chunks of audio, returning their transcripts in order."""
+        return [self.transcribe(chunk) for chunk in chunks]
+
+    def close(self) -> None:
+        with self._load_lock:
+            if self._loaded:
+                self._loaded = False
+                self.unload()
+
+    def __enter__(self) -> "SpeechBackend":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _run(self, chunks: List[Any]) -> List[str]:
+        with self._load_lock:
+            if not self._loaded:
+                self.load()
+                self._loaded = True
+
+        if self._semaphore is None:
+            return self.transcribe_batch(chunks)
+        with self._semaphore:
+            return self.transcribe_batch(chunks)
+
+
+class RecognizerBackend(SpeechBackend):
+    """
+    Transcribes audio with one of speech_recognition's engines, given by name
+    (e.g., "google", or one that runs locally, such as "sphinx" or "vosk"), or with
+    a function that takes a chunk of audio and returns its transcript. Requests to
+    online engines time out after timeout seconds, if given.
+    """
+
+    def __init__(
+        self,
+        recognizer: Union[str, Callable[[Any], str]] = "google",
+        *,
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        batch_size: int = 1,
+    ):
+        super().__init__(max_concurrency=max_concurrency, batch_size=batch_size)
+        self._recognizer = recognizer
+        self._timeout = timeout
+        self._recognize: Optional[Callable[[Any], str]] = None
+
+    def load(self) -> None:
+        if isinstance(self._recognizer, str):
+            recognizer = sr.Recognizer()
+            recognizer.operation_timeout = self._timeout
+            self._recognize = getattr(recognizer, f"recognize_{self._recognizer}", None)
+            if self._recognize is None:
+                raise ValueError(f"Unknown speech recognizer: {self._recognizer}")
+        else:
+            self._recognize = self._recognizer
+
+    def transcribe(self, audio: Any) -> str:
+        assert self._recognize is not None
+        try:
+            return self._recognize(audio)
+        except sr.UnknownValueError:
+            return ""  # The chunk holds no intelligible speech
+
+
+class FasterWhisperBackend(SpeechBackend):
+    """
+    Transcribes audio offline, with a Whisper model run by faster-whisper, which is
+    loaded once per session (unlike speech_recognition's "faster_whisper" engine,
+    which loads the model for every chunk). model_options are passed to
+    faster_whisper.WhisperModel, and transcribe_options (e.g., language) to its
+    transcribe method.
+    """
+
+    def __init__(
+        self,
+        model: str = "base",
+        *,
+        max_concurrency: Optional[int] = 1,
+        batch_size: int = 1,
+        model_options: Optional[Dict[str, Any]] = None,
+        **transcribe_options: Any,
+    ):
+        super().__init__(max_concurrency=max_concurrency, batch_size=batch_size)
+        self._model_name = model
+        self._model_options = model_options or {}
+        self._transcribe_options = transcribe_options
+        self._model: Any = None
+
+    def load(self) -> None:
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError as e:
+            raise MissingDependencyException(
+                "FasterWhisperBackend requires installing MarkItDown with the [faster-whisper] optional dependencies. E.g., `pip install markitdown[faster-whisper]`"
+            ) from e
+        self._model = WhisperModel(self._model_name, **self._model_options)
+
+    def unload(self) -> None:
+        self._model = None
+
+    def transcribe(self, audio: Any) -> str:
+        import numpy as np
+
+        # Whisper expects 16 kHz mono audio, as floats in [-1, 1)
+        samples = np.frombuffer(
+            audio.get_raw_data(convert_rate=16000, convert_width=2), dtype="<i2"
+        )
+        segments, _ = self._model.transcribe(
+            samples.astype(np.float32) / 32768.0, **self._transcribe_options
+        )
+        return " ".join(segment.text.strip() for segment in segments)
+
+
+# A speech_recognition engine name, a function that transcribes a chunk of audio,
+# or a SpeechBackend
+SpeechRecognizer = Union[str, Callable[[Any], str], SpeechBackend]
+
+
+def transcribe_audio(
+    file_stream: BinaryIO,
+    *,
+    audio_format: str = "wav",
+    recognizer: Optional[SpeechRecognizer] = None,
+    max_workers: Optional[int] = None,
+) -> str:
+    return " ".join(
+        iter_transcript(
+            file_stream,
+            audio_format=audio_format,
+            recognizer=recognizer,
+            max_workers=max_workers,
+        )
+    )
+
+
+def iter_transcript(
+    file_stream: BinaryIO,
+    *,
+    audio_format: str = "wav",
+    recognizer: Optional[SpeechRecognizer] = None,
+    max_workers: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Transcribe the audio one chunk at a time, yielding the transcript of each chunk
+    (that contains speech) in order, as soon as it is ready. If max_workers > 1,
+    batches of chunks are transcribed concurrently. Only the chunks being
+    transcribed are held in memory.
+
+    The recognizer defaults to Google's speech recognition service. Backends created
+    here from engine names or functions are closed once the audio is transcribed,
+    while SpeechBackend instances are left open, for reuse.
+    """
     # Check for installed dependencies
     if _dependency_exc_info is not None:
         raise MissingDependencyException(
@@ -31,19 +241,150 @@ def transcribe_audio(file_stream: BinaryIO, *, audio_format: str = "wav") -> str
             _dependency_exc_info[2]
         )
 
+    if isinstance(recognizer, SpeechBackend):
+        backend = recognizer
+        session: Any = contextlib.nullcontext()
+    else:
+        backend = RecognizerBackend("google" if recognizer is None else recognizer)
+        session = backend
+
+    empty = True
+    with session, _open_audio(file_stream, audio_format) as audio_source:
+        with sr.AudioFile(audio_source) as source:
+            batches = _iter_batches(_iter_chunks(source), backend.batch_size)
+            if max_workers is None or max_workers <= 1:
+                results: Iterator[List[str]] = map(backend._run, batches)
+            else:
+                results = _map_in_order(backend._run, batches, max_workers)
+
+            for transcripts in results:
+                for transcript in transcripts:
+                    transcript = transcript.strip()
+                    if transcript:
+                        empty = False
+                        yield transcript
+
+    if empty:
+        yield "[No speech detected]"
+
+
+def _iter_batches(chunks: Iterator[Any], batch_size: int) -> Iterator[List[Any]]:
+    batch: List[Any] = []
+    for chunk in chunks:
+        batch.append(chunk)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+@contextlib.contextmanager
+def _open_audio(file_stream: BinaryIO, audio_format: str) -> Iterator[BinaryIO]:
+    """Provide the audio in a format that speech_recognition can read (WAV, AIFF, or FLAC)."""
     if audio_format in ["wav", "aiff", "flac"]:
-        audio_source = file_stream
+        yield file_stream
     elif audio_format in ["mp3", "mp4"]:
-        audio_segment = pydub.AudioSegment.from_file(file_stream, format=audio_format)
-
-        audio_source = io.BytesIO()
-        audio_segment.export(audio_source, format="wav")
-        audio_source.seek(0)
+        # Decode with the same converter (ffmpeg) as pydub, but to a temporary
+        # file, rather than into memory
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, "input")
+            output_path = os.path.join(temp_dir, "output.wav")
+            with open(input_path, "wb") as fh:
+                shutil.copyfileobj(file_stream, fh)
+            subprocess.run(
+                [
+                    pydub.AudioSegment.converter,
+                    "-y",
+                    "-i",
+                    input_path,
+                    "-vn",
+                    "-f",
+                    "wav",
+                    output_path,
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+            os.unlink(input_path)
+            with open(output_path, "rb") as fh:
+                yield fh
     else:
         raise ValueError(f"Unsupported audio format: {audio_format}")
 
-    recognizer = sr.Recognizer()
-    with sr.AudioFile(audio_source) as source:
-        audio = recognizer.record(source)
-        transcript = recognizer.recognize_google(audio).strip()
-        return "[No speech detected]" if transcript == "" else transcript
+
+def _iter_chunks(source: Any) -> Iterator[Any]:
+    """Read the audio source as a series of AudioData chunks, cut at quiet moments."""
+    sample_rate = source.SAMPLE_RATE
+    sample_width = source.SAMPLE_WIDTH
+    chunk_frames = int(CHUNK_SECONDS * sample_rate)
+
+    pending = b""
+    while True:
+        data = source.stream.read(chunk_frames - len(pending) // sample_width)
+        pending += data
+        if len(data) == 0 or len(pending) < chunk_frames * sample_width:
+            # The end of the audio
+            if len(pending) > 0:
+                yield sr.AudioData(pending, sample_rate, sample_width)
+            return
+
+        cut = _find_quiet_frame(pending, sample_rate, sample_width)
+        yield sr.AudioData(pending[:cut], sample_rate, sample_width)
+        pending = pending[cut:]
+
+
+def _find_quiet_frame(data: bytes, sample_rate: int, sample_width: int) -> int:
+    """
+    Return the byte offset of the quietest frame (by mean absolute amplitude) in
+    the last SILENCE_SEARCH_SECONDS of the (mono) audio data.
+    """
+    frame_samples = max(1, int(SILENCE_FRAME_SECONDS * sample_rate))
+    total_samples = len(data) // sample_width
+    start = max(0, total_samples - int(SILENCE_SEARCH_SECONDS * sample_rate))
+
+    # Compare the two most significant bytes of each sample, which is precise
+    # enough to find the quiet moments, whatever the sample width
+    data = data[start * sample_width :]
+    if sample_width == 1:
+        # 8-bit audio is unsigned
+        samples = array.array("h", (s - 128 for s in data))
+    else:
+        high_bytes = bytearray(2 * (len(data) // sample_width))
+        high_bytes[0::2] = data[sample_width - 2 :: sample_width]
+        high_bytes[1::2] = data[sample_width - 1 :: sample_width]
+        samples = array.array("h", bytes(high_bytes))
+        if sys.byteorder == "big":
+            samples.byteswap()
+
+    best_offset = total_samples
+    best_energy = None
+    for offset in range(0, len(samples) - frame_samples + 1, frame_samples):
+        energy = sum(map(abs, samples[offset : offset + frame_samples]))
+        if best_energy is None or energy < best_energy:
+            best_energy = energy
+            best_offset = start + offset + frame_samples // 2
+    return best_offset * sample_width
+
+
+def _map_in_order(
+    func: Callable[[Any], List[str]], items: Iterator[Any], max_workers: int
+) -> Iterator[List[str]]:
+    """
+    Like map(), but running func on up to max_workers items concurrently. Items are
+    consumed no further than 2 * max_workers ahead of the results.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Deque["Future[List[str]]"] = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
@@ -5,6 +5,7 @@ from typing import Any, BinaryIO
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
 from ._markdownify import _CustomMarkdownify
+from ._targeted_soup import parse_targets
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "text/html",
@@ -16,6 +17,13 @@ ACCEPTED_FILE_EXTENSIONS = [
     ".htm",
 ]
 
+# The parts of the page that are converted
+WIKIPEDIA_TARGETS = [
+    ("title", None, None),
+    ("span", "class", "mw-page-title-main"),
+    ("div", "id", "mw-content-text"),
+]
+
 
 class WikipediaConverter(DocumentConverter):
     """Handle Wikipedia pages separately, focusing only on the main document content."""
@@ -54,9 +62,14 @@ class WikipediaConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        # Parse the stream
+        # Parse only the title and main content, skipping the navigation and other
+        # chrome around them. Pages without the main content are parsed in full.
         encoding = "utf-8" if stream_info.charset is None else stream_info.charset
-        soup = bs4.BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
+        cur_pos = file_stream.tell()
+        soup = parse_targets(file_stream, encoding, WIKIPEDIA_TARGETS)
+        if soup.find("div", {"id": "mw-content-text"}) is None:
+            file_stream.seek(cur_pos)
+            soup = bs4.BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
 
         # Remove javascript and style blocks
         for script in soup(["script", "style"]):
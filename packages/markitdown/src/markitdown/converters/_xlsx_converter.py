@@ -1,9 +1,10 @@
 import sys
-from typing import BinaryIO, Any
-from ._html_converter import HtmlConverter
+import itertools
+from typing import BinaryIO, Any, List
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
 from .._stream_info import StreamInfo
+from ._markdown_table import markdown_table
 
 # Try loading optional (but in this case, required) dependencies
 # Save reporting of any exceptions for later
@@ -33,6 +34,32 @@ ACCEPTED_XLS_MIME_TYPE_PREFIXES = [
 ACCEPTED_XLS_FILE_EXTENSIONS = [".xls"]
 
 
+def _format_column(column: "pd.Series") -> List[str]:
+    """
+    Format a column's values as pandas' HTML writer does. Numbers, booleans, and
+    dates are formatted by Series.to_string(), which shares that writer's rules:
+    dates without midnight times, NaT rather than NaN, floats with a common
+    precision. Other values (which may span lines) are formatted one at a time.
+    """
+    dtype = column.dtype
+    if len(column) > 0 and (
+        pd.api.types.is_numeric_dtype(dtype)
+        or pd.api.types.is_datetime64_any_dtype(dtype)
+        or pd.api.types.is_timedelta64_dtype(dtype)
+    ):
+        text = column.to_string(index=False, header=False, na_rep="NaN")
+        return [value.strip() for value in text.split("\n")]
+    return ["NaN" if pd.isna(v) else str(v) for v in column]
+
+
+def _sheet_to_markdown(df: "pd.DataFrame") -> str:
+    """Render a DataFrame (without its index) as a Markdown table."""
+    header = [str(c) for c in df.columns]
+    columns = [_format_column(df.iloc[:, i]) for i in range(df.shape[1])]
+    rows = zip(*columns) if columns else ([] for _ in range(len(df)))
+    return markdown_table(itertools.chain([header], rows), escape_emphasis=True)
+
+
 class XlsxConverter(DocumentConverter):
     """
     Converts XLSX files to Markdown, with each sheet presented as a separate Markdown table.
@@ -40,7 +67,6 @@ class XlsxConverter(DocumentConverter):
 
     def __init__(self):
         super().__init__()
-        self._html_converter = HtmlConverter()
 
     def accepts(
         self,
@@ -84,13 +110,7 @@ class XlsxConverter(DocumentConverter):
         md_content = ""
         for s in sheets:
             md_content += f"## {s}\n"
-            html_content = sheets[s].to_html(index=False)
-            md_content += (
-                self._html_converter.convert_string(
-                    html_content, **kwargs
-                ).markdown.strip()
-                + "\n\n"
-            )
+            md_content += _sheet_to_markdown(sheets[s]) + "\n\n"
 
         return DocumentConverterResult(markdown=md_content.strip())
 
@@ -102,7 +122,6 @@ class XlsConverter(DocumentConverter):
 
     def __init__(self):
         super().__init__()
-        self._html_converter = HtmlConverter()
 
     def accepts(
         self,
@@ -146,12 +165,6 @@ class XlsConverter(DocumentConverter):
         md_content = ""
         for s in sheets:
             md_content += f"## {s}\n"
-            html_content = sheets[s].to_html(index=False)
-            md_content += (
-                self._html_converter.convert_string(
-                    html_content, **kwargs
-                ).markdown.strip()
-                + "\n\n"
-            )
+            md_content += _sheet_to_markdown(sheets[s]) + "\n\n"
 
         return DocumentConverterResult(markdown=md_content.strip())
@@ -1,8 +1,11 @@
+import codecs
 import json
+import threading
 import time
 import re
-import bs4
-from typing import Any, BinaryIO, Dict, List, Union
+from collections import OrderedDict
+from html.parser import HTMLParser
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlparse, unquote
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
@@ -33,9 +36,127 @@ ACCEPTED_FILE_EXTENSIONS = [
     ".htm",
 ]
 
+# Transcripts (and the lists of those available) are cached for this many seconds
+DEFAULT_CACHE_TTL = 60 * 60
+CACHE_MAX_ENTRIES = 1024
+
+# Failed transcript fetches are retried, waiting RETRY_DELAY seconds after the first
+# attempt, and doubling the wait after each subsequent one
+RETRIES = 3
+RETRY_DELAY = 1.0
+
+# Watch pages are parsed this many bytes at a time
+CHUNK_SIZE = 64 * 1024
+
+# The meta tag attributes that name the property set by the tag
+META_NAME_ATTRIBUTES = ["itemprop", "property", "name"]
+
+INITIAL_DATA_MARKER = "ytInitialData"
+INITIAL_DATA_ASSIGNMENT_RE = re.compile(r"var ytInitialData = (?={)")
+DESCRIPTION_KEY_RE = re.compile(r'(?<!\\)"attributedDescriptionBodyText"\s*:\s*')
+
+_MISSING = object()
+
+
+class _WatchPageParser(HTMLParser):
+    """
+    Collects the title, the meta tag properties, and the script holding
+    ytInitialData, from a watch page, in a single pass. Nothing else is kept.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title: Optional[str] = None
+        self.metadata: Dict[str, str] = {}
+        self.initial_data_script: Optional[str] = None
+        self._title_parts: Optional[List[str]] = None
+        self._script_parts: Optional[List[str]] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the ytInitialData script has been read, which ends the page's metadata."""
+        return self.initial_data_script is not None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "meta":
+            # As with BeautifulSoup, repeated attributes take the last value
+            attributes = {name: value or "" for name, value in attrs}
+            for name in attributes:
+                if name in META_NAME_ATTRIBUTES:
+                    key = attributes[name]
+                    content = attributes.get("content", "")
+                    if key and content:  # Only add non-empty content
+                        self.metadata[key] = content
+                    break
+        elif tag == "title" and self.title is None and self._title_parts is None:
+            self._title_parts = []
+        elif tag == "script" and self.initial_data_script is None:
+            self._script_parts = []
+
+    def handle_startendtag(
+        self, tag: str, attrs: List[Tuple[str, Optional[str]]]
+    ) -> None:
+        if tag == "meta":
+            self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title" and self._title_parts is not None:
+            self.title = "".join(self._title_parts)
+            self._title_parts = None
+        elif tag == "script" and self._script_parts is not None:
+            script = "".join(self._script_parts)
+            self._script_parts = None
+            if INITIAL_DATA_MARKER in script:
+                self.initial_data_script = script
+
+    def handle_data(self, data: str) -> None:
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+        elif self._script_parts is not None:
+            self._script_parts.append(data)
+
+
+class _TtlCache:
+    """A thread-safe mapping whose entries expire ttl seconds after they are stored."""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Return the value stored for key, or _MISSING if there is none, or it expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
 
 class YouTubeConverter(DocumentConverter):
-    """Handle YouTube specially, focusing on the video title, description, and transcript."""
+    """
+    Handle YouTube specially, focusing on the video title, description, and transcript.
+
+    Transcripts are cached by video id and language for cache_ttl seconds (pass None
+    to disable the cache), so converting the same videos repeatedly does not fetch
+    their transcripts again. Failed fetches are retried, backing off exponentially.
+    """
+
+    def __init__(self, *, cache_ttl: Optional[float] = DEFAULT_CACHE_TTL):
+        super().__init__()
+        self._cache = _TtlCache(cache_ttl, CACHE_MAX_ENTRIES) if cache_ttl else None
 
     def accepts(
         self,
@@ -73,47 +194,53 @@ class YouTubeConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        # Parse the stream
+        webpage_text, title = self._convert_page(file_stream, stream_info)
+
+        video_id = self._video_id(stream_info)
+        if video_id is not None:
+            transcript_text = self._get_transcript(
+                video_id, kwargs.get("youtube_transcript_languages")
+            )
+            if transcript_text:
+                webpage_text += f"\n### Transcript\n{transcript_text}\n"
+
+        return DocumentConverterResult(
+            markdown=webpage_text,
+            title=title,
+        )
+
+    def _convert_page(
+        self, file_stream: BinaryIO, stream_info: StreamInfo
+    ) -> Tuple[str, str]:
+        """Convert the page itself, returning its markdown and title."""
+        # Parse the stream, stopping once the metadata has been read
         encoding = "utf-8" if stream_info.charset is None else stream_info.charset
-        soup = bs4.BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        parser = _WatchPageParser()
+        while not parser.done:
+            chunk = file_stream.read(CHUNK_SIZE)
+            parser.feed(decoder.decode(chunk, final=len(chunk) == 0))
+            if len(chunk) == 0:
+                parser.close()
+                break
 
         # Read the meta tags
         metadata: Dict[str, str] = {}
 
-        if soup.title and soup.title.string:
-            metadata["title"] = soup.title.string
+        if parser.title:
+            metadata["title"] = parser.title
 
-        for meta in soup(["meta"]):
-            if not isinstance(meta, bs4.Tag):
-                continue
-
-            for a in meta.attrs:
-                if a in ["itemprop", "property", "name"]:
-                    key = str(meta.get(a, ""))
-                    content = str(meta.get("content", ""))
-                    if key and content:  # Only add non-empty content
-                        metadata[key] = content
-                    break
+        metadata.update(parser.metadata)
 
         # Try reading the description
-        try:
-            for script in soup(["script"]):
-                if not isinstance(script, bs4.Tag):
-                    continue
-                if not script.string:  # Skip empty scripts
-                    continue
-                content = script.string
-                if "ytInitialData" in content:
-                    match = re.search(r"var ytInitialData = ({.*?});", content)
-                    if match:
-                        data = json.loads(match.group(1))
-                        attrdesc = self._findKey(data, "attributedDescriptionBodyText")
-                        if attrdesc and isinstance(attrdesc, dict):
-                            metadata["description"] = str(attrdesc.get("content", ""))
-                    break
-        except Exception as e:
-            print(f"Error extracting description: {e}")
-            pass
+        if parser.initial_data_script is not None:
+            try:
+                description = self._find_description(parser.initial_data_script)
+                if description is not None:
+                    metadata["description"] = description
+            except Exception as e:
+                print(f"Error extracting description: {e}")
+                pass
 
         # Start preparing the page
         webpage_text = "# YouTube\n"
@@ -144,57 +271,107 @@ class YouTubeConverter(DocumentConverter):
         if description:
             webpage_text += f"\n### Description\n{description}\n"
 
-        if IS_YOUTUBE_TRANSCRIPT_CAPABLE:
-            ytt_api = YouTubeTranscriptApi()
-            transcript_text = ""
-            parsed_url = urlparse(stream_info.url)  # type: ignore
-            params = parse_qs(parsed_url.query)  # type: ignore
-            if "v" in params and params["v"][0]:
-                video_id = str(params["v"][0])
-                transcript_list = ytt_api.list(video_id)
-                languages = ["en"]
-                for transcript in transcript_list:
-                    languages.append(transcript.language_code)
-                    break
-                try:
-                    youtube_transcript_languages = kwargs.get(
-                        "youtube_transcript_languages", languages
-                    )
-                    # Retry the transcript fetching operation
-                    transcript = self._retry_operation(
-                        lambda: ytt_api.fetch(
-                            video_id, languages=youtube_transcript_languages
-                        ),
-                        retries=3,  # Retry 3 times
-                        delay=2,  # 2 seconds delay between retries
-                    )
-
-                    if transcript:
-                        transcript_text = " ".join(
-                            [part.text for part in transcript]
-                        )  # type: ignore
-                except Exception as e:
-                    # No transcript available
-                    if len(languages) == 1:
-                        print(f"Error fetching transcript: {e}")
-                    else:
-                        # Translate transcript into first kwarg
-                        transcript = (
-                            transcript_list.find_transcript(languages)
-                            .translate(youtube_transcript_languages[0])
-                            .fetch()
-                        )
-                        transcript_text = " ".join([part.text for part in transcript])
-            if transcript_text:
-                webpage_text += f"\n### Transcript\n{transcript_text}\n"
-
-        title = title if title else (soup.title.string if soup.title else "")
+        title = title if title else (parser.title or "")
         assert isinstance(title, str)
 
-        return DocumentConverterResult(
-            markdown=webpage_text,
-            title=title,
+        return webpage_text, title
+
+    def _find_description(self, script: str) -> Optional[str]:
+        """
+        Read the description from the ytInitialData object in the script, decoding
+        only the value of its first attributedDescriptionBodyText key.
+        """
+        assignment = INITIAL_DATA_ASSIGNMENT_RE.search(script)
+        if assignment is None:
+            return None
+        key = DESCRIPTION_KEY_RE.search(script, assignment.end())
+        if key is None:
+            return None
+        attrdesc, _ = json.JSONDecoder().raw_decode(script, key.end())
+        if attrdesc and isinstance(attrdesc, dict):
+            return str(attrdesc.get("content", ""))
+        return None
+
+    def _video_id(self, stream_info: StreamInfo) -> Optional[str]:
+        """The id of the video, if its transcript can be fetched."""
+        if not IS_YOUTUBE_TRANSCRIPT_CAPABLE:
+            return None
+        parsed_url = urlparse(stream_info.url)  # type: ignore
+        params = parse_qs(parsed_url.query)  # type: ignore
+        if "v" in params and params["v"][0]:
+            return str(params["v"][0])
+        return None
+
+    def _get_transcript(
+        self, video_id: str, youtube_transcript_languages: Optional[List[str]]
+    ) -> str:
+        ytt_api = YouTubeTranscriptApi()
+        transcript_list = self._cached(
+            ("list", video_id), lambda: ytt_api.list(video_id)
+        )
+        languages = self._default_languages(transcript_list)
+        if youtube_transcript_languages is None:
+            youtube_transcript_languages = languages
+
+        try:
+            # Retry the transcript fetching operation
+            return self._cached(
+                ("transcript", video_id, tuple(youtube_transcript_languages)),
+                lambda: self._retry_operation(
+                    lambda: self._fetch(ytt_api, video_id, youtube_transcript_languages)
+                ),
+            )
+        except Exception as e:
+            # No transcript available
+            if len(languages) == 1:
+                print(f"Error fetching transcript: {e}")
+                return ""
+            # Translate transcript into first kwarg
+            return self._cached(
+                (
+                    "translation",
+                    video_id,
+                    tuple(languages),
+                    youtube_transcript_languages[0],
+                ),
+                lambda: self._fetch_translation(
+                    transcript_list, languages, youtube_transcript_languages[0]
+                ),
+            )
+
+    def _default_languages(self, transcript_list: Any) -> List[str]:
+        """English, and then the language of the first transcript available."""
+        languages = ["en"]
+        for transcript in transcript_list:
+            languages.append(transcript.language_code)
+            break
+        return languages
+
+    def _fetch(self, ytt_api: Any, video_id: str, languages: List[str]) -> str:
+        transcript = ytt_api.fetch(video_id, languages=languages)
+        if not transcript:
+            return ""
+        return " ".join([part.text for part in transcript])  # type: ignore
+
+    def _fetch_translation(
+        self, transcript_list: Any, languages: List[str], target_language: str
+    ) -> str:
+        transcript = (
+            transcript_list.find_transcript(languages)
+            .translate(target_language)
+            .fetch()
         )
+        return " ".join([part.text for part in transcript])
+
+    def _cached(self, key: Any, operation: Callable[[], Any]) -> Any:
+        """Return the cached result of the operation, running it if need be."""
+        if self._cache is None:
+            return operation()
+        value = self._cache.get(key)
+        if value is _MISSING:
+            value = operation()
+            self._cache.put(key, value)
+        return value
 
     def _get(
         self,
@@ -208,23 +385,10 @@ class YouTubeConverter(DocumentConverter):
                 return metadata[k]
         return default
 
-    def _findKey(self, json: Any, key: str) -> Union[str, None]:  # TODO: Fix json type
-        """Recursively search for a key in nested dictionary/list structures."""
-        if isinstance(json, list):
-            for elm in json:
-                ret = self._findKey(elm, key)
-                if ret is not None:
-                    return ret
-        elif isinstance(json, dict):
-            for k, v in json.items():
-                if k == key:
-                    return json[k]
-                if result := self._findKey(v, key):
-                    return result
-        return None
-
-    def _retry_operation(self, operation, retries=3, delay=2):
-        """Retries the operation if it fails."""
+    def _retry_operation(self, operation, retries=None, delay=None):
+        """Retries the operation if it fails, backing off exponentially."""
+        retries = RETRIES if retries is None else retries
+        delay = RETRY_DELAY if delay is None else delay
         attempt = 0
         while attempt < retries:
             try:
@@ -232,7 +396,7 @@ class YouTubeConverter(DocumentConverter):
             except Exception as e:
                 print(f"Attempt {attempt + 1} failed: {e}")
                 if attempt < retries - 1:
-                    time.sleep(delay)  # Wait before retrying
+                    time.sleep(delay * 2**attempt)  # Wait before retrying
                 attempt += 1
         # If all attempts fail, raise the last exception
         raise Exception(f"Operation failed after {retries} attempts.")
@@ -1,12 +1,21 @@
 import zipfile
+import contextlib
 import io
 import os
+import shutil
+import tempfile
+import threading
 
-from typing import BinaryIO, Any, TYPE_CHECKING
+from typing import BinaryIO, Any, List, Optional, TYPE_CHECKING
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
-from .._exceptions import UnsupportedFormatException, FileConversionException
+from .._exceptions import (
+    ArchiveLimitExceededException,
+    FileConversionException,
+)
 
 # Break otherwise circular import for type hinting
 if TYPE_CHECKING:
@@ -18,13 +27,88 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_EXTENSIONS = [".zip"]
 
+# Members with these extensions are never converted, so are skipped without being read
+SKIPPED_FILE_EXTENSIONS = [
+    # Video
+    ".avi",
+    ".flv",
+    ".mkv",
+    ".mov",
+    ".webm",
+    ".wmv",
+    # Other archive and disk image formats
+    ".7z",
+    ".bz2",
+    ".dmg",
+    ".gz",
+    ".iso",
+    ".rar",
+    ".tar",
+    ".tgz",
+    ".xz",
+    # Executables and compiled code
+    ".a",
+    ".class",
+    ".dll",
+    ".dylib",
+    ".exe",
+    ".o",
+    ".pyc",
+    ".so",
+    # Fonts
+    ".eot",
+    ".otf",
+    ".ttf",
+    ".woff",
+    ".woff2",
+]
+
+# Members larger than this are spilled to a temporary file, rather than held in memory
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+# Members are opened and identified in batches, bounded by count and total size
+BATCH_MAX_MEMBERS = 32
+BATCH_MAX_SIZE = SPOOL_MAX_SIZE
+
+# Default resource limits, shared by an archive and all archives nested within it
+DEFAULT_MAX_EXPANDED_BYTES = 1024 * 1024 * 1024
+DEFAULT_MAX_MEMBERS = 10000
+DEFAULT_MAX_DEPTH = 5
+DEFAULT_MAX_COMPRESSION_RATIO = 100.0
+
+# Small members are exempt from the compression ratio check
+COMPRESSION_RATIO_MIN_SIZE = 1024 * 1024
+
+
+class _ArchiveBudget:
+    """Resources consumed so far by an archive, including any nested archives."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.expanded_bytes = 0
+        self.members = 0
+
+    def consume(self, *, expanded_bytes: int, members: int) -> None:
+        with self._lock:
+            self.expanded_bytes += expanded_bytes
+            self.members += members
+
+
+def raise_archive_limit(error: FileConversionException) -> None:
+    """Re-raise the archive limit that caused a nested conversion to fail, if any."""
+    for attempt in error.attempts or []:
+        if attempt.exc_info is not None and isinstance(
+            attempt.exc_info[1], ArchiveLimitExceededException
+        ):
+            raise attempt.exc_info[1]
+
 
 class ZipConverter(DocumentConverter):
     """Converts ZIP files to markdown by extracting and converting all contained files.
 
-    The converter extracts the ZIP contents to a temporary directory, processes each file
-    using appropriate converters based on file extensions, and then combines the results
-    into a single markdown document. The temporary directory is cleaned up after processing.
+    The converter streams each file out of the ZIP, processes it using appropriate
+    converters based on file extensions, and then combines the results into a single
+    markdown document.
 
     Example output format:
     ```markdown
@@ -55,16 +139,38 @@ class ZipConverter(DocumentConverter):
     - Processes nested files recursively
     - Uses appropriate converters for each file type
     - Preserves formatting of converted content
-    - Cleans up temporary files after processing
+    - Skips directories and known-unsupported file types without reading them
+    - Streams members one at a time, spilling large ones to temporary files
+    - Optionally converts members concurrently (pass `max_workers` > 1)
+    - Enforces resource limits, to guard against zip bombs
+
+    Resource limits apply to the archive and any archives nested within it, and
+    are checked against the sizes recorded in each archive's directory, before
+    anything is decompressed. When a limit is hit, conversion is aborted with an
+    ArchiveLimitExceededException naming the limit. Any limit can be disabled by
+    setting it to None:
+    - max_expanded_bytes: Total uncompressed size of all members
+    - max_members: Total number of members
+    - max_depth: How deeply archives may be nested (1 allows no nesting)
+    - max_compression_ratio: Uncompressed to compressed size ratio of any member
+      larger than COMPRESSION_RATIO_MIN_SIZE
     """
 
     def __init__(
         self,
         *,
         markitdown: "MarkItDown",
+        max_expanded_bytes: Optional[int] = DEFAULT_MAX_EXPANDED_BYTES,
+        max_members: Optional[int] = DEFAULT_MAX_MEMBERS,
+        max_depth: Optional[int] = DEFAULT_MAX_DEPTH,
+        max_compression_ratio: Optional[float] = DEFAULT_MAX_COMPRESSION_RATIO,
     ):
         super().__init__()
         self._markitdown = markitdown
+        self._max_expanded_bytes = max_expanded_bytes
+        self._max_members = max_members
+        self._max_depth = max_depth
+        self._max_compression_ratio = max_compression_ratio
 
     def accepts(
         self,
@@ -91,26 +197,156 @@ class ZipConverter(DocumentConverter):
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
         file_path = stream_info.url or stream_info.local_path or stream_info.filename
-        md_content = f"Content from the zip file `{file_path}`:\n\n"
+        md_parts = [f"Content from the zip file `{file_path}`:\n\n"]
+
+        # Nested archives share the budget of the outermost archive
+        depth = kwargs.get("_zip_depth", 0) + 1
+        budget = kwargs.get("_zip_budget") or _ArchiveBudget()
+        if self._max_depth is not None and depth > self._max_depth:
+            raise ArchiveLimitExceededException("max_depth", depth, self._max_depth)
 
         with zipfile.ZipFile(file_stream, "r") as zipObj:
-            for name in zipObj.namelist():
-                try:
-                    z_file_stream = io.BytesIO(zipObj.read(name))
-                    z_file_stream_info = StreamInfo(
-                        extension=os.path.splitext(name)[1],
-                        filename=os.path.basename(name),
-                    )
-                    result = self._markitdown.convert_stream(
-                        stream=z_file_stream,
-                        stream_info=z_file_stream_info,
+            members = [
+                info
+                for info in zipObj.infolist()
+                if not info.is_dir()
+                and os.path.splitext(info.filename)[1].lower()
+                not in SKIPPED_FILE_EXTENSIONS
+            ]
+            self._check_limits(members, budget)
+            # Members' stages are reported to the same on_stage callback, if any
+            convert_batch = partial(
+                self._convert_members,
+                zipObj,
+                _zip_depth=depth,
+                _zip_budget=budget,
+                on_stage=kwargs.get("on_stage"),
+            )
+            batches = self._batch_members(members)
+
+            # Batches are independent, so they can be converted concurrently.
+            # Either way, results are reported in the original member order.
+            max_workers = kwargs.get("max_workers")
+            if max_workers is not None and max_workers > 1 and len(batches) > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [executor.submit(convert_batch, b) for b in batches]
+                    try:
+                        results = [r for future in futures for r in future.result()]
+                    except BaseException:
+                        # Abort early, e.g., if a nested archive hit a limit
+                        for future in futures:
+                            future.cancel()
+                        raise
+            else:
+                results = [r for batch in batches for r in convert_batch(batch)]
+
+        for info, markdown in zip(members, results):
+            if markdown is not None:
+                md_parts.append(f"## File: {info.filename}\n\n")
+                md_parts.append(markdown + "\n\n")
+
+        return DocumentConverterResult(markdown="".join(md_parts).strip())
+
+    def _check_limits(
+        self, members: List[zipfile.ZipInfo], budget: _ArchiveBudget
+    ) -> None:
+        """Check the members of an archive against the limits, before reading any of them."""
+        if self._max_compression_ratio is not None:
+            for info in members:
+                if info.file_size <= COMPRESSION_RATIO_MIN_SIZE:
+                    continue
+                ratio = info.file_size / max(info.compress_size, 1)
+                if ratio > self._max_compression_ratio:
+                    raise ArchiveLimitExceededException(
+                        "max_compression_ratio",
+                        round(ratio, 1),
+                        self._max_compression_ratio,
                     )
-                    if result is not None:
-                        md_content += f"## File: {name}\n\n"
-                        md_content += result.markdown + "\n\n"
-                except UnsupportedFormatException:
-                    pass
-                except FileConversionException:
-                    pass
-
-        return DocumentConverterResult(markdown=md_content.strip())
+
+        budget.consume(
+            expanded_bytes=sum(info.file_size for info in members),
+            members=len(members),
+        )
+        if self._max_members is not None and budget.members > self._max_members:
+            raise ArchiveLimitExceededException(
+                "max_members", budget.members, self._max_members
+            )
+        if (
+            self._max_expanded_bytes is not None
+            and budget.expanded_bytes > self._max_expanded_bytes
+        ):
+            raise ArchiveLimitExceededException(
+                "max_expanded_bytes", budget.expanded_bytes, self._max_expanded_bytes
+            )
+
+    def _batch_members(
+        self, members: List[zipfile.ZipInfo]
+    ) -> List[List[zipfile.ZipInfo]]:
+        """
+        Split members into consecutive batches of at most BATCH_MAX_MEMBERS, and
+        BATCH_MAX_SIZE bytes in total. Larger members get a batch to themselves.
+        """
+        batches: List[List[zipfile.ZipInfo]] = []
+        batch_size = 0
+        for info in members:
+            if (
+                len(batches) == 0
+                or len(batches[-1]) >= BATCH_MAX_MEMBERS
+                or batch_size + info.file_size > BATCH_MAX_SIZE
+            ):
+                batches.append([])
+                batch_size = 0
+            batches[-1].append(info)
+            batch_size += info.file_size
+        return batches
+
+    def _convert_members(
+        self, zipObj: zipfile.ZipFile, members: List[zipfile.ZipInfo], **kwargs: Any
+    ) -> List[Optional[str]]:
+        """
+        Convert a batch of members, whose content is identified together.
+        Members that could not be converted are reported as None.
+        """
+        results: List[Optional[str]] = []
+        with contextlib.ExitStack() as stack:
+            streams = [
+                stack.enter_context(self._open_member(zipObj, info)) for info in members
+            ]
+            stream_infos = [
+                StreamInfo(
+                    extension=os.path.splitext(info.filename)[1],
+                    filename=os.path.basename(info.filename),
+                )
+                for info in members
+            ]
+            for result in self._markitdown._convert_many(
+                streams, stream_infos, trust_extension=True, **kwargs
+            ):
+                if isinstance(result, FileConversionException):
+                    # Limits hit by nested archives abort the whole conversion
+                    raise_archive_limit(result)
+                    results.append(None)
+                elif isinstance(result, DocumentConverterResult):
+                    results.append(result.markdown)
+                else:
+                    results.append(None)
+
+        return results
+
+    def _open_member(self, zipObj: zipfile.ZipFile, info: zipfile.ZipInfo) -> BinaryIO:
+        """
+        Open a seekable copy of a member. Small members are read into memory, while
+        larger ones are streamed to a temporary file (deleted once it is closed).
+        """
+        with zipObj.open(info) as member:
+            if info.file_size <= SPOOL_MAX_SIZE:
+                return io.BytesIO(member.read())
+
+            buffer = tempfile.TemporaryFile()
+            try:
+                shutil.copyfileobj(member, buffer)
+            except BaseException:
+                buffer.close()
+                raise
+            buffer.seek(0)
+            return buffer  # type: ignore[return-value]
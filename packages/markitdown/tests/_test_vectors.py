@@ -87,6 +87,24 @@ GENERAL_TEST_VECTORS = [
         ],
         must_not_include=[],
     ),
+    FileTestVector(
+        filename="test_outlook_msg_attachments.msg",
+        mimetype="application/vnd.ms-outlook",
+        charset=None,
+        url=None,
+        must_include=[
+            "**Subject:** Test Email Message",
+            "## Attachment: notes.txt",
+            "Attachment notes: quarterly figures are final.",
+            "## Attachment: figures.csv",
+            "| Q2 | 120 |",
+            "## Attachment: logo.bin",
+            "## Attachment: Forwarded.msg",
+            "**Subject:** Original Message",
+            "This is the body of the forwarded message",
+        ],
+        must_not_include=[],
+    ),
     FileTestVector(
         filename="test.pdf",
         mimetype="application/pdf",
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+import io
+import os
+import sys
+import timeit
+import zipfile
+from typing import Dict, List, Tuple
+
+from lxml import etree
+
+from markitdown import MarkItDown, StreamInfo
+from markitdown.converter_utils.docx.math.omml import OMML_NS, oMath2Latex
+from markitdown.converter_utils.docx.pre_process import pre_process_docx
+
+# Micro-benchmarks for DOCX math handling. These are not collected by pytest.
+# Run them directly, optionally passing extra .docx files to add to the corpus:
+#
+#   python tests/bench_docx_math.py [more.docx ...]
+#
+# The corpus is every DOCX test file that contains equations, plus an
+# equation-heavy variant of each, built by repeating its body many times.
+
+TEST_FILES_DIR = os.path.join(os.path.dirname(__file__), "test_files")
+DOCUMENT_XML = "word/document.xml"
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+REPEATS = 200
+
+
+def _has_math(data: bytes) -> bool:
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        return b"oMath" in z.read(DOCUMENT_XML)
+
+
+def _amplify(data: bytes, repeats: int) -> bytes:
+    """Return a copy of the DOCX with the body of the main document repeated."""
+    output = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as zin, zipfile.ZipFile(
+        output, "w", zipfile.ZIP_DEFLATED
+    ) as zout:
+        for info in zin.infolist():
+            content = zin.read(info)
+            if info.filename == DOCUMENT_XML:
+                root = etree.fromstring(content)
+                body = root.find(WORD_NS + "body")
+                blocks = [e for e in body if e.tag != WORD_NS + "sectPr"]
+                sect_pr = body.find(WORD_NS + "sectPr")
+                for _ in range(repeats - 1):
+                    for block in blocks:
+                        if sect_pr is not None:
+                            sect_pr.addprevious(etree.fromstring(etree.tostring(block)))
+                        else:
+                            body.append(etree.fromstring(etree.tostring(block)))
+                content = etree.tostring(
+                    root, xml_declaration=True, encoding="UTF-8", standalone=True
+                )
+            zout.writestr(info.filename, content)
+    return output.getvalue()
+
+
+def load_corpus(extra_paths: List[str]) -> Dict[str, bytes]:
+    corpus: Dict[str, bytes] = {}
+    paths = [
+        os.path.join(TEST_FILES_DIR, name)
+        for name in sorted(os.listdir(TEST_FILES_DIR))
+        if name.endswith(".docx")
+    ] + extra_paths
+    for path in paths:
+        with open(path, "rb") as fh:
+            data = fh.read()
+        if not _has_math(data):
+            continue
+        name = os.path.basename(path)
+        corpus[name] = data
+        corpus[f"{name} (x{REPEATS})"] = _amplify(data, REPEATS)
+    return corpus
+
+
+def _best(func, number: int) -> float:
+    """Best average time per call, in milliseconds."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1000
+
+
+def bench_document(
+    markitdown: MarkItDown, data: bytes
+) -> Tuple[int, float, float, float]:
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        root = etree.fromstring(z.read(DOCUMENT_XML))
+    equations = list(root.iter(OMML_NS + "oMath"))
+    number = 1 if len(equations) > 100 else 20
+
+    walk_ms = _best(lambda: [oMath2Latex(e).latex for e in equations], number)
+    pre_process_ms = _best(lambda: pre_process_docx(io.BytesIO(data)), number)
+    convert_ms = _best(
+        lambda: markitdown.convert_stream(
+            io.BytesIO(data), stream_info=StreamInfo(extension=".docx")
+        ),
+        number,
+    )
+    return len(equations), walk_ms, pre_process_ms, convert_ms
+
+
+def main(argv: List[str]) -> None:
+    markitdown = MarkItDown()
+    corpus = load_corpus(argv)
+    print(
+        f"{'document':<28} {'equations':>9} {'walk ms':>10} {'pre-process ms':>15} {'convert ms':>11}"
+    )
+    for name, data in corpus.items():
+        count, walk_ms, pre_process_ms, convert_ms = bench_document(markitdown, data)
+        print(
+            f"{name:<28} {count:>9} {walk_ms:>10.2f} {pre_process_ms:>15.2f} {convert_ms:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
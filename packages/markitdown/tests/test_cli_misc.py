@@ -1,4 +1,5 @@
 #!/usr/bin/env python3 -m pytest
+import os
 import subprocess
 from markitdown import __version__
 
@@ -27,6 +28,40 @@ def test_invalid_flag() -> None:
     assert "SYNTAX" in result.stderr, "Expected 'SYNTAX' to appear in STDERR"
 
 
+def test_output_file_kept_on_failure(tmp_path) -> None:
+    output = tmp_path / "out.md"
+    output.write_text("previous output", encoding="utf-8")
+
+    # A failed conversion leaves an existing output file untouched
+    result = subprocess.run(
+        [
+            "python",
+            "-m",
+            "markitdown",
+            str(tmp_path / "missing.txt"),
+            "-o",
+            str(output),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode != 0
+    assert output.read_text(encoding="utf-8") == "previous output"
+    assert os.listdir(tmp_path) == ["out.md"]
+
+    # A successful one replaces it
+    source = tmp_path / "source.txt"
+    source.write_text("new output", encoding="utf-8")
+    result = subprocess.run(
+        ["python", "-m", "markitdown", str(source), "-o", str(output)],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, f"CLI exited with error: {result.stderr}"
+    assert output.read_text(encoding="utf-8").strip() == "new output"
+    assert sorted(os.listdir(tmp_path)) == ["out.md", "source.txt"]
+
+
 if __name__ == "__main__":
     """Runs this file's tests from the command line."""
     test_version()
@@ -1,16 +1,60 @@
 #!/usr/bin/env python3 -m pytest
+import array
+import asyncio
+import base64
+import copy
+import http.server
 import io
+import json
 import os
 import re
 import shutil
+import sys
+import threading
+import time
+import types
+import urllib.parse
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+import olefile
 import pytest
+from bs4 import BeautifulSoup
+from lxml import etree
 
+from markitdown import _markitdown
 from markitdown._uri_utils import parse_data_uri, file_uri_to_path
+from markitdown.converters import (
+    DocumentIntelligenceConverter,
+    EpubConverter,
+    IpynbConverter,
+    OutlookMsgConverter,
+    RssConverter,
+    SpeechBackend,
+    WikipediaConverter,
+    YouTubeConverter,
+    _exiftool,
+    _outlook_msg_converter,
+    _youtube_converter,
+    _targeted_soup,
+    _transcribe_audio,
+    _zip_converter,
+)
+from markitdown.converters._markdown_table import markdown_table
+from markitdown.converter_utils import json_stream
+from markitdown.converter_utils.json_stream import JsonStreamReader
+from markitdown.converters._markdownify import _CustomMarkdownify
+from markitdown.converter_utils.docx.pre_process import (
+    pre_process_docx,
+    _convert_omath_to_latex,
+)
+from markitdown.converter_utils.docx.math.omml import OMML_NS
 
 from markitdown import (
     MarkItDown,
+    DocumentConverterResult,
     UnsupportedFormatException,
     FileConversionException,
+    ArchiveLimitExceededException,
     StreamInfo,
 )
 
@@ -30,6 +74,14 @@ try:
 except ModuleNotFoundError:
     skip_llm = True
 
+# Skip Document Intelligence tests if the client library is not installed
+try:
+    import azure.ai.documentintelligence
+
+    skip_doc_intel = False
+except ImportError:
+    skip_doc_intel = True
+
 # Skip exiftool tests if not installed
 skip_exiftool = shutil.which("exiftool") is None
 
@@ -251,6 +303,283 @@ def test_file_uris() -> None:
     assert path == "/path/to/file.txt"
 
 
+def test_output_stream() -> None:
+    markitdown = MarkItDown()
+
+    # Plain text is written through to the output as it is decoded, and normalized
+    # exactly as it would be in memory
+    text = "line one  \r\n\n\n\n\tline two\t\n" * 1000
+    stream_info = StreamInfo(extension=".txt", charset="utf-8")
+    expected = markitdown.convert_stream(
+        io.BytesIO(text.encode("utf-8")), stream_info=stream_info
+    ).markdown
+    output = io.StringIO()
+    result = markitdown.convert_stream(
+        io.BytesIO(text.encode("utf-8")),
+        stream_info=stream_info,
+        output_stream=output,
+    )
+    assert result.markdown == ""
+    assert output.getvalue() == expected
+
+    # Other converters produce the Markdown in memory, then write it out
+    docx_file = os.path.join(TEST_FILES_DIR, "test.docx")
+    output = io.StringIO()
+    result = markitdown.convert(docx_file, output_stream=output)
+    assert result.markdown != ""
+    assert output.getvalue() == result.markdown
+
+
+def test_ipynb_sniff() -> None:
+    # Only the ends of large JSON files are read to look for notebook keys
+    converter = IpynbConverter()
+    stream_info = StreamInfo(mimetype="application/json", charset="utf-8")
+    cells = [{"cell_type": "code", "source": ["x = 1"]} for _ in range(20000)]
+    notebook = {"cells": cells, "metadata": {}, "nbformat": 4, "nbformat_minor": 5}
+    assert converter.accepts(io.BytesIO(json.dumps(notebook).encode()), stream_info)
+
+    # Mentions of the keys in the middle are not read
+    del notebook["nbformat"], notebook["nbformat_minor"]
+    cells[10000] = {"cell_type": "markdown", "source": ["nbformat, nbformat_minor"]}
+    assert not converter.accepts(io.BytesIO(json.dumps(notebook).encode()), stream_info)
+
+
+def test_json_stream_reader(monkeypatch) -> None:
+    # Tiny chunks exercise values, strings and escapes split across reads
+    monkeypatch.setattr(json_stream, "CHUNK_SIZE", 3)
+    document = {
+        "skip": {"nested": ['a \\" b', {"c": [1, 2.5, None]}], "d": "}]"},
+        "read": ["caf\u00e9", "back\\slash", '"quoted"', True, -1e-3],
+        "empty": [{}, []],
+    }
+    reader = JsonStreamReader(io.BytesIO(json.dumps(document).encode("utf-8")))
+    keys = []
+    for key in reader.iter_object():
+        keys.append(key)
+        if key == "read":
+            assert reader.read_value() == document["read"]
+        elif key == "empty":
+            assert [reader.read_value() for _ in reader.iter_array()] == [{}, []]
+        else:
+            reader.skip_value()
+    assert keys == ["skip", "read", "empty"]
+
+    reader = JsonStreamReader(io.BytesIO(b'{"a": [1, 2'))
+    with pytest.raises(ValueError):
+        for _ in reader.iter_object():
+            reader.skip_value()
+
+
+def test_ipynb_outputs() -> None:
+    image = "iVBORw0KGgo" * 10000
+    notebook = {
+        "cells": [
+            {"cell_type": "markdown", "source": ["# Outputs\n", "Some text."]},
+            {
+                "cell_type": "code",
+                "source": ["print('hi')\n", "1 + 1"],
+                "outputs": [
+                    {"output_type": "stream", "name": "stdout", "text": ["hi\n"]},
+                    {
+                        "output_type": "execute_result",
+                        "data": {"text/plain": ["2"], "image/png": image},
+                    },
+                    {"output_type": "display_data", "data": {"image/png": image}},
+                    {"output_type": "error", "ename": "ValueError", "evalue": "bad"},
+                ],
+            },
+        ],
+        "metadata": {"kernelspec": {"name": "python3"}},
+        "nbformat": 4,
+        "nbformat_minor": 5,
+    }
+    markitdown = MarkItDown()
+    stream_info = StreamInfo(extension=".ipynb")
+
+    # Outputs are skipped by default
+    result = markitdown.convert_stream(
+        io.BytesIO(json.dumps(notebook).encode("utf-8")), stream_info=stream_info
+    )
+    assert result.title == "Outputs"
+    assert result.markdown == (
+        "# Outputs\nSome text.\n\n```python\nprint('hi')\n1 + 1\n```"
+    )
+
+    # ... but their text can be rendered
+    result = markitdown.convert_stream(
+        io.BytesIO(json.dumps(notebook).encode("utf-8")),
+        stream_info=stream_info,
+        notebook_outputs=True,
+    )
+    assert "```text\nhi\n2\nValueError: bad\n```" in result.markdown
+    assert image not in result.markdown
+
+
+def test_markdown_table() -> None:
+    # The first row is the header, and sets the table width
+    table = markdown_table([["a", "b"], [1, None], ["x", "y", "z"]])
+    assert table == "| a | b |\n| --- | --- |\n| 1 |  |\n| x | y |"
+
+    # Pipes are escaped and line breaks are folded
+    table = markdown_table([["col|1", "col 2"], ["line 1\r\nline 2", "ok"]])
+    assert table.splitlines() == [
+        "| col\\|1 | col 2 |",
+        "| --- | --- |",
+        "| line 1 line 2 | ok |",
+    ]
+
+    # No rows, no table
+    assert markdown_table([]) == ""
+
+    # CSV files are rendered with the same escaping
+    markitdown = MarkItDown()
+    result = markitdown.convert_stream(
+        io.BytesIO(b'name,notes\nfoo,"a|b"\nbar,"multi\nline"\n'),
+        stream_info=StreamInfo(extension=".csv", charset="utf-8"),
+    )
+    assert "| foo | a\\|b |" in result.markdown
+    assert "| bar | multi line |" in result.markdown
+
+
+def test_xlsx_cell_formatting() -> None:
+    # Cells are formatted as pandas' HTML writer formats them
+    import datetime
+    import openpyxl
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Sheet1"
+    sheet.append(["snake_case", "date", "price"])
+    sheet.append(["a_b", datetime.datetime(2024, 1, 2), 1.25])
+    sheet.append(["2*3", None, 2])
+    sheet.append([None, datetime.datetime(2024, 3, 4), None])
+    xlsx = io.BytesIO()
+    workbook.save(xlsx)
+    xlsx.seek(0)
+
+    result = MarkItDown().convert_stream(
+        xlsx, stream_info=StreamInfo(extension=".xlsx")
+    )
+    assert result.markdown.splitlines()[1:] == [
+        "| snake\\_case | date | price |",
+        "| --- | --- | --- |",
+        "| a\\_b | 2024-01-02 | 1.25 |",
+        "| 2\\*3 | NaT | 2.00 |",
+        "| NaN | 2024-03-04 | NaN |",
+    ]
+
+
+def test_pptx_max_workers() -> None:
+    # Rendering slides on a worker pool must not change the output or its order
+    markitdown = MarkItDown()
+    pptx_file = os.path.join(TEST_FILES_DIR, "test.pptx")
+    sequential = markitdown.convert(pptx_file)
+    parallel = markitdown.convert(pptx_file, max_workers=4)
+    assert parallel.markdown == sequential.markdown
+    validate_strings(parallel, PPTX_TEST_STRINGS)
+
+    slide_numbers = re.findall(r"<!-- Slide number: (\d+) -->", parallel.markdown)
+    assert slide_numbers == [str(i) for i in range(1, len(slide_numbers) + 1)]
+
+
+def test_epub_chapters() -> None:
+    # Streaming chapters, or converting them concurrently, must not change the output
+    epub_file = os.path.join(TEST_FILES_DIR, "test.epub")
+    converter = EpubConverter()
+    with open(epub_file, "rb") as fh:
+        sequential = converter.convert(fh, StreamInfo(extension=".epub"))
+        fh.seek(0)
+        parallel = converter.convert(fh, StreamInfo(extension=".epub"), max_workers=2)
+        fh.seek(0)
+        chapters = list(converter.iter_chapters(fh, StreamInfo(extension=".epub")))
+
+    assert len(chapters) > 2
+    assert chapters[0].startswith("**Title:**")
+    assert parallel.markdown == sequential.markdown
+    assert "\n\n".join(chapters) == sequential.markdown
+    assert parallel.title == sequential.title
+
+
+def test_markdownify_plain_text() -> None:
+    # Plain text skips the HTML parser, but must convert exactly as if parsed
+    markdownify = _CustomMarkdownify()
+    for text in [
+        "plain text",
+        "  leading and trailing  ",
+        "\n\nline one\r\n  line two\t\tand\n",
+        "snake_case and *stars* and \\backslashes",
+        "# not a heading, 1. not a list",
+        "   ",
+        "<b>markup</b> &amp; entities",
+    ]:
+        expected = markdownify.convert_soup(BeautifulSoup(text, "html.parser"))
+        assert markdownify.convert_html(text) == expected
+
+
+def test_rss_feeds() -> None:
+    markitdown = MarkItDown()
+
+    atom = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example Feed</title>
+  <subtitle>A subtitle</subtitle>
+  <entry>
+    <title>First entry</title>
+    <updated>2003-12-13T18:30:02Z</updated>
+    <summary>Some &lt;b&gt;bold&lt;/b&gt; text.</summary>
+  </entry>
+  <entry><title>Second entry</title></entry>
+</feed>"""
+    result = markitdown.convert_stream(
+        io.BytesIO(atom), stream_info=StreamInfo(extension=".xml")
+    )
+    assert result.title == "Example Feed"
+    assert result.markdown.startswith("# Example Feed\nA subtitle\n")
+    assert "## First entry\nUpdated on: 2003-12-13T18:30:02Z\nSome **bold** text." in (
+        result.markdown
+    )
+    assert "## Second entry" in result.markdown
+
+    rss = b"""<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel>
+  <title>Example Channel</title>
+  <item>
+    <title>An item</title>
+    <pubDate>Tue, 19 Nov 2024 13:30:02 +0000</pubDate>
+    <content:encoded><![CDATA[<p>Full <i>content</i></p>]]></content:encoded>
+  </item>
+</channel>
+</rss>"""
+    result = markitdown.convert_stream(
+        io.BytesIO(rss), stream_info=StreamInfo(extension=".xml")
+    )
+    assert result.title == "Example Channel"
+    assert "## An item\nPublished on: Tue, 19 Nov 2024 13:30:02 +0000\n" in (
+        result.markdown
+    )
+    assert "Full *content*" in result.markdown
+
+    # Feeds found by accepts() are not parsed again by convert()
+    converter = RssConverter()
+    parse_feed = converter._parse_feed
+    parsed = []
+
+    def _parse_feed(file_stream):
+        parsed.append(file_stream)
+        return parse_feed(file_stream)
+
+    converter._parse_feed = _parse_feed  # type: ignore[method-assign]
+    stream = io.BytesIO(rss)
+    stream_info = StreamInfo(extension=".xml")
+    assert converter.accepts(stream, stream_info)
+    assert converter.convert(stream, stream_info).title == "Example Channel"
+    assert len(parsed) == 1
+
+    # Other XML is left to other converters
+    other = b"<root><feed><title>Not a feed</title></feed></root>"
+    assert not converter.accepts(io.BytesIO(other), stream_info)
+
+
 def test_docx_comments() -> None:
     # Test DOCX processing, with comments and setting style_map on init
     markitdown_with_style_map = MarkItDown(style_map="comment-reference => ")
@@ -273,6 +602,292 @@ def test_docx_equations() -> None:
     assert block_equations, "No block equations found in the document."
 
 
+def test_docx_pre_process() -> None:
+    # Documents without math are passed through untouched
+    with open(os.path.join(TEST_FILES_DIR, "test.docx"), "rb") as fh:
+        assert pre_process_docx(fh) is fh
+        assert fh.tell() == 0
+
+    # Documents with math are rewritten, with every member preserved
+    with open(os.path.join(TEST_FILES_DIR, "equations.docx"), "rb") as fh:
+        processed = pre_process_docx(fh)
+        assert processed is not fh
+        assert fh.tell() == 0
+
+        with zipfile.ZipFile(fh) as original, zipfile.ZipFile(processed) as updated:
+            assert updated.namelist() == original.namelist()
+            document = updated.read("word/document.xml")
+            assert b"oMath" not in document
+            assert b"$m=1$" in document
+            for name in original.namelist():
+                if name != "word/document.xml":
+                    assert updated.read(name) == original.read(name)
+
+            # Repeated equations are converted once, with identical results
+            root = etree.fromstring(original.read("word/document.xml"))
+            equations = list(root.iter(OMML_NS + "oMath"))
+            duplicate = copy.deepcopy(equations[0])
+            cache: dict = {}
+            for element in equations + [duplicate]:
+                latex = _convert_omath_to_latex(element, cache)
+                assert latex == _convert_omath_to_latex(element)
+            assert len(cache) <= len(equations)
+
+
+def _make_zip(members) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as z:
+        for name, content in members.items():
+            z.writestr(name, content)
+    buffer.seek(0)
+    return buffer
+
+
+def test_zip_members(monkeypatch) -> None:
+    # Spill everything to temporary files, to exercise both code paths
+    monkeypatch.setattr(_zip_converter, "SPOOL_MAX_SIZE", 16)
+
+    zip_stream = _make_zip(
+        {
+            "docs/": b"",
+            "docs/small.txt": b"tiny",
+            "docs/large.md": b"# Heading\n\n" + b"c0ffee " * 1000,
+            "bin/tool.exe": b"this text would be converted if it were read",
+        }
+    )
+    result = MarkItDown().convert_stream(
+        zip_stream, stream_info=StreamInfo(extension=".zip")
+    )
+    assert "## File: docs/small.txt\n\ntiny" in result.markdown
+    assert "## File: docs/large.md" in result.markdown
+    assert "c0ffee c0ffee" in result.markdown
+    assert "## File: docs/\n" not in result.markdown
+    assert "tool.exe" not in result.markdown
+    assert "would be converted" not in result.markdown
+
+
+def test_convert_many() -> None:
+    markitdown = MarkItDown()
+    names = [
+        "test.docx",
+        "test.json",
+        "test_blog.html",
+        "test_mskanji.csv",
+        "test_notebook.ipynb",
+        "test_rss.xml",
+    ]
+    paths = [os.path.join(TEST_FILES_DIR, name) for name in names]
+    expected = [markitdown.convert(path).markdown for path in paths]
+
+    # Sources are identified in one batch, rather than one at a time
+    def _identify_stream(stream):
+        raise AssertionError("Streams should be identified in a batch")
+
+    markitdown._magika.identify_stream = _identify_stream
+    results = markitdown.convert_many(paths)
+    assert [result.markdown for result in results] == expected
+
+    # Streams, with or without hints, work too
+    with open(paths[1], "rb") as fh:
+        streams = [io.BytesIO(fh.read()), io.BytesIO(b"plain text")]
+    results = markitdown.convert_many(
+        streams, stream_infos=[StreamInfo(extension=".json"), None]
+    )
+    assert results[0].markdown == expected[1]
+    assert results[1].markdown == "plain text"
+
+    with pytest.raises(ValueError):
+        markitdown.convert_many(paths, stream_infos=[None])
+
+
+def test_identify_streams_batch(monkeypatch) -> None:
+    # The batch identifies streams as identify_stream does, including those too
+    # small for the model. Streams too large to copy are left to identify_stream.
+    monkeypatch.setattr(_markitdown, "MAGIKA_BATCH_MAX_STREAM_SIZE", 64 * 1024)
+    markitdown = MarkItDown()
+    contents = [b"", b"hi", b"plain text " * 100]
+    for name in ["test.docx", "test.json", "test_blog.html", "test.pdf"]:
+        with open(os.path.join(TEST_FILES_DIR, name), "rb") as fh:
+            contents.append(fh.read())
+    streams = [io.BytesIO(content) for content in contents]
+    for stream in streams:
+        stream.seek(1 if stream.getbuffer().nbytes else 0)
+
+    results = markitdown._identify_streams(streams)
+    for content, stream, result in zip(contents, streams, results):
+        assert stream.tell() == (1 if len(content) else 0)
+        if len(content) > _markitdown.MAGIKA_BATCH_MAX_STREAM_SIZE:
+            assert result is None
+            continue
+        expected = markitdown._magika.identify_stream(stream)
+        assert result is not None
+        assert result.prediction.output.label == expected.prediction.output.label
+    assert results.count(None) == 2  # test.docx and test.pdf
+
+
+def test_zip_trusts_member_extensions() -> None:
+    markitdown = MarkItDown()
+    sniffed = []
+    identify_stream = markitdown._magika.identify_stream
+
+    def _identify_stream(stream):
+        sniffed.append(stream)
+        return identify_stream(stream)
+
+    markitdown._magika.identify_stream = _identify_stream
+
+    # Only the archive itself, and the member without a known extension, are sniffed
+    zip_stream = _make_zip(
+        {
+            "notes.txt": "caf\u00e9 au lait".encode("utf-8"),
+            "data.json": b'{"key": "value"}',
+            "README": b"plain text without an extension",
+        }
+    )
+    result = markitdown.convert_stream(
+        zip_stream, stream_info=StreamInfo(extension=".zip")
+    )
+    assert len(sniffed) == 2
+    assert "caf\u00e9 au lait" in result.markdown
+    assert '{"key": "value"}' in result.markdown
+    assert "plain text without an extension" in result.markdown
+
+
+def test_zip_max_workers() -> None:
+    # Converting members concurrently must not change the output or its order
+    markitdown = MarkItDown()
+    zip_file = os.path.join(TEST_FILES_DIR, "test_files.zip")
+    sequential = markitdown.convert(zip_file)
+    parallel = markitdown.convert(zip_file, max_workers=4)
+    assert parallel.markdown == sequential.markdown
+
+    with zipfile.ZipFile(zip_file) as z:
+        names = [name for name in z.namelist() if not name.endswith("/")]
+    assert re.findall(r"^## File: (.+)$", parallel.markdown, re.MULTILINE) == names
+
+
+def test_outlook_msg_attachments(monkeypatch) -> None:
+    msg_file = os.path.join(TEST_FILES_DIR, "test_outlook_msg_attachments.msg")
+    with open(msg_file, "rb") as fh:
+        msg_stream = io.BytesIO(fh.read())
+
+    # The OLE directory parsed while sniffing the stream is reused by convert()
+    markitdown = MarkItDown()
+    converter = OutlookMsgConverter(markitdown=markitdown)
+    assert converter.accepts(msg_stream, StreamInfo())
+
+    def _open(*args, **kwargs):
+        raise AssertionError("The message should not be opened again")
+
+    monkeypatch.setattr(olefile.OleFileIO, "open", _open)
+    sequential = converter.convert(msg_stream, StreamInfo())
+    monkeypatch.undo()
+
+    # Attachments are converted in order, concurrently or not
+    assert re.findall(r"^## Attachment: (.+)$", sequential.markdown, re.M) == [
+        "notes.txt",
+        "figures.csv",
+        "logo.bin",
+        "Forwarded.msg",
+    ]
+    assert "| Q3 | 130 |" in sequential.markdown
+    assert "This is the body of the forwarded message" in sequential.markdown
+    parallel = markitdown.convert(msg_file, max_workers=4)
+    assert parallel.markdown == sequential.markdown
+    assert parallel.title == "Test Email Message"
+
+    # Without a MarkItDown instance, attachments are only listed
+    msg_stream.seek(0)
+    listed = OutlookMsgConverter().convert(msg_stream, StreamInfo(extension=".msg"))
+    assert "## Attachment: notes.txt\n\n## Attachment: figures.csv" in listed.markdown
+
+
+def test_outlook_msg_attachment_batches(monkeypatch) -> None:
+    msg_file = os.path.join(TEST_FILES_DIR, "test_outlook_msg_attachments.msg")
+    with open(msg_file, "rb") as fh:
+        msg_content = fh.read()
+    markitdown = MarkItDown()
+    expected = markitdown.convert(msg_file).markdown
+
+    # Attachments are read in bounded batches, and large ones are spilled to disk
+    monkeypatch.setattr(_outlook_msg_converter, "BATCH_MAX_MEMBERS", 2)
+    monkeypatch.setattr(_outlook_msg_converter, "SPOOL_MAX_SIZE", 16)
+    batches = []
+    convert_many = markitdown._convert_many
+
+    def _convert_many(file_streams, stream_infos, **kwargs):
+        if any(info.filename == "notes.txt" for info in stream_infos):
+            batches.append((len(file_streams), kwargs))
+        yield from convert_many(file_streams, stream_infos, **kwargs)
+
+    monkeypatch.setattr(markitdown, "_convert_many", _convert_many)
+    assert markitdown.convert(msg_file).markdown == expected
+    assert batches[0][0] == 2
+
+    # Attachments share the limits of the archive holding the message
+    batches.clear()
+    result = markitdown.convert_stream(
+        _make_zip({"mail/message.msg": msg_content}),
+        stream_info=StreamInfo(extension=".zip"),
+    )
+    assert "| Q3 | 130 |" in result.markdown
+    assert batches[0][1]["_zip_depth"] == 1
+    assert batches[0][1]["_zip_budget"].members == 1
+
+
+def _assert_archive_limit(markitdown: MarkItDown, zip_stream, limit: str) -> None:
+    with pytest.raises(FileConversionException) as exc_info:
+        markitdown.convert_stream(zip_stream, stream_info=StreamInfo(extension=".zip"))
+    assert exc_info.value.attempts is not None
+    errors = [a.exc_info[1] for a in exc_info.value.attempts if a.exc_info]
+    assert any(
+        isinstance(e, ArchiveLimitExceededException) and e.limit == limit
+        for e in errors
+    )
+    assert limit in str(exc_info.value)
+
+
+def test_zip_limits() -> None:
+    members = {f"file{i}.txt": f"file {i}" for i in range(5)}
+
+    # Within the limits
+    markitdown = MarkItDown(zip_max_members=6, zip_max_depth=2)
+    result = markitdown.convert_stream(
+        _make_zip({"inner.zip": _make_zip(members).getvalue()}),
+        stream_info=StreamInfo(extension=".zip"),
+    )
+    assert "## File: file4.txt" in result.markdown
+
+    # Too many members, counting nested archives
+    markitdown = MarkItDown(zip_max_members=5)
+    _assert_archive_limit(
+        markitdown,
+        _make_zip({"inner.zip": _make_zip(members).getvalue()}),
+        "max_members",
+    )
+
+    # Too deeply nested
+    nested = _make_zip(members)
+    for _ in range(3):
+        nested = _make_zip({"nested.zip": nested.getvalue()})
+    _assert_archive_limit(MarkItDown(zip_max_depth=3), nested, "max_depth")
+
+    # Too large once expanded, or too highly compressed
+    bomb = _make_zip({"zeros.txt": b"0" * (4 * 1024 * 1024)})
+    markitdown = MarkItDown(
+        zip_max_expanded_bytes=1024 * 1024, zip_max_compression_ratio=None
+    )
+    _assert_archive_limit(markitdown, bomb, "max_expanded_bytes")
+    bomb.seek(0)
+    _assert_archive_limit(MarkItDown(), bomb, "max_compression_ratio")
+
+    # Limits can be disabled
+    bomb.seek(0)
+    markitdown = MarkItDown(zip_max_compression_ratio=None)
+    result = markitdown.convert_stream(bomb, stream_info=StreamInfo(extension=".zip"))
+    assert "## File: zeros.txt" in result.markdown
+
+
 def test_input_as_strings() -> None:
     markitdown = MarkItDown()
 
@@ -325,6 +940,637 @@ def test_speech_transcription() -> None:
         )
 
 
+def test_audio_transcription_chunks(monkeypatch) -> None:
+    monkeypatch.setattr(_transcribe_audio, "CHUNK_SECONDS", 1.5)
+    monkeypatch.setattr(_transcribe_audio, "SILENCE_SEARCH_SECONDS", 0.5)
+    wav_file = os.path.join(TEST_FILES_DIR, "test.wav")
+
+    # Each chunk is at most CHUNK_SECONDS long, and together they cover the audio
+    durations = []
+
+    def _recognize(audio) -> str:
+        seconds = len(audio.frame_data) / audio.sample_width / audio.sample_rate
+        durations.append(seconds)
+        return f"({seconds:.3f}s)"
+
+    markitdown = MarkItDown()
+    result = markitdown.convert(wav_file, speech_recognizer=_recognize)
+    assert len(durations) > 1
+    assert all(d <= 1.5 for d in durations)
+    assert abs(sum(durations) - 309248 / 48000) < 0.001
+    transcript = " ".join(f"({d:.3f}s)" for d in durations)
+    assert result.markdown.endswith("### Audio Transcript:\n" + transcript)
+
+    # Concurrent and streamed transcription produce the same output
+    output = io.StringIO()
+    markitdown.convert(
+        wav_file, speech_recognizer=_recognize, max_workers=4, output_stream=output
+    )
+    assert output.getvalue() == result.markdown
+
+    # Chunks without speech are left out
+    def _no_speech(audio) -> str:
+        raise _transcribe_audio.sr.UnknownValueError()
+
+    result = markitdown.convert(wav_file, speech_recognizer=_no_speech)
+    assert result.markdown.endswith("### Audio Transcript:\n[No speech detected]")
+
+
+class _StandInSpeechBackend(SpeechBackend):
+    """Transcribes each chunk as its length in samples, recording how it was called."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.loads = 0
+        self.unloads = 0
+        self.batch_sizes = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        self.loads += 1
+
+    def unload(self) -> None:
+        self.unloads += 1
+
+    def transcribe_batch(self, chunks):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.batch_sizes.append(len(chunks))
+        time.sleep(0.01)
+        with self._lock:
+            self.running -= 1
+        return [str(len(c.frame_data) // c.sample_width) for c in chunks]
+
+
+def test_speech_backend(monkeypatch) -> None:
+    monkeypatch.setattr(_transcribe_audio, "CHUNK_SECONDS", 1.5)
+    monkeypatch.setattr(_transcribe_audio, "SILENCE_SEARCH_SECONDS", 0.5)
+    wav_file = os.path.join(TEST_FILES_DIR, "test.wav")
+
+    # One backend serves several conversions, and is only loaded once
+    backend = _StandInSpeechBackend(max_concurrency=2, batch_size=2)
+    markitdown = MarkItDown(speech_recognizer=backend)
+    results = [markitdown.convert(wav_file, max_workers=4) for _ in range(3)]
+    assert backend.loads == 1
+    assert results[0].markdown == results[2].markdown
+    assert backend.max_running <= 2
+    assert backend.batch_sizes[:2] == [2, 2]
+
+    # Every sample is transcribed exactly once
+    transcript = results[0].markdown.split("### Audio Transcript:\n")[1]
+    assert sum(int(t) for t in transcript.split()) == 309248
+
+    # The backend given for a conversion takes precedence
+    other = _StandInSpeechBackend()
+    assert markitdown.convert(wav_file, speech_recognizer=other).markdown == (
+        results[0].markdown
+    )
+    assert other.loads == 1 and backend.loads == 1
+
+    # Closing unloads the backend, which is loaded again if it is used again
+    with backend:
+        pass
+    assert backend.unloads == 1
+    markitdown.convert(wav_file)
+    assert backend.loads == 2
+
+
+class _StandInWhisperModel:
+    """Just enough of faster_whisper.WhisperModel, recording how it is called."""
+
+    instances: list = []
+
+    def __init__(self, model, **options):
+        self.model = model
+        self.options = options
+        self.calls: list = []
+        self.instances.append(self)
+
+    def transcribe(self, audio, **options):
+        self.calls.append((audio, options))
+        segments = [types.SimpleNamespace(text=f" {len(audio)} samples ")]
+        return iter(segments), types.SimpleNamespace(language="de")
+
+
+def test_faster_whisper_backend(monkeypatch) -> None:
+    import numpy as np
+
+    monkeypatch.setitem(
+        sys.modules,
+        "faster_whisper",
+        types.SimpleNamespace(WhisperModel=_StandInWhisperModel),
+    )
+    _StandInWhisperModel.instances = []
+    backend = _transcribe_audio.FasterWhisperBackend(
+        "tiny", model_options={"device": "cpu"}, language="de", beam_size=1
+    )
+
+    # The model is loaded once per session, with the options given
+    sr = _transcribe_audio.sr
+    samples = array.array("h", [0, 16384, -32768, 32767])
+    if sys.byteorder == "big":
+        samples.byteswap()
+    audio = sr.AudioData(samples.tobytes(), 16000, 2)
+    assert backend._run([audio, audio]) == ["4 samples", "4 samples"]
+    assert backend._run([audio]) == ["4 samples"]
+    assert len(_StandInWhisperModel.instances) == 1
+    model = _StandInWhisperModel.instances[0]
+    assert model.model == "tiny"
+    assert model.options == {"device": "cpu"}
+    assert [options for _, options in model.calls] == [
+        {"language": "de", "beam_size": 1}
+    ] * 3
+
+    # Audio is passed as 16 kHz mono floats in [-1, 1)
+    passed = model.calls[0][0]
+    assert passed.dtype == np.float32
+    assert passed.tolist() == [0.0, 0.5, -1.0, 32767 / 32768]
+
+    # Other sample widths and rates are converted first
+    wide = array.array("i", [0, 1 << 30, -(1 << 31), 0])
+    if sys.byteorder == "big":
+        wide.byteswap()
+    backend._run([sr.AudioData(wide.tobytes(), 16000, 4)])
+    assert model.calls[-1][0].tolist() == [0.0, 0.5, -1.0, 0.0]
+    backend._run([sr.AudioData(samples.tobytes() * 2, 8000, 2)])
+    assert abs(len(model.calls[-1][0]) - 16) <= 1  # Resampled from 8 kHz
+
+    # Closing the backend releases the model, which is loaded again if need be
+    backend.close()
+    backend._run([audio])
+    assert len(_StandInWhisperModel.instances) == 2
+
+
+class _StandInTranscriptApi:
+    """Serves a transcript for any video, failing the first fetch of each."""
+
+    calls: list = []
+
+    def list(self, video_id):
+        self.calls.append(f"list {video_id}")
+        return [types.SimpleNamespace(language_code="en")]
+
+    def fetch(self, video_id, languages):
+        self.calls.append(f"fetch {video_id} {','.join(languages)}")
+        if self.calls.count(self.calls[-1]) == 1:
+            raise ConnectionError("Temporary failure")
+        return [types.SimpleNamespace(text=f"Transcript of {video_id}")]
+
+
+def test_youtube_transcript_cache(monkeypatch) -> None:
+    monkeypatch.setattr(
+        _youtube_converter, "YouTubeTranscriptApi", _StandInTranscriptApi, raising=False
+    )
+    monkeypatch.setattr(_youtube_converter, "IS_YOUTUBE_TRANSCRIPT_CAPABLE", True)
+    monkeypatch.setattr(_youtube_converter, "RETRY_DELAY", 0)
+    calls = _StandInTranscriptApi.calls = []
+
+    page = b"<html><head><title>A Video - YouTube</title></head><body></body></html>"
+    converter = YouTubeConverter()
+
+    def _convert(video_id, **kwargs):
+        stream_info = StreamInfo(
+            extension=".html", url=f"https://www.youtube.com/watch?v={video_id}"
+        )
+        return converter.convert(io.BytesIO(page), stream_info, **kwargs).markdown
+
+    # Failed fetches are retried, and the results cached by video and language
+    markdown = _convert("abc")
+    assert "## A Video - YouTube" in markdown
+    assert "### Transcript\nTranscript of abc" in markdown
+    assert calls == ["list abc", "fetch abc en,en", "fetch abc en,en"]
+    assert _convert("abc") == markdown
+    assert len(calls) == 3
+    _convert("abc", youtube_transcript_languages=["de"])
+    assert calls[3:] == ["fetch abc de", "fetch abc de"]
+
+    # Conversions can be awaited, without blocking the event loop
+    markitdown = MarkItDown()
+
+    async def _convert_async(video_id):
+        stream_info = StreamInfo(
+            extension=".html", url=f"https://www.youtube.com/watch?v={video_id}"
+        )
+        result = await markitdown.convert_async(
+            io.BytesIO(page), stream_info=stream_info
+        )
+        return result.markdown
+
+    async def _convert_all():
+        return await asyncio.gather(*[_convert_async(v) for v in ["abc", "xyz"]])
+
+    del calls[:]
+    markdowns = asyncio.run(_convert_all())
+    assert "### Transcript\nTranscript of abc" in markdowns[0]
+    assert "### Transcript\nTranscript of xyz" in markdowns[1]
+    assert calls.count("fetch xyz en,en") == 2
+
+    # Entries expire
+    converter = YouTubeConverter(cache_ttl=0.01)
+    _convert("abc")
+    time.sleep(0.02)
+    del calls[:]
+    _convert("abc")
+    assert calls[0] == "list abc"
+
+
+def test_youtube_page(monkeypatch) -> None:
+    monkeypatch.setattr(_youtube_converter, "IS_YOUTUBE_TRANSCRIPT_CAPABLE", False)
+    monkeypatch.setattr(_youtube_converter, "CHUNK_SIZE", 16)
+
+    initial_data = {
+        "contents": [{"text": "A string with }; in it"}],
+        "engagementPanels": [
+            {"attributedDescriptionBodyText": {"content": "The description"}},
+            {"attributedDescriptionBodyText": {"content": "Another description"}},
+        ],
+    }
+    page = (
+        "<html><head><title>Page title &amp; more</title>"
+        '<meta name="title" content="A &quot;Video&quot;">'
+        '<meta itemprop="interactionCount" content="12345"/>'
+        '<meta property="og:description" content="Short description">'
+        "<script>var other = 1;</script></head><body>"
+        "<script>var ytInitialData = "
+        + json.dumps(initial_data)
+        + ";</script>"
+        + "<p>The rest of the page is not read</p>" * 100
+        + "</body></html>"
+    ).encode("utf-8")
+    stream = io.BytesIO(page)
+    result = YouTubeConverter().convert(
+        stream,
+        StreamInfo(extension=".html", url="https://www.youtube.com/watch?v=abc"),
+    )
+    assert result.title == 'A "Video"'
+    assert result.markdown == (
+        '# YouTube\n\n## A "Video"\n\n### Video Metadata\n- **Views:** 12345\n\n'
+        "\n### Description\nThe description\n"
+    )
+    assert stream.tell() < len(page) // 2
+
+
+def test_wikipedia_targeted_parse(monkeypatch) -> None:
+    page = (
+        "<title>Page - Wikipedia</title><style>p {}</style>"
+        + '<div class="nav"><a href="/a">Navigation</a></div>' * 100
+        + '<h1><span class="mw-page-title-main">Page</span></h1>'
+        + '<div id="mw-content-text"><p>Main <b>content</b></p>'
+        + "<script>var x = 1;</script><ol><li>One</li></ol></div>"
+        + '<div class="footer">Footer</div>'
+    ).encode("utf-8")
+    stream_info = StreamInfo(
+        extension=".html", url="https://en.wikipedia.org/wiki/Page"
+    )
+
+    for parser in ["html.parser", "lxml"]:
+        monkeypatch.setattr(_targeted_soup, "PARSER", parser)
+
+        soup = _targeted_soup.parse_targets(
+            io.BytesIO(page), "utf-8", [("div", "id", "mw-content-text")]
+        )
+        assert [tag.name for tag in soup.contents] == ["div"]
+        assert soup.find("b") is not None
+        assert soup.find("a") is None
+
+        result = WikipediaConverter().convert(io.BytesIO(page), stream_info)
+        assert result.title == "Page"
+        assert result.markdown.startswith("# Page\n")
+        assert "Main **content**" in result.markdown
+        assert "1. One" in result.markdown
+        assert "var x" not in result.markdown
+        assert "Navigation" not in result.markdown
+        assert "Footer" not in result.markdown
+
+        # Pages without the main content are converted in full
+        page_without_content = page.replace(b"mw-content-text", b"other")
+        result = WikipediaConverter().convert(
+            io.BytesIO(page_without_content), stream_info
+        )
+        assert result.title == "Page - Wikipedia"
+        assert "Navigation" in result.markdown and "Footer" in result.markdown
+
+
+class _StandInDocIntelHandler(http.server.BaseHTTPRequestHandler):
+    """
+    A local stand-in for the Document Intelligence analyze operation. Documents
+    are analyzed after a delay given by their content: b"slow" takes 0.5
+    seconds, b"never" never completes, the first page range of a PDF takes 0.2
+    seconds, and later ones 0.1, and anything else completes at once. The content
+    of the result names the document, and the pages analyzed. Each status
+    request is recorded in polled, by document name.
+    """
+
+    operations: dict[str, tuple[float, str]] = {}
+    analyzed: list[str] = []
+    polled: list[str] = []
+    lock = threading.Lock()
+    max_in_flight = 0
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        document = base64.b64decode(body["base64Source"])
+        pages = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query).get(
+            "pages"
+        )
+        if document.startswith(b"%PDF"):
+            name = "pdf"
+            delay = 0.0
+            if pages is not None:
+                delay = 0.2 if pages[0].startswith("1-") else 0.1
+        else:
+            name = document.decode()
+            delay = {b"slow": 0.5, b"never": float("inf")}.get(document, 0.0)
+        if pages is not None:
+            name += f" pages {pages[0]}"
+        with self.lock:
+            self.analyzed.append(name)
+            operation_id = str(len(self.operations))
+            self.operations[operation_id] = (time.monotonic() + delay, name)
+            in_flight = sum(
+                1 for ready, _ in self.operations.values() if ready > time.monotonic()
+            )
+            type(self).max_in_flight = max(self.max_in_flight, in_flight)
+        self.send_response(202)
+        self.send_header(
+            "Operation-Location",
+            f"http://{self.headers['Host']}/operations/{operation_id}",
+        )
+        self.send_header("Retry-After-Ms", "10")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        with self.lock:
+            ready, name = self.operations[self.path.rsplit("/", 1)[-1]]
+            self.polled.append(name)
+        if time.monotonic() < ready:
+            response: dict = {"status": "running"}
+        else:
+            content = f"Analyzed {name}<!-- PageBreak -->"
+            response = {
+                "status": "succeeded",
+                "analyzeResult": {"modelId": "prebuilt-layout", "content": content},
+            }
+        data = json.dumps(response).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Retry-After-Ms", "10")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.mark.skipif(
+    skip_doc_intel,
+    reason="do not run if the Document Intelligence client library is not installed",
+)
+def test_doc_intel_convert_many() -> None:
+    from azure.core.credentials import AzureKeyCredential
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StandInDocIntelHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        converter = DocumentIntelligenceConverter(
+            endpoint=f"http://127.0.0.1:{server.server_port}",
+            credential=AzureKeyCredential("key"),
+        )
+        stream_info = StreamInfo(extension=".pdf")
+
+        result = converter.convert(io.BytesIO(b"one"), stream_info)
+        assert result.markdown == "Analyzed one"
+
+        # Results are yielded as they complete, with no more than two in flight
+        documents = [b"slow", b"two", b"three", b"four", b"never", b"five"]
+        start = time.monotonic()
+        results = list(
+            converter.convert_many(
+                [io.BytesIO(document) for document in documents],
+                [stream_info] * len(documents),
+                max_in_flight=2,
+                timeout=1,
+            )
+        )
+        elapsed = time.monotonic() - start
+
+        assert sorted(index for index, _ in results) == list(range(len(documents)))
+        assert [index for index, _ in results][:3] == [1, 2, 3]
+        for index, result in results:
+            if documents[index] == b"never":
+                assert isinstance(result, FileConversionException)
+                assert "TimeoutError" in str(result)
+            else:
+                assert isinstance(result, DocumentConverterResult)
+                assert result.markdown == f"Analyzed {documents[index].decode()}"
+        assert _StandInDocIntelHandler.max_in_flight <= 2
+        assert elapsed < 3
+
+        # Analyses that time out are no longer polled (once any status request
+        # made just before the deadline has been answered)
+        time.sleep(0.05)
+        polls = _StandInDocIntelHandler.polled.count("never")
+        assert polls > 0
+        time.sleep(0.2)
+        assert _StandInDocIntelHandler.polled.count("never") == polls
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _make_pdf(page_count: int) -> bytes:
+    """A minimal PDF with the given number of blank pages."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids ["
+        + b" ".join(b"%d 0 R" % (3 + i) for i in range(page_count))
+        + b"] /Count %d >>" % page_count,
+    ] + [b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>"] * page_count
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, obj)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+    pdf += b"startxref\n%d\n%%%%EOF\n" % xref
+    return pdf
+
+
+@pytest.mark.skipif(
+    skip_doc_intel,
+    reason="do not run if the Document Intelligence client library is not installed",
+)
+def test_doc_intel_page_ranges_and_cache(tmp_path) -> None:
+    from azure.core.credentials import AzureKeyCredential
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StandInDocIntelHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        converter = DocumentIntelligenceConverter(
+            endpoint=f"http://127.0.0.1:{server.server_port}",
+            credential=AzureKeyCredential("key"),
+            pages_per_request=2,
+            cache_dir=str(tmp_path / "cache"),
+        )
+        pdf = _make_pdf(5)
+        pdf_info = StreamInfo(extension=".pdf")
+        expected = (
+            "Analyzed pdf pages 1-2\n\n"
+            "Analyzed pdf pages 3-4\n\n"
+            "Analyzed pdf pages 5-5"
+        )
+
+        # Page ranges are analyzed in parallel, and merged in order
+        _StandInDocIntelHandler.analyzed.clear()
+        result = converter.convert(io.BytesIO(pdf), pdf_info)
+        assert result.markdown == expected
+        assert sorted(_StandInDocIntelHandler.analyzed) == [
+            "pdf pages 1-2",
+            "pdf pages 3-4",
+            "pdf pages 5-5",
+        ]
+
+        # Other documents are analyzed whole
+        result = converter.convert(io.BytesIO(b"image"), StreamInfo(extension=".png"))
+        assert result.markdown == "Analyzed image"
+
+        # Unchanged documents are not analyzed again, even by another converter
+        _StandInDocIntelHandler.analyzed.clear()
+        converter = DocumentIntelligenceConverter(
+            endpoint=f"http://127.0.0.1:{server.server_port}",
+            credential=AzureKeyCredential("key"),
+            pages_per_request=2,
+            cache_dir=str(tmp_path / "cache"),
+        )
+        assert converter.convert(io.BytesIO(pdf), pdf_info).markdown == expected
+        result = converter.convert(io.BytesIO(b"image"), StreamInfo(extension=".png"))
+        assert result.markdown == "Analyzed image"
+        assert _StandInDocIntelHandler.analyzed == []
+
+        # Changed documents are analyzed
+        result = converter.convert(io.BytesIO(_make_pdf(3)), pdf_info)
+        assert result.markdown == "Analyzed pdf pages 1-2\n\nAnalyzed pdf pages 3-3"
+        assert len(_StandInDocIntelHandler.analyzed) == 2
+
+        # Documents, and their page ranges, share the limit on requests in flight
+        converter = DocumentIntelligenceConverter(
+            endpoint=f"http://127.0.0.1:{server.server_port}",
+            credential=AzureKeyCredential("key"),
+            pages_per_request=2,
+        )
+        _StandInDocIntelHandler.operations.clear()  # Including any never completed
+        _StandInDocIntelHandler.max_in_flight = 0
+        results = list(
+            converter.convert_many(
+                [io.BytesIO(pdf) for _ in range(3)], [pdf_info] * 3, max_in_flight=2
+            )
+        )
+        assert [result.markdown for _, result in results] == [expected] * 3
+        assert _StandInDocIntelHandler.max_in_flight <= 2
+
+        # Nothing is submitted once the deadline has passed
+        _StandInDocIntelHandler.analyzed.clear()
+        results = list(converter.convert_many([io.BytesIO(pdf)], [pdf_info], timeout=0))
+        assert isinstance(results[0][1], FileConversionException)
+        assert _StandInDocIntelHandler.analyzed == []
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class _StandInLlmClient:
+    """Just enough of an OpenAI client to caption images."""
+
+    def __init__(self) -> None:
+        self.chat = types.SimpleNamespace(
+            completions=types.SimpleNamespace(create=self._create)
+        )
+
+    def _create(self, **kwargs):
+        time.sleep(0.01)
+        message = types.SimpleNamespace(content="A stand-in caption.")
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+def test_conversion_metrics() -> None:
+    markitdown = MarkItDown()
+    path = os.path.join(TEST_FILES_DIR, "test.docx")
+
+    # Metrics are only collected when requested
+    assert markitdown.convert(path).metrics is None
+
+    seen = []
+    result = markitdown.convert(path, collect_metrics=True, on_stage=seen.append)
+    metrics = result.metrics
+    assert metrics is not None
+    assert metrics.converter == "DocxConverter"
+    assert metrics.bytes_in == os.path.getsize(path)
+    assert metrics.bytes_out == len(result.markdown.encode("utf-8"))
+    assert seen == metrics.stages
+
+    stages = [timing.stage for timing in metrics.stages]
+    assert stages[0] == "identify"
+    assert stages[-2:] == ["convert", "normalize"]
+    assert set(stages) == {"identify", "accepts", "convert", "normalize"}
+    assert "DocxConverter" in [
+        timing.converter for timing in metrics.stages if timing.stage == "accepts"
+    ]
+    assert metrics.seconds("convert") > 0
+
+    # Streamed output is measured as written
+    output = io.StringIO()
+    with open(os.path.join(TEST_FILES_DIR, "test.pptx"), "rb") as fh:
+        result = markitdown.convert_stream(
+            fh, collect_metrics=True, output_stream=output
+        )
+    assert result.metrics is not None
+    assert result.metrics.bytes_out == len(output.getvalue().encode("utf-8"))
+
+    # Streams are buffered (if need be) before identification, and LLM calls are timed
+    with open(os.path.join(TEST_FILES_DIR, "test_llm.jpg"), "rb") as fh:
+        data = fh.read()
+    markitdown = MarkItDown(llm_client=_StandInLlmClient(), llm_model="stand-in")
+    result = markitdown.convert_stream(io.BytesIO(data), collect_metrics=True)
+    assert "A stand-in caption." in result.markdown
+    assert result.metrics is not None
+    assert result.metrics.bytes_in == len(data)
+    stages = [timing.stage for timing in result.metrics.stages]
+    assert stages[:2] == ["buffer", "identify"]
+    assert stages.count("llm") == 1
+    assert result.metrics.seconds("llm") >= 0.01
+
+    # The stages of nested conversions are reported, but not included
+    markitdown = MarkItDown()
+    msg_file = os.path.join(TEST_FILES_DIR, "test_outlook_msg_attachments.msg")
+    with open(msg_file, "rb") as fh:
+        msg_content = fh.read()
+    for source, extension in [
+        (_make_zip({"notes.txt": b"Some notes", "data.csv": b"a,b\n1,2\n"}), ".zip"),
+        (io.BytesIO(msg_content), ".msg"),
+    ]:
+        seen = []
+        result = markitdown.convert_stream(
+            source,
+            stream_info=StreamInfo(extension=extension),
+            collect_metrics=True,
+            on_stage=seen.append,
+        )
+        assert result.metrics is not None
+        assert "CsvConverter" in [t.converter for t in seen if t.stage == "convert"]
+        assert "CsvConverter" not in [
+            t.converter for t in result.metrics.stages if t.stage == "convert"
+        ]
+
+
 def test_exceptions() -> None:
     # Check that an exception is raised when trying to convert an unsupported format
     markitdown = MarkItDown()
@@ -370,6 +1616,65 @@ def test_markitdown_exiftool() -> None:
         assert target in result.text_content
 
 
+# Stands in for exiftool in -stay_open mode, reporting its pid and each file's size
+FAKE_EXIFTOOL = """
+import json, os, sys
+args = []
+for line in sys.stdin:
+    arg = line.rstrip("\\n")
+    if arg.startswith("-execute"):
+        path = args[-1]
+        data = {"SourceFile": path, "Pid": os.getpid(), "FileSize": os.path.getsize(path)}
+        print(json.dumps([data]))
+        print("{ready" + arg[len("-execute"):] + "}", flush=True)
+        args = []
+    elif args[-1:] == ["-stay_open"] and arg == "False":
+        break
+    else:
+        args.append(arg)
+"""
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="the fake exiftool is a script with a shebang line",
+)
+def test_exiftool_stay_open(tmp_path, monkeypatch) -> None:
+    exiftool_path = str(tmp_path / "exiftool")
+    with open(exiftool_path, "w") as fh:
+        fh.write(f"#!{sys.executable}\n" + FAKE_EXIFTOOL)
+    os.chmod(exiftool_path, 0o755)
+    monkeypatch.setattr(_exiftool, "POOL_SIZE", 2)
+
+    # Files are read in place, and streams via a temporary copy, by one process
+    jpg_file = os.path.join(TEST_FILES_DIR, "test.jpg")
+    with open(jpg_file, "rb") as fh:
+        in_place = _exiftool.exiftool_metadata(fh, exiftool_path=exiftool_path)
+        assert fh.tell() == 0
+        fh.seek(10)
+        copied = _exiftool.exiftool_metadata(fh, exiftool_path=exiftool_path)
+        assert fh.tell() == 10
+    assert in_place["SourceFile"] == os.path.abspath(jpg_file)
+    assert copied["SourceFile"] != in_place["SourceFile"]
+    assert not os.path.exists(copied["SourceFile"])
+    assert copied["FileSize"] == in_place["FileSize"] - 10
+    assert copied["Pid"] == in_place["Pid"]
+
+    # Concurrent requests are spread over at most POOL_SIZE processes
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pids = set(
+            executor.map(
+                lambda _: _exiftool.exiftool_metadata(
+                    io.BytesIO(b"data"), exiftool_path=exiftool_path
+                )["Pid"],
+                range(32),
+            )
+        )
+    assert 1 <= len(pids) <= 2
+
+    _exiftool._close_pools()
+
+
 @pytest.mark.skipif(
     skip_llm,
     reason="do not run llm tests without a key",
@@ -402,10 +1707,26 @@ if __name__ == "__main__":
         test_stream_info_operations,
         test_data_uris,
         test_file_uris,
+        test_output_stream,
+        test_ipynb_sniff,
+        test_ipynb_outputs,
+        test_markdown_table,
+        test_xlsx_cell_formatting,
+        test_pptx_max_workers,
+        test_epub_chapters,
+        test_markdownify_plain_text,
+        test_rss_feeds,
         test_docx_comments,
+        test_docx_pre_process,
+        test_convert_many,
+        test_zip_trusts_member_extensions,
+        test_zip_max_workers,
+        test_zip_limits,
         test_input_as_strings,
         test_markitdown_remote,
         test_speech_transcription,
+        test_doc_intel_convert_many,
+        test_conversion_metrics,
         test_exceptions,
         test_markitdown_exiftool,
         test_markitdown_llm,